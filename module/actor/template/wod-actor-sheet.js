@@ -1,6 +1,7 @@
 import { WodRollDialog } from "../../apps/wod-roll-dialog.js";
 import { WodEffectEditor } from "../../apps/wod-effect-manager.js";
 import { i18n } from "../../helpers/i18n.js";
+import { loadLazyModule } from "../../helpers/lazy-modules.js";
 
 /**
  * Base Actor Sheet for World of Darkness System
@@ -5990,14 +5991,18 @@ export class WodActorSheet extends ActorSheet {
     async _onStartCharacterWizard(event) {
         event.preventDefault();
         
-        // Check if wizard is available
-        if (!game.wodsystem?.WodCharacterWizard) {
+        // Load the wizard on first use (module/helpers/lazy-modules.js)
+        let WodCharacterWizard;
+        try {
+            ({ WodCharacterWizard } = await loadLazyModule('characterWizard'));
+        } catch (error) {
+            console.error("WoD | Failed to load Character Creation Wizard:", error);
             ui.notifications.error("Character Creation Wizard not available");
             return;
         }
         
         // Create and render wizard
-        const wizard = new game.wodsystem.WodCharacterWizard(this.actor);
+        const wizard = new WodCharacterWizard(this.actor);
         wizard.render(true);
     }
     
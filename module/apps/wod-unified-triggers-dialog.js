@@ -1,4 +1,4 @@
-import { WodTriggerConfigDialog } from './wod-trigger-config-dialog.js';
+import { loadLazyModule } from '../helpers/lazy-modules.js';
 
 /**
  * Unified WoD Triggers Dialog
@@ -303,7 +303,7 @@ export class WodUnifiedTriggersDialog extends Dialog {
      * Open trigger config dialog using the exact same pattern as the working scene dialog
      */
     _openTriggerConfigDialog(triggerId = null) {
-        import('./wod-trigger-config-dialog.js').then(module => {
+        loadLazyModule('triggerConfigDialog').then(module => {
             const DialogClass = module.WodTriggerConfigDialog || module.default;
             if (DialogClass) {
                 const triggerDialog = new DialogClass(this.document, triggerId, {
@@ -0,0 +1,131 @@
+/**
+ * On-demand subsystems
+ *
+ * The character creation wizards and the trigger, visual rules and status
+ * effect library dialogs are only needed when someone opens them, so they are
+ * imported on first use instead of at init. Each loader is a literal import()
+ * (scripts/build_module_bundle.py turns those into separate chunks); the
+ * promise is kept, so later calls and concurrent clicks share one load.
+ *
+ * The "Preload Dialogs When Idle" client setting fetches them one at a time
+ * once the client is ready and the browser is idle, so the first click does
+ * not wait on the network. Startup marks and load times are collected for
+ * startupReport(); compare it with the setting on and off, or against a
+ * build without lazy loading, to measure time-to-ready.
+ */
+
+const LAZY_MODULES = {
+    characterWizard: () => import('../character-creation/wod-character-wizard.js'),
+    triggerConfigDialog: () => import('../apps/wod-trigger-config-dialog.js'),
+    visualRulesDialog: () => import('../apps/wod-visual-rules-dialog.js'),
+    statusEffectLibrary: () => import('../apps/wod-status-effect-library.js')
+};
+
+// Fallback when requestIdleCallback is unavailable (Safari)
+const IDLE_FALLBACK_DELAY = 2000;
+
+const _loads = new Map();
+const _loaded = {};
+const _marks = [];
+const _moduleTimings = {};
+
+/**
+ * Names accepted by loadLazyModule()
+ */
+export const LAZY_MODULE_NAMES = Object.freeze(Object.keys(LAZY_MODULES));
+
+/**
+ * Import an on-demand subsystem, once
+ * @param {string} name - One of LAZY_MODULE_NAMES
+ * @param {string} reason - 'demand' or 'preload', recorded in the startup report
+ * @returns {Promise<object>} The module's exports
+ */
+export function loadLazyModule(name, reason = 'demand') {
+    if (_loads.has(name)) return _loads.get(name);
+
+    const loader = LAZY_MODULES[name];
+    if (!loader) {
+        return Promise.reject(new Error(`WoD | Unknown lazy module: ${name}`));
+    }
+
+    const started = performance.now();
+    const load = loader().then(module => {
+        _moduleTimings[name] = { reason, at: started, ms: performance.now() - started };
+        _loaded[name] = module;
+        return module;
+    }, error => {
+        // Forget the failure so the next click retries
+        _loads.delete(name);
+        throw error;
+    });
+    _loads.set(name, load);
+    return load;
+}
+
+/**
+ * The exports of a subsystem that has finished loading, without loading it
+ * @param {string} name - One of LAZY_MODULE_NAMES
+ * @returns {object|undefined} The module's exports, or undefined if not loaded yet
+ */
+export function loadedLazyModule(name) {
+    return _loaded[name];
+}
+
+/**
+ * Open the character creation wizard for an actor, loading it first if needed
+ * @param {Actor} actor - The actor to build
+ * @returns {Promise<FormApplication>} The rendered wizard
+ */
+export async function openCharacterWizard(actor) {
+    const { WodCharacterWizard } = await loadLazyModule('characterWizard');
+    const wizard = new WodCharacterWizard(actor);
+    wizard.render(true);
+    return wizard;
+}
+
+/**
+ * Load every subsystem not loaded yet, one per idle period
+ */
+export function preloadLazyModulesWhenIdle() {
+    const whenIdle = globalThis.requestIdleCallback
+        ? callback => globalThis.requestIdleCallback(callback)
+        : callback => setTimeout(callback, IDLE_FALLBACK_DELAY);
+    const queue = LAZY_MODULE_NAMES.filter(name => !_loads.has(name));
+
+    const next = () => {
+        const name = queue.shift();
+        if (!name) return;
+        loadLazyModule(name, 'preload')
+            .catch(error => console.warn(`WoD | Could not preload ${name}:`, error))
+            .finally(() => whenIdle(next));
+    };
+    whenIdle(next);
+}
+
+/**
+ * Record a startup milestone (ms since page navigation)
+ * @param {string} label - Milestone name
+ */
+export function markStartup(label) {
+    _marks.push({ label, at: performance.now() });
+}
+
+/**
+ * Startup milestones and on-demand load times so far
+ * @returns {{marks: Array<{label: string, at: number, delta: number}>, modules: object}}
+ */
+export function startupReport() {
+    const marks = _marks.map((mark, index) => ({
+        label: mark.label,
+        at: Math.round(mark.at),
+        delta: Math.round(mark.at - (_marks[index - 1]?.at ?? mark.at))
+    }));
+    const modules = {};
+    for (const name of LAZY_MODULE_NAMES) {
+        const timing = _moduleTimings[name];
+        modules[name] = timing
+            ? { reason: timing.reason, at: Math.round(timing.at), ms: Math.round(timing.ms) }
+            : { reason: 'not loaded' };
+    }
+    return { marks, modules };
+}
@@ -0,0 +1,134 @@
+/**
+ * Template bundle loader
+ *
+ * scripts/build_template_bundle.py packs every template under templates/ into
+ * templates/templates.bundle.json ({version, digest, templates: {path: source}}).
+ * Loading it is one request instead of one per partial. Each template is
+ * registered as a Handlebars partial under its system path, so {{> "..."}},
+ * getTemplate() and renderTemplate() all find it without fetching; Handlebars
+ * parses a compiled template on its first call, so nothing is compiled here.
+ *
+ * The bundle is stamped with the system version it was built for
+ * (scripts/build_release.py rebuilds it for every release). A bundle whose
+ * stamp differs from the running system is ignored, with a warning, in favour
+ * of the individual files; that is one comparison, not a request per file.
+ */
+
+const TEMPLATE_BUNDLE_PATH = 'systems/wodsystem/templates/templates.bundle.json';
+const TEMPLATE_BUNDLE_VERSION = 2;
+
+/**
+ * Partials preloaded one by one when there is no bundle (development checkouts)
+ */
+export const PRELOAD_TEMPLATES = [
+    "systems/wodsystem/templates/actor/partials/header.html",
+    "systems/wodsystem/templates/actor/partials/technocrat-header.html",
+    "systems/wodsystem/templates/actor/partials/mage-header.html",
+    "systems/wodsystem/templates/actor/partials/spirit-header.html",
+    "systems/wodsystem/templates/actor/partials/demon-header.html",
+    "systems/wodsystem/templates/actor/partials/earthbound-header.html",
+    "systems/wodsystem/templates/actor/partials/demon-advantages.html",
+    "systems/wodsystem/templates/actor/partials/earthbound-advantages.html",
+    "systems/wodsystem/templates/actor/partials/demon-lore.html",
+    "systems/wodsystem/templates/actor/partials/demon-apocalyptic-form.html",
+    "systems/wodsystem/templates/actor/partials/earthbound-apocalyptic-form.html",
+    "systems/wodsystem/templates/actor/partials/technocrat-advantages.html",
+    "systems/wodsystem/templates/actor/partials/mage-advantages.html",
+    "systems/wodsystem/templates/actor/partials/technocrat-spheres.html",
+    "systems/wodsystem/templates/actor/partials/mage-spheres.html",
+    "systems/wodsystem/templates/actor/partials/spirit-spheres.html",
+    "systems/wodsystem/templates/actor/partials/technocrat-backgrounds-expanded.html",
+    "systems/wodsystem/templates/actor/partials/mage-backgrounds-expanded.html",
+    "systems/wodsystem/templates/actor/partials/demon-backgrounds-expanded.html",
+    "systems/wodsystem/templates/actor/partials/earthbound-backgrounds-expanded.html",
+    "systems/wodsystem/templates/actor/partials/spirit-attributes.html",
+    "systems/wodsystem/templates/actor/partials/spirit-essence.html",
+    "systems/wodsystem/templates/actor/partials/spirit-charms.html",
+    "systems/wodsystem/templates/actor/partials/spirit-advantages.html",
+    "systems/wodsystem/templates/actor/partials/backgrounds/bg-sanctum.html",
+    "systems/wodsystem/templates/actor/partials/backgrounds/bg-construct.html",
+    "systems/wodsystem/templates/actor/partials/backgrounds/bg-mentor.html",
+    "systems/wodsystem/templates/actor/partials/backgrounds/bg-allies.html",
+    "systems/wodsystem/templates/actor/partials/backgrounds/bg-contacts.html",
+    "systems/wodsystem/templates/actor/partials/backgrounds/bg-resources.html",
+    "systems/wodsystem/templates/actor/partials/backgrounds/bg-familiar.html",
+    "systems/wodsystem/templates/actor/partials/backgrounds/bg-device.html",
+    "systems/wodsystem/templates/actor/partials/backgrounds/bg-enhancement.html",
+    "systems/wodsystem/templates/actor/partials/backgrounds/bg-custom.html",
+    "systems/wodsystem/templates/actor/partials/attributes.html",
+    "systems/wodsystem/templates/actor/partials/abilities.html",
+    "systems/wodsystem/templates/actor/partials/health.html",
+    "systems/wodsystem/templates/actor/partials/biography.html",
+    "systems/wodsystem/templates/actor/partials/secondary-abilities.html",
+    "systems/wodsystem/templates/actor/partials/virtues-humanity.html",
+    "systems/wodsystem/templates/actor/partials/merits-flaws.html",
+    "systems/wodsystem/templates/actor/partials/advantages-common.html",
+    "systems/wodsystem/templates/actor/partials/mortal-numina.html",
+    "systems/wodsystem/templates/actor/partials/experience.html",
+    "systems/wodsystem/templates/actor/partials/equipment.html",
+    "systems/wodsystem/templates/actor/partials/earthbound-equipment.html",
+    "systems/wodsystem/templates/actor/partials/active-effects.html",
+    "systems/wodsystem/templates/apps/roll-dialog.html",
+    "systems/wodsystem/templates/apps/effect-manager.html",
+    "systems/wodsystem/templates/apps/st-approval-dialog.html",
+    "systems/wodsystem/templates/apps/equipment-effects-dialog.html",
+    "systems/wodsystem/templates/apps/wod-triggers-tab.html",
+    "systems/wodsystem/templates/apps/wod-trigger-config-dialog.html",
+    "systems/wodsystem/templates/apps/minimap-config-dialog.html",
+    "systems/wodsystem/templates/apps/minimap-marker-dialog.html",
+    "systems/wodsystem/templates/apps/status-effect-library.html",
+    "systems/wodsystem/templates/apps/effect-assignment.html",
+    "systems/wodsystem/templates/apps/wod-visual-rules-dialog.html",
+    "systems/wodsystem/templates/dice/roll-card.html",
+    "systems/wodsystem/templates/chat/reference-card.html",
+    "systems/wodsystem/templates/chat/background-reference-card.html",
+    // Character Creation Wizard
+    "systems/wodsystem/templates/apps/wizard-steps/step-concept.html",
+    "systems/wodsystem/templates/apps/wizard-steps/step-attributes.html",
+    "systems/wodsystem/templates/apps/wizard-steps/step-abilities.html",
+    "systems/wodsystem/templates/apps/wizard-steps/step-advantages.html",
+    "systems/wodsystem/templates/apps/wizard-steps/step-merits-flaws.html",
+    "systems/wodsystem/templates/apps/wizard-steps/step-freebies.html",
+    "systems/wodsystem/templates/apps/wizard-steps/step-review.html"
+];
+
+/**
+ * Register all templates from the bundle, or preload PRELOAD_TEMPLATES without it
+ * @returns {Promise<number>} Number of templates registered from the bundle (0 on fallback)
+ */
+export async function loadTemplateBundle() {
+    try {
+        const version = encodeURIComponent(game.system?.version ?? '');
+        const response = await fetch(`${TEMPLATE_BUNDLE_PATH}?v=${version}`);
+        if (response.ok) {
+            const bundle = await response.json();
+            if (bundle?.version === TEMPLATE_BUNDLE_VERSION && bundle.templates) {
+                if (bundle.systemVersion === game.system?.version) {
+                    return registerTemplateBundle(bundle.templates);
+                }
+                console.warn(`WoD | templates.bundle.json was built for version ${bundle.systemVersion}, not ${game.system?.version}; loading templates individually (rebuild it with scripts/build_release.py)`);
+            }
+        }
+    } catch (error) {
+        console.warn('WoD | Template bundle unavailable, loading templates individually:', error);
+    }
+    
+    await loadTemplates(PRELOAD_TEMPLATES);
+    return 0;
+}
+
+/**
+ * Register bundled template sources as partials
+ * @param {Object<string, string>} templates - Template source by system path
+ * @returns {number} Number of templates registered
+ */
+export function registerTemplateBundle(templates) {
+    let registered = 0;
+    for (const [path, source] of Object.entries(templates)) {
+        // Templates Foundry already compiled (e.g. by another module) are left alone
+        if (path in Handlebars.partials) continue;
+        Handlebars.registerPartial(path, Handlebars.compile(source));
+        registered++;
+    }
+    return registered;
+}
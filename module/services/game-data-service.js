@@ -1,6 +1,11 @@
 import { Trie } from './trie.js';
 import { ARCHETYPES, getArchetypesForActorType } from '../character-creation/wizard-config.js';
 
+const DATASOURCE_ROOT = 'systems/wodsystem/datasource';
+// Bundles written by scripts/build_datasource_bundle.py (one per game line)
+const DATASOURCE_BUNDLE_LINES = ['M20', 'D20'];
+const DATASOURCE_BUNDLE_VERSION = 3;
+
 /**
  * GameDataService - Central service for managing game data by source and creature type
  * 
@@ -45,6 +50,7 @@ export class GameDataService {
         
         this.trieIndices = {};
         this.initialized = false;
+        this._bundles = null;
     }
 
     /**
@@ -52,6 +58,9 @@ export class GameDataService {
      */
     async initialize() {
         try {
+            // One request per game line; the loaders below then read from memory
+            await this.loadDatasourceBundles();
+            
             // Load M20 data
             await this.loadM20MeritsFlaws();
             await this.loadM20Backgrounds();
@@ -98,8 +107,12 @@ export class GameDataService {
                     sAdvantages: new Trie()
                 };
             }
+            
+            // Parsed data and tries now live on the service; drop the bundle text
+            this._bundles = null;
             this.initialized = true;
         } catch (error) {
+            this._bundles = null;
             if (!this.trieIndices || Object.keys(this.trieIndices).length === 0) {
                 this.trieIndices = {
                     m20MeritsFlaws: new Trie(),
@@ -112,17 +125,81 @@ export class GameDataService {
         }
     }
 
+    /**
+     * Fetch the compiled datasource bundle of every game line in parallel.
+     * A bundle is a header line ({version, digest, files: {name: [start, end]}, ids, tries, missing}),
+     * the minified body and a line of prebuilt search tries; files and tries are parsed
+     * from slices on first read.
+     * Lines without a usable bundle are left out and their files are fetched one by one;
+     * files the bundle lists as missing are not requested at all. A bundle stamped with
+     * another system version than the running one (left over from an older release) is
+     * not usable; checking the stamp costs no request.
+     */
+    async loadDatasourceBundles() {
+        const version = encodeURIComponent(game.system?.version ?? '');
+        const bundles = await Promise.all(DATASOURCE_BUNDLE_LINES.map(async line => {
+            try {
+                const response = await fetch(`${DATASOURCE_ROOT}/${line}.bundle?v=${version}`);
+                if (!response.ok) return null;
+                
+                const text = await response.text();
+                const split = text.indexOf('\n');
+                const header = JSON.parse(text.slice(0, split));
+                if (header.version !== DATASOURCE_BUNDLE_VERSION || header.line !== line) return null;
+                if (header.systemVersion !== game.system?.version) {
+                    console.warn(`WoD | ${line}.bundle was built for version ${header.systemVersion}, not ${game.system?.version}; loading its files individually (rebuild it with scripts/build_release.py)`);
+                    return null;
+                }
+                const triesSplit = text.indexOf('\n', split + 1);
+                return {
+                    header,
+                    body: text.slice(split + 1, triesSplit),
+                    tries: text.slice(triesSplit + 1),
+                    parsed: {}
+                };
+            } catch (error) {
+                return null;
+            }
+        }));
+        
+        this._bundles = {};
+        DATASOURCE_BUNDLE_LINES.forEach((line, index) => {
+            if (bundles[index]) this._bundles[line] = bundles[index];
+        });
+    }
+
+    /**
+     * Read one datasource file, from its line's bundle when it has one
+     * @param {string} path - Path under datasource/, e.g. "D20/lore.json"
+     * @returns {Promise<object>} Parsed JSON
+     */
+    async _readDatasource(path) {
+        const [line, name] = path.split('/');
+        const bundle = this._bundles?.[line];
+        const span = bundle?.header.files[name];
+        if (span) {
+            if (!(name in bundle.parsed)) {
+                bundle.parsed[name] = JSON.parse(bundle.body.slice(span[0], span[1]));
+            }
+            return bundle.parsed[name];
+        }
+        if (bundle?.header.missing?.includes(name)) {
+            throw new Error(`Failed to load ${path}: not present when the ${line} bundle was built`);
+        }
+        
+        const response = await fetch(`${DATASOURCE_ROOT}/${path}`);
+        if (!response.ok) {
+            throw new Error(`Failed to load ${path}: ${response.statusText}`);
+        }
+        return response.json();
+    }
+
     /**
      * Load M20 merits and flaws from JSON
      */
     async loadM20MeritsFlaws() {
         try {
-            const response = await fetch('systems/wodsystem/datasource/M20/merits_flaws.json');
-            if (!response.ok) {
-                throw new Error(`Failed to load M20 merits_flaws.json: ${response.statusText}`);
-            }
-            
-            const data = await response.json();
+            const data = await this._readDatasource('M20/merits_flaws.json');
             this.data.m20.merits = data.merits || [];
             this.data.m20.flaws = data.flaws || [];
             
@@ -137,11 +214,7 @@ export class GameDataService {
      */
     async loadD20MeritsFlaws() {
         try {
-            const response = await fetch('systems/wodsystem/datasource/D20/merits_flaws.json');
-            if (!response.ok) {
-                throw new Error(`Failed to load D20 merits_flaws.json: ${response.statusText}`);
-            }
-            const data = await response.json();
+            const data = await this._readDatasource('D20/merits_flaws.json');
             
             if (data.merits && Array.isArray(data.merits)) {
                 this.data.d20.merits = data.merits;
@@ -167,12 +240,7 @@ export class GameDataService {
      */
     async loadM20Backgrounds() {
         try {
-            const response = await fetch('systems/wodsystem/datasource/M20/backgrounds.json');
-            if (!response.ok) {
-                throw new Error(`Failed to load M20 backgrounds.json: ${response.statusText}`);
-            }
-            
-            const data = await response.json();
+            const data = await this._readDatasource('M20/backgrounds.json');
             this.data.m20.backgrounds = Array.isArray(data?.backgrounds) ? data.backgrounds : [];
             
         } catch (error) {
@@ -185,12 +253,7 @@ export class GameDataService {
      */
     async loadD20Backgrounds() {
         try {
-            const response = await fetch('systems/wodsystem/datasource/D20/backgrounds.json');
-            if (!response.ok) {
-                throw new Error(`Failed to load D20 backgrounds.json: ${response.statusText}`);
-            }
-            
-            const data = await response.json();
+            const data = await this._readDatasource('D20/backgrounds.json');
             this.data.d20.backgrounds = Array.isArray(data?.backgrounds) ? data.backgrounds : [];
             
         } catch (error) {
@@ -204,12 +267,7 @@ export class GameDataService {
      */
     async loadD20ApocalypticForms() {
         try {
-            const response = await fetch('systems/wodsystem/datasource/D20/apocalyptic_forms.json');
-            if (!response.ok) {
-                throw new Error(`Failed to load D20 apocalyptic_forms.json: ${response.statusText}`);
-            }
-            
-            const data = await response.json();
+            const data = await this._readDatasource('D20/apocalyptic_forms.json');
             this.data.d20.apocalypticForms = Array.isArray(data && data.apocalypticForms) ? data.apocalypticForms : [];
             
         } catch (error) {
@@ -223,12 +281,7 @@ export class GameDataService {
      */
     async loadM20Spheres() {
         try {
-            const response = await fetch('systems/wodsystem/datasource/M20/spheres.json');
-            if (!response.ok) {
-                throw new Error(`Failed to load M20 spheres.json: ${response.statusText}`);
-            }
-            
-            const data = await response.json();
+            const data = await this._readDatasource('M20/spheres.json');
             this.data.m20.spheres = Array.isArray(data?.spheres) ? data.spheres : [];
             
         } catch (error) {
@@ -241,12 +294,7 @@ export class GameDataService {
      */
     async loadM20Charms() {
         try {
-            const response = await fetch('systems/wodsystem/datasource/M20/charms.json');
-            if (!response.ok) {
-                throw new Error(`Failed to load M20 charms.json: ${response.statusText}`);
-            }
-            
-            const data = await response.json();
+            const data = await this._readDatasource('M20/charms.json');
             this.data.m20.charms = Array.isArray(data?.charms) ? data.charms : [];
             
         } catch (error) {
@@ -259,12 +307,7 @@ export class GameDataService {
      */
     async loadM20SAdvantages() {
         try {
-            const response = await fetch('systems/wodsystem/datasource/M20/s-advantages.json');
-            if (!response.ok) {
-                throw new Error(`Failed to load M20 s-advantages.json: ${response.statusText}`);
-            }
-            
-            const data = await response.json();
+            const data = await this._readDatasource('M20/s-advantages.json');
             this.data.m20.sAdvantages = Array.isArray(data?.advantages) ? data.advantages : [];
             
         } catch (error) {
@@ -277,12 +320,7 @@ export class GameDataService {
      */
     async loadM20Affinities() {
         try {
-            const response = await fetch('systems/wodsystem/datasource/M20/affinities.json');
-            if (!response.ok) {
-                throw new Error(`Failed to load M20 affinities.json: ${response.statusText}`);
-            }
-            
-            this.data.m20.affinities = await response.json();
+            this.data.m20.affinities = await this._readDatasource('M20/affinities.json');
             
         } catch (error) {
             this.data.m20.affinities = null;
@@ -422,12 +460,7 @@ export class GameDataService {
      */
     async loadD20LorePaths() {
         try {
-            const response = await fetch('systems/wodsystem/datasource/D20/lore.json');
-            if (!response.ok) {
-                throw new Error(`Failed to load lore paths: ${response.status}`);
-            }
-            
-            const data = await response.json();
+            const data = await this._readDatasource('D20/lore.json');
             const lorePaths = Array.isArray(data && data.lorePaths) ? data.lorePaths : [];
             const blackKnowledge = Array.isArray(data && data.blackKnowledge) ? data.blackKnowledge : [];
             
@@ -463,150 +496,75 @@ export class GameDataService {
     }
 
     /**
-     * Build trie indices for fast searching
+     * Build trie indices for fast searching.
+     * Tries prebuilt into the datasource bundles are adopted without re-inserting;
+     * any index without one, or whose item arrays are not the ones parsed from that
+     * bundle (e.g. a file fetched on its own), is built here.
      */
     buildTrieIndices() {
-        // Build separate tries for M20 and D20 merits/flaws
-        this.trieIndices.m20MeritsFlaws = new Trie();
-        this.trieIndices.d20MeritsFlaws = new Trie();
+        const { m20, d20 } = this.data;
+        const indices = [
+            ['M20', 'm20MeritsFlaws', [m20.merits, m20.flaws]],
+            ['D20', 'd20MeritsFlaws', [d20.merits, d20.flaws]],
+            ['M20', 'charms', [m20.charms]],
+            ['M20', 'sAdvantages', [m20.sAdvantages]]
+        ];
         
-        let m20Indexed = 0;
-        let d20Indexed = 0;
-        
-        // Index M20 merits
-        for (const merit of this.data.m20.merits) {
-            // Index by name
-            this.trieIndices.m20MeritsFlaws.insert(merit.name, merit);
-            m20Indexed++;
-            
-            // Index by search terms
-            if (merit.searchTerms && Array.isArray(merit.searchTerms)) {
-                merit.searchTerms.forEach(term => {
-                    this.trieIndices.m20MeritsFlaws.insert(term, merit);
-                });
-            }
-            
-            // Index by keywords
-            if (merit.keywords && Array.isArray(merit.keywords)) {
-                merit.keywords.forEach(keyword => {
-                    this.trieIndices.m20MeritsFlaws.insert(keyword, merit);
-                });
-            }
+        for (const [line, name, sources] of indices) {
+            this.trieIndices[name] = this._bundledTrie(line, name, sources) || this._buildTrie(sources);
         }
-        
-        // Index M20 flaws
-        for (const flaw of this.data.m20.flaws) {
-            if (!flaw || !flaw.name) {
-                continue;
-            }
-            // Index by name
-            this.trieIndices.m20MeritsFlaws.insert(flaw.name, flaw);
-            m20Indexed++;
-            
-            // Index by search terms
-            if (flaw.searchTerms && Array.isArray(flaw.searchTerms)) {
-                flaw.searchTerms.forEach(term => {
-                    this.trieIndices.m20MeritsFlaws.insert(term, flaw);
-                });
-            }
-            
-            // Index by keywords
-            if (flaw.keywords && Array.isArray(flaw.keywords)) {
-                flaw.keywords.forEach(keyword => {
-                    this.trieIndices.m20MeritsFlaws.insert(keyword, flaw);
-                });
-            }
-        }
-        
-        // Index D20 merits
-        for (const merit of this.data.d20.merits) {
-            if (!merit || !merit.name) {
-                continue;
-            }
-            // Index by name
-            this.trieIndices.d20MeritsFlaws.insert(merit.name, merit);
-            d20Indexed++;
-            
-            // Index by search terms
-            if (merit.searchTerms && Array.isArray(merit.searchTerms)) {
-                merit.searchTerms.forEach(term => {
-                    this.trieIndices.d20MeritsFlaws.insert(term, merit);
-                });
-            }
-            
-            // Index by keywords
-            if (merit.keywords && Array.isArray(merit.keywords)) {
-                merit.keywords.forEach(keyword => {
-                    this.trieIndices.d20MeritsFlaws.insert(keyword, merit);
-                });
-            }
-        }
-        
-        // Index D20 flaws
-        for (const flaw of this.data.d20.flaws) {
-            if (!flaw || !flaw.name) {
-                continue;
-            }
-            // Index by name
-            this.trieIndices.d20MeritsFlaws.insert(flaw.name, flaw);
-            d20Indexed++;
-            
-            // Index by search terms
-            if (flaw.searchTerms && Array.isArray(flaw.searchTerms)) {
-                flaw.searchTerms.forEach(term => {
-                    this.trieIndices.d20MeritsFlaws.insert(term, flaw);
-                });
-            }
-            
-            // Index by keywords
-            if (flaw.keywords && Array.isArray(flaw.keywords)) {
-                flaw.keywords.forEach(keyword => {
-                    this.trieIndices.d20MeritsFlaws.insert(keyword, flaw);
-                });
-            }
-        }
-        
-        // Build trie for charms
-        this.trieIndices.charms = new Trie();
-        for (const charm of this.data.m20.charms) {
-            if (!charm || !charm.name) {
-                continue;
-            }
-            this.trieIndices.charms.insert(charm.name, charm);
-            if (charm.searchTerms && Array.isArray(charm.searchTerms)) {
-                charm.searchTerms.forEach(term => {
-                    this.trieIndices.charms.insert(term, charm);
-                });
-            }
-            if (charm.keywords && Array.isArray(charm.keywords)) {
-                charm.keywords.forEach(keyword => {
-                    this.trieIndices.charms.insert(keyword, charm);
-                });
+    }
+
+    /**
+     * Build a trie over items by name, search terms and keywords
+     * @param {Array<Array>} sources - Item arrays to index, in order
+     * @returns {Trie} The trie
+     */
+    _buildTrie(sources) {
+        const trie = new Trie();
+        for (const items of sources) {
+            for (const item of items || []) {
+                if (!item || !item.name) {
+                    continue;
+                }
+                // Index by name
+                trie.insert(item.name, item);
+                
+                // Index by search terms
+                if (item.searchTerms && Array.isArray(item.searchTerms)) {
+                    item.searchTerms.forEach(term => trie.insert(term, item));
+                }
+                
+                // Index by keywords
+                if (item.keywords && Array.isArray(item.keywords)) {
+                    item.keywords.forEach(keyword => trie.insert(keyword, item));
+                }
             }
         }
-        
-        // Build trie for s-advantages
-        this.trieIndices.sAdvantages = new Trie();
-        for (const advantage of this.data.m20.sAdvantages) {
-            if (!advantage || !advantage.name) {
-                continue;
-            }
-            this.trieIndices.sAdvantages.insert(advantage.name, advantage);
-            if (advantage.searchTerms && Array.isArray(advantage.searchTerms)) {
-                advantage.searchTerms.forEach(term => {
-                    this.trieIndices.sAdvantages.insert(term, advantage);
-                });
-            }
-            if (advantage.keywords && Array.isArray(advantage.keywords)) {
-                advantage.keywords.forEach(keyword => {
-                    this.trieIndices.sAdvantages.insert(keyword, advantage);
-                });
-            }
+        return trie;
+    }
+
+    /**
+     * Trie serialized into a game line's bundle, bound to the loaded items
+     * @param {string} line - Game line ("M20" or "D20")
+     * @param {string} name - Trie name in the bundle header
+     * @param {Array<Array>} sources - Item arrays the trie's postings refer to
+     * @returns {Trie|null} The trie, or null when the bundle has none that fits
+     */
+    _bundledTrie(line, name, sources) {
+        const bundle = this._bundles?.[line];
+        const span = bundle?.header.tries?.[name];
+        if (!span) return null;
+        try {
+            const data = JSON.parse(bundle.tries.slice(span[0], span[1]));
+            // Postings are positions in the arrays the trie was built from, so each
+            // source must be that very array as parsed from this bundle
+            const fromBundle = data.sources?.length === sources.length
+                && data.sources.every(([file, key], index) => bundle.parsed[file]?.[key] === sources[index]);
+            return fromBundle ? Trie.fromSerialized(data, sources) : null;
+        } catch (error) {
+            return null;
         }
-        
-        const totalItems = this.data.m20.merits.length + this.data.m20.flaws.length + 
-                          this.data.d20.merits.length + this.data.d20.flaws.length +
-                          this.data.m20.charms.length + this.data.m20.sAdvantages.length;
     }
 
     /**
@@ -1325,12 +1283,7 @@ export class GameDataService {
      */
     async loadD20Houses() {
         try {
-            const response = await fetch('systems/wodsystem/datasource/D20/houses.json');
-            if (!response.ok) {
-                throw new Error(`Failed to load D20 houses.json: ${response.statusText}`);
-            }
-            
-            const data = await response.json();
+            const data = await this._readDatasource('D20/houses.json');
             this.data.d20.houses = Array.isArray(data?.houses) ? data.houses : [];
             
         } catch (error) {
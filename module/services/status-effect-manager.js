@@ -1,3 +1,5 @@
+import { loadLazyModule } from '../helpers/lazy-modules.js';
+
 /**
  * Status Effect Manager
  * Manages global status effect templates that can be applied to actors
@@ -1215,7 +1217,7 @@ export class StatusEffectManager {
      */
     _openEffectLibrary() {
         // Import and open the library dialog
-        import('../apps/wod-status-effect-library.js').then(module => {
+        loadLazyModule('statusEffectLibrary').then(module => {
             const dialog = new module.WodStatusEffectLibrary(this);
             dialog.render(true);
         }).catch(error => {
@@ -1,3 +1,6 @@
+// Format version written by scripts/evaluation/wodsource/trie.py
+const SERIALIZED_TRIE_VERSION = 1;
+
 /**
  * TrieNode - Node structure for the Trie
  */
@@ -16,6 +19,37 @@ class TrieNode {
 export class Trie {
     constructor() {
         this.root = new TrieNode();
+        this.flat = null;
+    }
+
+    /**
+     * Adopt a trie serialized at build time (scripts/evaluation/wodsource/trie.py)
+     * without re-inserting its terms. Nodes are flattened in preorder: node i's
+     * subtree is nodes [i, ends[i]), its first child is i + 1 and the sibling
+     * after child c is ends[c]. Postings reference items by (source, position).
+     * @param {object} data - Serialized trie
+     * @param {Array<Array>} sources - Item arrays, in the order of data.sources
+     * @returns {Trie|null} The trie, or null if data does not fit the sources
+     */
+    static fromSerialized(data, sources) {
+        if (!data || data.version !== SERIALIZED_TRIE_VERSION || !Array.isArray(sources)) return null;
+        const { labels, ends, postingStarts, postings, itemSources, itemIndexes } = data;
+        if (!labels?.length || ends?.length !== labels.length
+            || postingStarts?.length !== labels.length + 1
+            || itemSources?.length !== itemIndexes?.length
+            || data.sources?.length !== sources.length) {
+            return null;
+        }
+        
+        const items = new Array(itemSources.length);
+        for (let i = 0; i < items.length; i++) {
+            items[i] = sources[itemSources[i]]?.[itemIndexes[i]];
+            if (!items[i]) return null;
+        }
+        
+        const trie = new Trie();
+        trie.flat = { labels, ends, postingStarts, postings, items };
+        return trie;
     }
 
     /**
@@ -25,6 +59,7 @@ export class Trie {
      */
     insert(word, item) {
         if (!word || typeof word !== 'string') return;
+        if (this.flat) this._expand();
         
         let node = this.root;
         const normalizedWord = word.toLowerCase().trim();
@@ -48,8 +83,10 @@ export class Trie {
     search(prefix) {
         if (!prefix || typeof prefix !== 'string') return [];
         
-        let node = this.root;
         const normalizedPrefix = prefix.toLowerCase().trim();
+        if (this.flat) return this._searchFlat(normalizedPrefix);
+        
+        let node = this.root;
         
         // Navigate to the prefix node
         for (const char of normalizedPrefix) {
@@ -80,11 +117,68 @@ export class Trie {
         return Array.from(results);
     }
 
+    /**
+     * Prefix search over a serialized trie; same results and order as the node walk
+     * @param {string} normalizedPrefix - Lowercased, trimmed prefix
+     * @returns {Array} Array of unique items
+     * @private
+     */
+    _searchFlat(normalizedPrefix) {
+        const { labels, ends, postingStarts, postings, items } = this.flat;
+        
+        let node = 0;
+        for (const char of normalizedPrefix) {
+            let child = node + 1;
+            while (child < ends[node] && labels[child] !== char) {
+                child = ends[child];
+            }
+            if (child >= ends[node]) {
+                return [];
+            }
+            node = child;
+        }
+        
+        // The subtree is contiguous, so its postings are one slice
+        const ordinals = new Set();
+        for (let i = postingStarts[node]; i < postingStarts[ends[node]]; i++) {
+            ordinals.add(postings[i]);
+        }
+        return Array.from(ordinals, ordinal => items[ordinal]);
+    }
+
+    /**
+     * Rebuild the node tree from a serialized trie so it can take new insertions
+     * @private
+     */
+    _expand() {
+        const { labels, ends, postingStarts, postings, items } = this.flat;
+        this.flat = null;
+        this.root = new TrieNode();
+        
+        // Open ancestors of the current node, with the end of their subtrees
+        const open = [];
+        for (let i = 0; i < labels.length; i++) {
+            while (open.length && open[open.length - 1].end <= i) {
+                open.pop();
+            }
+            const node = i === 0 ? this.root : new TrieNode();
+            if (open.length) {
+                open[open.length - 1].node.children.set(labels[i], node);
+            }
+            for (let p = postingStarts[i]; p < postingStarts[i + 1]; p++) {
+                node.items.add(items[postings[p]]);
+                node.isEndOfWord = true;
+            }
+            open.push({ node, end: ends[i] });
+        }
+    }
+
     /**
      * Clear all data from the trie
      */
     clear() {
         this.root = new TrieNode();
+        this.flat = null;
     }
 }
 
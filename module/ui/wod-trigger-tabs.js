@@ -1,6 +1,6 @@
-import { WodTriggerConfigDialog } from "../apps/wod-trigger-config-dialog.js";
 import { TriggerEventRegistry } from '../services/trigger-event-registry.js';
 import { WodUnifiedTriggersDialog } from '../apps/wod-unified-triggers-dialog.js';
+import { loadLazyModule } from '../helpers/lazy-modules.js';
 
 // Track which apps have been processed to prevent duplicate injections
 const _processedApps = new WeakSet();
@@ -515,7 +515,7 @@ async function _injectWodTriggersTab(app, html, doc) {
                 onClose: () => {}
             });
         } else if (action === 'wod-visual-rules') {
-            import('../apps/wod-visual-rules-dialog.js').then(module => {
+            loadLazyModule('visualRulesDialog').then(module => {
                 const DialogClass = module.WodVisualRulesDialog;
                 if (DialogClass) {
                     new DialogClass(doc).render(true);
@@ -549,7 +549,7 @@ function _injectVisualRulesButton(app, html, doc) {
     btn.on('click', (ev) => {
         ev.preventDefault();
         ev.stopPropagation();
-        import('../apps/wod-visual-rules-dialog.js').then(module => {
+        loadLazyModule('visualRulesDialog').then(module => {
             const DialogClass = module.WodVisualRulesDialog;
             if (DialogClass) {
                 new DialogClass(tokenDoc).render(true);
@@ -902,7 +902,7 @@ function _attachConfigDialogEventListeners($content, app, doc) {
         const triggerId = ev.currentTarget.dataset.triggerId;
         if (!triggerId) return;
         
-        import('../apps/wod-trigger-config-dialog.js').then(module => {
+        loadLazyModule('triggerConfigDialog').then(module => {
             const DialogClass = module.WodTriggerConfigDialog || module.default;
             if (DialogClass) {
                 const configDialog = new DialogClass(doc, triggerId, { 
@@ -911,6 +911,9 @@ function _attachConfigDialogEventListeners($content, app, doc) {
                 });
                 configDialog.render(true);
             }
+        }).catch(error => {
+            console.error('WoD Trigger Tabs | Error importing trigger config dialog:', error);
+            ui.notifications.error('Failed to load trigger configuration dialog');
         });
     });
     
@@ -999,7 +1002,7 @@ function _attachConfigDialogEventListenersOnly($content, dialogRef, doc) {
         const triggerId = ev.currentTarget.dataset.triggerId;
         if (!triggerId) return;
         
-        import('../apps/wod-trigger-config-dialog.js').then(module => {
+        loadLazyModule('triggerConfigDialog').then(module => {
             const DialogClass = module.WodTriggerConfigDialog || module.default;
             if (DialogClass) {
                 const configDialog = new DialogClass(doc, triggerId, { 
@@ -1008,6 +1011,9 @@ function _attachConfigDialogEventListenersOnly($content, dialogRef, doc) {
                 });
                 configDialog.render(true);
             }
+        }).catch(error => {
+            console.error('WoD Trigger Tabs | Error importing trigger config dialog:', error);
+            ui.notifications.error('Failed to load trigger configuration dialog');
         });
     });
     
@@ -1332,7 +1338,7 @@ async function _showWodTriggersContent(app, html, doc) {
                 // Open trigger configuration dialog
                 
                 // Import the config dialog module
-                import('../apps/wod-trigger-config-dialog.js').then(module => {
+                loadLazyModule('triggerConfigDialog').then(module => {
                     
                     const DialogClass = module.WodTriggerConfigDialog || module.default;
                     
@@ -1412,7 +1418,7 @@ async function _showWodTriggersContent(app, html, doc) {
             ev.stopPropagation();
             const triggerId = ev.currentTarget.dataset.triggerId;
             if (!triggerId) return;
-            import('../apps/wod-trigger-config-dialog.js').then(module => {
+            loadLazyModule('triggerConfigDialog').then(module => {
                 const DialogClass = module.WodTriggerConfigDialog || module.default;
                 if (DialogClass) {
                     const configDialog = new DialogClass(doc, triggerId, { 
@@ -1421,6 +1427,9 @@ async function _showWodTriggersContent(app, html, doc) {
                     });
                     configDialog.render(true);
                 }
+            }).catch(error => {
+                console.error('WoD Trigger Tabs | Error importing trigger config dialog:', error);
+                ui.notifications.error('Failed to load trigger configuration dialog');
             });
         });
         
@@ -1735,7 +1744,7 @@ async function _showWallTriggersContent(wall) {
             dialogElement.data('wallDocument', wall);
             
             // Add click listener for add trigger button
-            $button.off('click.wallTrigger').on('click.wallTrigger', (event) => {
+            $button.off('click.wallTrigger').on('click.wallTrigger', async (event) => {
                 event.preventDefault();
                 event.stopPropagation();
                 
@@ -1743,6 +1752,14 @@ async function _showWallTriggersContent(wall) {
                 const dialogRef = dialog;
                 
                 // Open the trigger config dialog for this wall
+                let WodTriggerConfigDialog;
+                try {
+                    ({ WodTriggerConfigDialog } = await loadLazyModule('triggerConfigDialog'));
+                } catch (error) {
+                    console.error('WoD Trigger Tabs | Error importing trigger config dialog:', error);
+                    ui.notifications.error('Failed to load trigger configuration dialog');
+                    return;
+                }
                 const triggerDialog = new WodTriggerConfigDialog(wall, null, {
                     title: `Add Trigger - Wall ${wall.id.substring(-4)}`,
                     documentType: 'wall',
@@ -1780,6 +1797,14 @@ function _attachWallTriggerEventListeners(dialogElement, wall) {
             // Store dialog reference for the onClose callback
             const dialogRef = $content.closest('.app.window-app').data('dialogRef');
             
+            let WodTriggerConfigDialog;
+            try {
+                ({ WodTriggerConfigDialog } = await loadLazyModule('triggerConfigDialog'));
+            } catch (error) {
+                console.error('WoD Trigger Tabs | Error importing trigger config dialog:', error);
+                ui.notifications.error('Failed to load trigger configuration dialog');
+                return;
+            }
             const triggerDialog = new WodTriggerConfigDialog(wall, triggerId, {
                 title: `Edit Trigger - Wall ${wall.id.substring(-4)}`,
                 documentType: 'wall',
@@ -1903,7 +1928,7 @@ async function _refreshWallTriggersContent(dialogElement, wall) {
                     const dialogRef = dialogElement.closest('.app.window-app').data('dialogRef') || dialog;
                     
                     // Open the trigger config dialog for this wall
-                    import('../apps/wod-trigger-config-dialog.js').then(module => {
+                    loadLazyModule('triggerConfigDialog').then(module => {
                         const DialogClass = module.WodTriggerConfigDialog || module.default;
                         if (DialogClass) {
                             const triggerDialog = new DialogClass(wall, null, {
@@ -2154,7 +2179,7 @@ function _showSceneTriggersContent(scene) {
                 event.stopPropagation();
 
                 // Open the trigger config dialog for this scene
-                import('../apps/wod-trigger-config-dialog.js').then(module => {
+                loadLazyModule('triggerConfigDialog').then(module => {
                     const DialogClass = module.WodTriggerConfigDialog || module.default;
                     if (DialogClass) {
                         const triggerDialog = new DialogClass(scene, null, {
@@ -2184,7 +2209,7 @@ function _showSceneTriggersContent(scene) {
             
             if (action === 'edit-trigger' && triggerId) {
                 // Handle trigger editing
-                import('../apps/wod-trigger-config-dialog.js').then(module => {
+                loadLazyModule('triggerConfigDialog').then(module => {
                     const DialogClass = module.WodTriggerConfigDialog || module.default;
                     if (DialogClass) {
                         const triggerDialog = new DialogClass(scene, triggerId, {
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Compile the datasource JSON into one bundle per game line (see wodsource/bundle.py).
+
+GameDataService.initialize() fetches datasource/M20.bundle and
+datasource/D20.bundle in parallel, one request each, and only falls back
+to the individual files when no bundle was built. Each bundle also carries
+the merit/flaw, charm and s-advantage search tries prebuilt (see
+wodsource/trie.py), which the clients adopt instead of building their own. Re-run after any
+datasource edit; unchanged bundles are not rewritten. Bundles are stamped
+with the system.json version and clients ignore a bundle stamped for another
+version; scripts/build_release.py runs this step for every release. Run from
+the repository root:
+
+    python scripts/build_datasource_bundle.py
+    python scripts/build_datasource_bundle.py --check   # exit 1 if a bundle is stale
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The bundle format and datasource helpers live with the evaluation tooling
+sys.path.insert(0, os.path.join(ROOT, 'scripts', 'evaluation'))
+
+from build_template_bundle import system_version
+from extract_datasource import write_if_changed
+from wodsource import BUNDLE_FILES, build_bundle, bundle_path, read_bundle
+
+def _source_size(root: str, line: str) -> int:
+    total = 0
+    for name in BUNDLE_FILES[line]:
+        path = os.path.join(root, line, name)
+        if os.path.exists(path):
+            total += os.path.getsize(path)
+    return total
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the datasource JSON into one bundle per game line")
+    parser.add_argument('--root', default='datasource', help="datasource directory (default: datasource)")
+    parser.add_argument('--line', action='append', choices=sorted(BUNDLE_FILES),
+                        help="game line to build (repeatable; default: all)")
+    parser.add_argument('--check', action='store_true',
+                        help="only report which bundles would change; exit 1 if any would")
+    args = parser.parse_args()
+    version = system_version(ROOT)
+
+    stale = []
+    for line in args.line or list(BUNDLE_FILES):
+        if not os.path.isdir(os.path.join(args.root, line)):
+            print(f"⚠️  {os.path.join(args.root, line)}: not found, skipped")
+            continue
+        start = time.perf_counter()
+        text = build_bundle(args.root, line, system_version=version)
+        elapsed = time.perf_counter() - start
+        path = bundle_path(args.root, line)
+
+        if args.check:
+            current = None
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    current = f.read()
+            if current != text:
+                stale.append(path)
+            print(f"{'🔄' if current != text else '✅'} {path}: {'would change' if current != text else 'up to date'}")
+            continue
+
+        written = write_if_changed(path, text)
+        header, _ = read_bundle(path)
+        records = sum(len(ids) for ids in header['ids'].values())
+        print(f"{'📄' if written else '✅'} {path}: {'written' if written else 'unchanged'} "
+              f"({len(header['files'])} files, {records} records, {len(header['tries'])} search tries, "
+              f"{_source_size(args.root, line) / 1024:.1f} KB -> {len(text) / 1024:.1f} KB, "
+              f"{elapsed * 1000:.1f} ms, digest {header['digest'][:12]})")
+        for name in header['missing']:
+            print(f"   ⚠️  {line}/{name} not found; left out of the bundle")
+    return 1 if stale else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
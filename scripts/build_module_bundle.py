@@ -0,0 +1,596 @@
+#!/usr/bin/env python3
+"""
+Bundle the ES module graph of wodsystem.js into a few files.
+
+Foundry fetches and parses every module of the graph separately before the
+system can initialize. This resolves the static imports from the entry,
+wraps each module in a factory that a small registry runs once, in the same
+order the browser would evaluate them, and writes:
+
+    dist/wodsystem.bundle.js (+ .map)   the entry and everything it imports statically
+    dist/chunks/<name>.js (+ .map)      each dynamic import() target and the modules only it needs
+    dist/bundle-report.json             per-module and per-chunk sizes
+
+Imports become `const { a, b: c } = __wodRequire("module/x.js");` and exports
+are returned from the factory. The graph's exports are classes, functions and
+consts, so values read after the exporter finished equal ES live bindings; an
+import that closes a cycle is bound once the cycle's module finishes instead,
+which is when ES would leave its temporal dead zone. Dynamic import() of a
+bundled module loads its chunk and resolves to the same exports object.
+
+Debug-only code is stripped unless --keep-debug: console.log/console.debug
+calls inside an `if (...debug...)` guard become `void 0`, and guard blocks
+left empty by that become `{}`. Calls outside such a guard are kept, since
+their arguments may have side effects. Comments are dropped unless --keep-comments. Line breaks
+are always kept, so the source map maps every generated line to its source.
+
+To ship the bundle, point "esmodules" in the packaged system.json at
+dist/wodsystem.bundle.js.
+
+    python scripts/build_module_bundle.py
+    python scripts/build_module_bundle.py --keep-debug --out /tmp/dist
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import re
+import sys
+
+ENTRY = 'wodsystem.js'
+OUTPUT_DIR = 'dist'
+BUNDLE_NAME = 'wodsystem.bundle.js'
+CHUNK_DIR = 'chunks'
+REPORT_NAME = 'bundle-report.json'
+
+# ---------------------------------------------------------------- tokenizer
+
+_IDENTIFIER = re.compile(r'[A-Za-z_$\u0080-￿][\w$\u0080-￿]*')
+_NUMBER = re.compile(r'(?:0[xXoObB][\da-fA-F_]+|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?)n?')
+_SPACE = re.compile(r'\s+')
+_PUNCTUATOR = re.compile(r'\?\.|=>|\.\.\.|[{}()\[\];,.<>+\-*/%&|^!~?:=@#]')
+# After these a '/' starts a regular expression rather than a division
+_REGEX_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw',
+                   'case', 'do', 'else', 'yield', 'await'}
+
+class Token:
+    __slots__ = ('kind', 'start', 'end', 'value')
+
+    def __init__(self, kind, start, end, value):
+        self.kind = kind      # 'name', 'number', 'string', 'template', 'regex', 'punct', 'comment'
+        self.start = start
+        self.end = end
+        self.value = value
+
+    def __repr__(self):
+        return f"Token({self.kind}, {self.value!r})"
+
+class TokenizeError(ValueError):
+    pass
+
+def _skip_string(source, position, quote):
+    position += 1
+    while position < len(source):
+        char = source[position]
+        if char == '\\':
+            position += 2
+            continue
+        if char == quote:
+            return position + 1
+        if char == '\n':
+            break
+        position += 1
+    raise TokenizeError(f"unterminated string at offset {position}")
+
+def _skip_regex(source, position):
+    position += 1
+    in_class = False
+    while position < len(source):
+        char = source[position]
+        if char == '\\':
+            position += 2
+            continue
+        if char == '\n':
+            break
+        if char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif char == '/' and not in_class:
+            position += 1
+            while position < len(source) and (source[position].isalnum() or source[position] in '_$'):
+                position += 1
+            return position
+        position += 1
+    raise TokenizeError(f"unterminated regular expression at offset {position}")
+
+def _regex_allowed(previous):
+    if previous is None:
+        return True
+    if previous.kind == 'name':
+        return previous.value in _REGEX_KEYWORDS
+    if previous.kind in ('number', 'string', 'template', 'regex'):
+        return False
+    return previous.value not in (')', ']', '}')
+
+def tokenize(source):
+    """Tokens of a JavaScript source, comments included; whitespace is skipped"""
+    tokens = []
+    # Brace depth at which each open template expression `${` resumes its template
+    templates = []
+    depth = 0
+    position = 0
+    previous = None
+    length = len(source)
+
+    def template_part(start):
+        # Scan template text from start (just after ` or }) to the closing ` or the next ${
+        position = start
+        while position < length:
+            char = source[position]
+            if char == '\\':
+                position += 2
+                continue
+            if char == '`':
+                return position + 1, False
+            if char == '$' and source.startswith('${', position):
+                return position + 2, True
+            position += 1
+        raise TokenizeError(f"unterminated template literal at offset {start}")
+
+    while position < length:
+        match = _SPACE.match(source, position)
+        if match:
+            position = match.end()
+            continue
+        char = source[position]
+        start = position
+        if source.startswith('//', position):
+            end = source.find('\n', position)
+            position = length if end < 0 else end
+            tokens.append(Token('comment', start, position, source[start:position]))
+            continue
+        if source.startswith('/*', position):
+            end = source.find('*/', position + 2)
+            if end < 0:
+                raise TokenizeError(f"unterminated comment at offset {start}")
+            position = end + 2
+            tokens.append(Token('comment', start, position, source[start:position]))
+            continue
+        if char in '\'"':
+            position = _skip_string(source, position, char)
+            kind = 'string'
+        elif char == '`' or (char == '}' and templates and templates[-1] == depth):
+            if char == '}':
+                templates.pop()
+            position, opened = template_part(position + 1)
+            if opened:
+                templates.append(depth)
+            kind = 'template'
+        elif char == '/' and _regex_allowed(previous):
+            position = _skip_regex(source, position)
+            kind = 'regex'
+        else:
+            match = _IDENTIFIER.match(source, position) or _NUMBER.match(source, position)
+            if match and match.end() > position:
+                position = match.end()
+                kind = 'name' if not (char.isdigit() or char == '.') else 'number'
+            else:
+                match = _PUNCTUATOR.match(source, position)
+                position = match.end() if match else position + 1
+                kind = 'punct'
+                if char == '{':
+                    depth += 1
+                elif char == '}':
+                    depth -= 1
+        token = Token(kind, start, position, source[start:position])
+        tokens.append(token)
+        previous = token
+    return tokens
+
+# ---------------------------------------------------------------- module graph
+
+class Module:
+    def __init__(self, module_id, source):
+        self.id = module_id
+        self.source = source
+        self.tokens = tokenize(source)
+        self.imports = []          # (start, end, [(imported, local)], target id)
+        self.dynamic_imports = []  # (start, end, target id)
+        self.exports = []          # exported names
+        self.export_keywords = []  # (start, end) of `export ` keywords
+        self.debug_guards = []     # (start, end) of the bodies of `if (...debug...)` statements
+        self.debug_calls = []      # (start, end) of console.log/debug calls inside a debug guard
+        self.comments = [(token.start, token.end) for token in self.tokens if token.kind == 'comment']
+        self._scan()
+
+    def resolve(self, specifier):
+        if not specifier.startswith('.'):
+            raise ValueError(f"{self.id}: bare import '{specifier}' cannot be bundled")
+        return posixpath.normpath(posixpath.join(posixpath.dirname(self.id), specifier))
+
+    def _scan(self):
+        tokens = [token for token in self.tokens if token.kind != 'comment']
+        depth = 0
+        index = 0
+        while index < len(tokens):
+            token = tokens[index]
+            after = tokens[index + 1] if index + 1 < len(tokens) else None
+            before = tokens[index - 1] if index else None
+            is_member = before is not None and before.value in ('.', '?.')
+            if token.kind == 'punct' and token.value in '{([':
+                depth += 1
+            elif token.kind == 'punct' and token.value in '})]':
+                depth -= 1
+            elif token.kind == 'name' and token.value == 'import' and not is_member and after is not None:
+                if after.value == '(':
+                    index = self._dynamic_import(tokens, index)
+                    continue
+                if depth == 0:
+                    index = self._static_import(tokens, index)
+                    continue
+            elif token.kind == 'name' and token.value == 'export' and depth == 0 and not is_member:
+                self._export(tokens, index)
+            elif token.kind == 'name' and token.value == 'if' and not is_member and after is not None and after.value == '(':
+                self._debug_guard(tokens, index)
+            elif (token.kind == 'name' and token.value == 'console' and not is_member and after is not None
+                  and after.value == '.' and index + 3 < len(tokens)
+                  and tokens[index + 2].value in ('log', 'debug') and tokens[index + 3].value == '('):
+                end = self._matching(tokens, index + 3)
+                if any(start <= token.start < stop for start, stop in self.debug_guards):
+                    self.debug_calls.append((token.start, tokens[end].end))
+                index = end + 1
+                continue
+            index += 1
+
+    @staticmethod
+    def _matching(tokens, index):
+        """Index of the bracket closing the one at index"""
+        depth = 0
+        for position in range(index, len(tokens)):
+            value = tokens[position].value
+            if tokens[position].kind != 'punct':
+                continue
+            if value in '([{':
+                depth += 1
+            elif value in ')]}':
+                depth -= 1
+                if depth == 0:
+                    return position
+        raise ValueError("unbalanced brackets")
+
+    def _debug_guard(self, tokens, index):
+        """Record the body of the if statement at index when its condition mentions debug"""
+        close = self._matching(tokens, index + 1)
+        if close + 1 >= len(tokens) or not any(
+                token.kind in ('name', 'string') and 'debug' in token.value.lower()
+                for token in tokens[index + 2:close]):
+            return
+        body = tokens[close + 1]
+        if body.value == '{':
+            self.debug_guards.append((body.start, tokens[self._matching(tokens, close + 1)].end))
+        else:
+            self.debug_guards.append((body.start, body.end))   # `if (debug) console.log(...);`
+
+    def _static_import(self, tokens, index):
+        start = tokens[index].start
+        position = index + 1
+        bindings = []
+        if tokens[position].kind == 'string':
+            raise ValueError(f"{self.id}: side-effect-only imports are not supported")
+        if tokens[position].value != '{':
+            raise ValueError(f"{self.id}: only named imports are supported (offset {start})")
+        position += 1
+        while tokens[position].value != '}':
+            imported = tokens[position].value
+            local = imported
+            position += 1
+            if tokens[position].value == 'as':
+                local = tokens[position + 1].value
+                position += 2
+            bindings.append((imported, local))
+            if tokens[position].value == ',':
+                position += 1
+        position += 1
+        if tokens[position].value != 'from' or tokens[position + 1].kind != 'string':
+            raise ValueError(f"{self.id}: malformed import at offset {start}")
+        specifier = json.loads('"' + tokens[position + 1].value[1:-1] + '"')
+        end_index = position + 1
+        if end_index + 1 < len(tokens) and tokens[end_index + 1].value == ';':
+            end_index += 1
+        self.imports.append((start, tokens[end_index].end, bindings, self.resolve(specifier)))
+        return end_index + 1
+
+    def _dynamic_import(self, tokens, index):
+        if tokens[index + 2].kind == 'string' and tokens[index + 3].value == ')':
+            specifier = json.loads('"' + tokens[index + 2].value[1:-1] + '"')
+            self.dynamic_imports.append((tokens[index].start, tokens[index + 3].end, self.resolve(specifier)))
+            return index + 4
+        raise ValueError(f"{self.id}: import() needs a literal relative path (offset {tokens[index].start})")
+
+    def _export(self, tokens, index):
+        keyword = tokens[index]
+        position = index + 1
+        if tokens[position].value in ('default', '{', '*'):
+            raise ValueError(f"{self.id}: only `export <declaration>` is supported (offset {keyword.start})")
+        if tokens[position].value == 'async':
+            position += 1
+        if tokens[position].value in ('class', 'function', 'const', 'let', 'var'):
+            position += 1
+        if tokens[position].value == '*':
+            position += 1
+        name = tokens[position]
+        if name.kind != 'name':
+            raise ValueError(f"{self.id}: destructuring exports are not supported (offset {keyword.start})")
+        self.exports.append(name.value)
+        self.export_keywords.append((keyword.start, tokens[index + 1].start))
+
+def load_graph(root, entry):
+    """{module id: Module} for everything reachable from entry, statically or dynamically"""
+    modules = {}
+    pending = [entry]
+    while pending:
+        module_id = pending.pop()
+        if module_id in modules:
+            continue
+        path = os.path.join(root, module_id)
+        if not os.path.exists(path):
+            raise ValueError(f"{module_id}: imported but not found")
+        with open(path, 'r', encoding='utf-8') as f:
+            module = Module(module_id, f.read())
+        modules[module_id] = module
+        pending.extend(target for *_, target in module.imports)
+        pending.extend(target for *_, target in module.dynamic_imports)
+    return modules
+
+def evaluation_order(modules, entry, loaded=()):
+    """(modules in ES evaluation order from entry, {(importer, target)} imports that close a cycle)
+
+    Modules in loaded are already evaluated and left out.
+    """
+    order = []
+    back_edges = set()
+    state = {module_id: 'done' for module_id in loaded}
+
+    def visit(module_id):
+        state[module_id] = 'active'
+        for *_, target in modules[module_id].imports:
+            if state.get(target) == 'active':
+                back_edges.add((module_id, target))
+            elif target not in state:
+                visit(target)
+        state[module_id] = 'done'
+        order.append(module_id)
+
+    visit(entry)
+    return order, back_edges
+
+# ---------------------------------------------------------------- code generation
+
+def _vlq(value):
+    value = (-value << 1) | 1 if value < 0 else value << 1
+    digits = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+    encoded = ''
+    while True:
+        digit = value & 31
+        value >>= 5
+        encoded += digits[digit | (32 if value else 0)]
+        if not value:
+            return encoded
+
+def _blank(text):
+    """Replacement that keeps the line breaks of text"""
+    return '\n' * text.count('\n')
+
+# `if (this._debugMode) { void 0; }` left behind by stripped logging; only the
+# block is emptied, so an `else` before the if or after the block still parses
+_EMPTY_DEBUG_BLOCK = re.compile(
+    r'(\bif\s*\([\w$.!&|\s]*[dD]ebug[\w$.!&|\s]*\)\s*)\{(?:\s*void 0\s*;?)*\s*\}')
+
+def transform(module, chunk_of, keep_debug, keep_comments, back_edges):
+    """Factory body for a module; every source line stays on the same relative line"""
+    edits = []   # (start, end, replacement)
+    for start, end, bindings, target in module.imports:
+        pattern = ', '.join(imported if imported == local else f"{imported}: {local}"
+                            for imported, local in bindings)
+        if (module.id, target) in back_edges:
+            names = ', '.join(local for _, local in bindings)
+            code = f"let {names}; __wodDeferred({json.dumps(target)}, __m => ({{ {pattern} }} = __m));"
+        else:
+            code = f"const {{ {pattern} }} = __wodRequire({json.dumps(target)});"
+        edits.append((start, end, code + _blank(module.source[start:end])))
+    for start, end, target in module.dynamic_imports:
+        chunk = chunk_of[target]
+        if chunk is None:
+            code = f"Promise.resolve().then(() => __wodRequire({json.dumps(target)}))"
+        else:
+            code = f"__wodLoad({json.dumps(chunk)}, {json.dumps(target)})"
+        edits.append((start, end, code + _blank(module.source[start:end])))
+    for start, end in module.export_keywords:
+        edits.append((start, end, ''))
+    if not keep_debug:
+        for start, end in module.debug_calls:
+            edits.append((start, end, 'void 0' + _blank(module.source[start:end])))
+    if not keep_comments:
+        for start, end in module.comments:
+            edits.append((start, end, _blank(module.source[start:end])))
+
+    edits.sort()
+    parts = []
+    position = 0
+    for start, end, replacement in edits:
+        if start < position:
+            continue   # inside a span already replaced (a comment within a dropped call)
+        parts.append(module.source[position:start])
+        parts.append(replacement)
+        position = end
+    parts.append(module.source[position:])
+    code = ''.join(parts)
+    if not keep_debug:
+        code = _EMPTY_DEBUG_BLOCK.sub(
+            lambda match: match.group(1) + '{}' + _blank(match.group()[len(match.group(1)):]), code)
+    return code
+
+REGISTRY = '''const __wodRegistry = globalThis[Symbol.for("wodsystem.modules")] ??= (() => {
+    const exports = new Map();
+    const deferred = new Map();
+    return {
+        base: new URL(".", import.meta.url),
+        define(id, factory) {
+            if (exports.has(id)) return;
+            const value = Object.freeze(factory());
+            exports.set(id, value);
+            for (const bind of deferred.get(id) ?? []) bind(value);
+            deferred.delete(id);
+        },
+        require(id) {
+            if (!exports.has(id)) throw new Error(`wodsystem bundle: module ${id} is not loaded`);
+            return exports.get(id);
+        },
+        deferred(id, bind) {
+            if (exports.has(id)) bind(exports.get(id));
+            else deferred.set(id, [...(deferred.get(id) ?? []), bind]);
+        }
+    };
+})();
+const __wodDefine = __wodRegistry.define;
+const __wodRequire = __wodRegistry.require;
+const __wodDeferred = __wodRegistry.deferred;
+const __wodLoad = (chunk, id) => import(new URL(chunk, __wodRegistry.base).href).then(() => __wodRequire(id));
+'''
+
+def render_chunk(module_ids, modules, chunk_of, args, back_edges, out_path):
+    """(code, source map) for one output file holding module_ids in order"""
+    lines = [f"// Generated by scripts/build_module_bundle.py; do not edit"]
+    lines.extend(REGISTRY.rstrip('\n').split('\n'))
+    mappings = [None] * len(lines)
+    sources = []
+    sizes = {}
+    for module_id in module_ids:
+        module = modules[module_id]
+        code = transform(module, chunk_of, args.keep_debug, args.keep_comments, back_edges)
+        source_index = len(sources)
+        sources.append(module_id)
+        lines.append(f"__wodDefine({json.dumps(module_id)}, () => {{")
+        mappings.append(None)
+        for line_number, line in enumerate(code.split('\n')):
+            lines.append(line)
+            mappings.append((source_index, line_number))
+        exports = ', '.join(module.exports)
+        lines.append(f"return {{ {exports} }};" if exports else "return {};")
+        lines.append("});")
+        mappings.extend([None, None])
+        sizes[module_id] = {
+            'source': len(module.source.encode('utf-8')),
+            'output': len(code.encode('utf-8')),
+            'debugCallsStripped': 0 if args.keep_debug else len(module.debug_calls),
+        }
+    lines.append(f"//# sourceMappingURL={os.path.basename(out_path)}.map")
+    mappings.append(None)
+
+    # One segment per mapped line: column 0 -> (source, line, column 0), fields relative
+    encoded = []
+    last_source = last_line = 0
+    for mapping in mappings:
+        if mapping is None:
+            encoded.append('')
+            continue
+        source_index, line_number = mapping
+        encoded.append('A' + _vlq(source_index - last_source) + _vlq(line_number - last_line) + 'A')
+        last_source, last_line = source_index, line_number
+    map_dir = os.path.dirname(out_path)
+    source_map = {
+        'version': 3,
+        'file': os.path.basename(out_path),
+        'sources': [os.path.relpath(os.path.join(args.root, source), map_dir).replace(os.sep, '/')
+                    for source in sources],
+        'names': [],
+        'mappings': ';'.join(encoded),
+    }
+    return '\n'.join(lines) + '\n', source_map, sizes
+
+def plan_chunks(modules, order, back_edges):
+    """{module id: chunk file (None for the main bundle)} and [(chunk file, [module ids])]
+
+    Each dynamic import() target outside the main bundle gets a chunk with
+    the modules it needs that are not loaded yet; a module needed by several
+    chunks is written to each and evaluated by whichever loads first.
+    """
+    chunk_of = {module_id: None for module_id in order}
+    chunks = [(None, order)]
+    pending = [target for module_id in order for *_, target in modules[module_id].dynamic_imports]
+    while pending:
+        target = pending.pop(0)
+        if target in chunk_of:
+            continue
+        members, edges = evaluation_order(modules, target, loaded=set(order))
+        back_edges.update(edges)
+        name = f"{CHUNK_DIR}/{posixpath.splitext(posixpath.basename(target))[0]}.js"
+        for module_id in members:
+            chunk_of.setdefault(module_id, name)
+            pending.extend(nested for *_, nested in modules[module_id].dynamic_imports)
+        chunks.append((name, members))
+    return chunk_of, chunks
+
+def main():
+    default_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description="Bundle the wodsystem.js module graph into a few files")
+    parser.add_argument('--root', default=default_root, help="system root (default: this repository)")
+    parser.add_argument('--entry', default=ENTRY, help=f"entry module (default {ENTRY})")
+    parser.add_argument('--out', help=f"output directory (default: <root>/{OUTPUT_DIR})")
+    parser.add_argument('--keep-debug', action='store_true', help="keep debug-guarded console.log/debug calls")
+    parser.add_argument('--keep-comments', action='store_true', help="keep comments")
+    args = parser.parse_args()
+    out_dir = args.out or os.path.join(args.root, OUTPUT_DIR)
+
+    try:
+        modules = load_graph(args.root, args.entry)
+        order, back_edges = evaluation_order(modules, args.entry)
+        chunk_of, chunks = plan_chunks(modules, order, back_edges)
+    except (ValueError, TokenizeError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    report = {'entry': args.entry, 'chunks': {}, 'modules': {}}
+    os.makedirs(os.path.join(out_dir, CHUNK_DIR), exist_ok=True)
+    for chunk, members in chunks:
+        name = chunk or BUNDLE_NAME
+        out_path = os.path.join(out_dir, name)
+        code, source_map, sizes = render_chunk(members, modules, chunk_of, args, back_edges, out_path)
+        with open(out_path, 'w', encoding='utf-8') as f:
+            f.write(code)
+        with open(out_path + '.map', 'w', encoding='utf-8') as f:
+            json.dump(source_map, f, separators=(',', ':'))
+        report['chunks'][name] = {
+            'modules': len(members),
+            'source': sum(size['source'] for size in sizes.values()),
+            'output': len(code.encode('utf-8')),
+        }
+        for module_id, size in sizes.items():
+            report['modules'][module_id] = dict(size, chunk=name)
+
+    with open(os.path.join(out_dir, REPORT_NAME), 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+    print("=" * 80)
+    print(f"📦 {len(modules)} modules from {args.entry} -> {len(chunks)} files in {out_dir}")
+    print("=" * 80)
+    for name, chunk in report['chunks'].items():
+        print(f"  {name:45} {chunk['modules']:3} modules  {chunk['source'] / 1024:8.1f} KB -> {chunk['output'] / 1024:8.1f} KB")
+    print(f"\n📊 Largest modules:")
+    largest = sorted(report['modules'].items(), key=lambda item: -item[1]['output'])
+    for module_id, size in largest[:15]:
+        print(f"  {module_id:60} {size['output'] / 1024:8.1f} KB  ({size['chunk']})")
+    stripped = sum(size['debugCallsStripped'] for size in report['modules'].values())
+    if stripped:
+        print(f"\n🧹 {stripped} debug-guarded console.log/debug calls stripped")
+    if back_edges:
+        for importer, target in sorted(back_edges):
+            print(f"🔁 cycle: {importer} -> {target} bound after {target} finishes")
+    print(f"📄 Report: {os.path.join(out_dir, REPORT_NAME)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
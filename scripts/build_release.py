@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Release build: regenerate every bundle the system ships, or check they are current.
+
+The bundles are stamped with the "version" in system.json and clients ignore
+a bundle stamped for another version, so run this after bumping the version
+and commit what it writes:
+
+    python scripts/build_release.py            # rebuild the bundles
+    python scripts/build_release.py --check    # exit 1 if any bundle is missing, stale or broken
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (label, build script relative to the repository root, extra arguments)
+STEPS = [
+    ('templates', 'scripts/build_template_bundle.py', []),
+    ('datasource', 'scripts/build_datasource_bundle.py', []),
+]
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild or check every bundle shipped in a release")
+    parser.add_argument('--check', action='store_true', help="only check; exit 1 if any bundle would change")
+    args = parser.parse_args()
+
+    failed = []
+    for label, script, arguments in STEPS:
+        print(f"\n🔨 {label}", flush=True)
+        command = [sys.executable, os.path.join(ROOT, script), *arguments]
+        if args.check:
+            command.append('--check')
+        if subprocess.run(command, cwd=ROOT).returncode != 0:
+            failed.append(label)
+
+    if failed:
+        print(f"\n❌ {'Stale or broken' if args.check else 'Failed'}: {', '.join(failed)}")
+        return 1
+    print(f"\n✅ {'All bundles up to date' if args.check else 'All bundles built'}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
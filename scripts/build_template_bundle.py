@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Pack every template under templates/ into one JSON bundle keyed by system path.
+
+The init hook registers all partials from this single payload
+(module/helpers/template-bundle.js) instead of fetching ~60 files one by one.
+Before writing, every partial referenced from a template ({{> "..."}}) and every
+template path written literally in the JavaScript is checked to exist, so a
+renamed or deleted partial fails the build instead of a sheet at runtime.
+The bundle is stamped with the system.json version it was built for; the
+client only uses a bundle whose stamp matches the running system, so a
+bundle left over from another release is never served. scripts/build_release.py
+runs this step (and --check) as part of every release.
+
+    python scripts/build_template_bundle.py            # check references, write the bundle
+    python scripts/build_template_bundle.py --check    # check only; exit 1 if broken or stale
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+SYSTEM_PREFIX = 'systems/wodsystem/'
+TEMPLATE_DIR = 'templates'
+BUNDLE_NAME = 'templates.bundle.json'
+BUNDLE_VERSION = 2
+TEMPLATE_EXTENSIONS = ('.html', '.hbs')
+CODE_PATHS = ('wodsystem.js', 'module', 'scripts')
+
+# {{> "path"}}, {{~> 'path'}}, {{#> path}} ... ; dynamic partials "(lookup ...)" are skipped
+PARTIAL_PATTERN = re.compile(r'\{\{~?#?>\s*(?:"([^"]+)"|\'([^\']+)\'|([^\s}()~]+))')
+CODE_TEMPLATE_PATTERN = re.compile(r'systems/wodsystem/templates/[\w\-./]+\.(?:html|hbs)')
+
+def collect_templates(root):
+    """Template source by system path, in sorted path order"""
+    templates = {}
+    base = os.path.join(root, TEMPLATE_DIR)
+    for directory, _, files in os.walk(base):
+        for name in files:
+            if not name.endswith(TEMPLATE_EXTENSIONS):
+                continue
+            path = os.path.join(directory, name)
+            relative = os.path.relpath(path, root).replace(os.sep, '/')
+            with open(path, 'r', encoding='utf-8') as f:
+                templates[SYSTEM_PREFIX + relative] = f.read()
+    return dict(sorted(templates.items()))
+
+def partial_references(source):
+    """Partial names referenced from one template, in order of appearance"""
+    return [next(group for group in match.groups() if group) for match in PARTIAL_PATTERN.finditer(source)]
+
+def code_references(root):
+    """(file, template path) for every literal template path in the JavaScript"""
+    references = []
+    for entry in CODE_PATHS:
+        start = os.path.join(root, entry)
+        if os.path.isfile(start):
+            paths = [start]
+        else:
+            paths = [os.path.join(directory, name)
+                     for directory, _, files in os.walk(start)
+                     for name in sorted(files) if name.endswith('.js')]
+        for path in sorted(paths):
+            with open(path, 'r', encoding='utf-8') as f:
+                for match in CODE_TEMPLATE_PATTERN.finditer(f.read()):
+                    references.append((os.path.relpath(path, root), match.group()))
+    return references
+
+def find_missing(templates, root):
+    """(referrer, missing path) for partials and code references with no template"""
+    missing = []
+    for path, source in templates.items():
+        for name in partial_references(source):
+            # Only system paths are files; other names are inline or runtime-registered partials
+            if name.startswith(SYSTEM_PREFIX) and name not in templates:
+                missing.append((path[len(SYSTEM_PREFIX):], name))
+    for referrer, name in code_references(root):
+        if name not in templates:
+            missing.append((referrer, name))
+    return missing
+
+def system_version(root):
+    """The version in system.json, which the client compares with the bundle's stamp"""
+    with open(os.path.join(root, 'system.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)['version']
+
+def build_bundle(templates, version):
+    """Bundle text for the templates; identical input gives identical bytes"""
+    body = json.dumps(templates, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    bundle = {
+        'version': BUNDLE_VERSION,
+        'systemVersion': version,
+        'digest': hashlib.sha256(body.encode('utf-8')).hexdigest(),
+        'templates': templates,
+    }
+    return json.dumps(bundle, ensure_ascii=False, separators=(',', ':'), sort_keys=True) + '\n'
+
+def main():
+    default_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description="Pack templates/ into one JSON bundle and check partial references")
+    parser.add_argument('--root', default=default_root, help="system root (default: this repository)")
+    parser.add_argument('--out', help=f"bundle path (default: <root>/{TEMPLATE_DIR}/{BUNDLE_NAME})")
+    parser.add_argument('--check', action='store_true',
+                        help="only check references and whether the bundle is up to date")
+    args = parser.parse_args()
+    out = args.out or os.path.join(args.root, TEMPLATE_DIR, BUNDLE_NAME)
+
+    templates = collect_templates(args.root)
+    missing = find_missing(templates, args.root)
+    references = sum(len(partial_references(source)) for source in templates.values())
+    print(f"📄 {len(templates)} templates, {references} partial references")
+    if missing:
+        print(f"❌ {len(missing)} references to missing templates:")
+        for referrer, name in missing:
+            print(f"  - {referrer} -> {name}")
+        return 1
+
+    text = build_bundle(templates, system_version(args.root))
+    current = None
+    if os.path.exists(out):
+        with open(out, 'r', encoding='utf-8') as f:
+            current = f.read()
+    if args.check:
+        print(f"{'✅' if current == text else '🔄'} {out}: {'up to date' if current == text else 'would change'}")
+        return 0 if current == text else 1
+    if current == text:
+        print(f"✅ {out}: unchanged")
+    else:
+        with open(out, 'w', encoding='utf-8') as f:
+            f.write(text)
+        size = sum(len(source.encode('utf-8')) for source in templates.values())
+        print(f"📄 {out}: written ({size / 1024:.1f} KB of templates -> {len(text.encode('utf-8')) / 1024:.1f} KB)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
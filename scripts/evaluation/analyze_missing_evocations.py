@@ -3,106 +3,29 @@
 Analyze the 4 missing evocations to identify exactly what's missing
 """
 
-import re
+from wodsource import SourceDocument
+from evaluate_lore_extraction import clean_lore_name, load_extracted_data, load_source_data
 
-def load_source_data():
-    """Load the source lore.md file"""
-    with open('datasource/D20/lore.md', 'r', encoding='utf-8') as f:
-        content = f.read()
-    return content
-
-def load_extracted_data():
-    """Load the extracted lore.json file"""
-    import json
-    with open('datasource/D20/lore.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return data
-
-def parse_source_lores(content: str):
-    """Parse source lores from lore.md"""
+def parse_source_lores(document: SourceDocument):
+    """Collect source lores, counting every bullet as an evocation"""
     lores = {}
     
-    # Skip the comment section at the beginning
-    content_start = content.find('TTTCommon lore')
-    if content_start == -1:
-        content_start = content.find('@@Lore of the Fundament')
-    if content_start == -1:
-        content_start = 0
-    
-    relevant_content = content[content_start:]
-    
-    # Find all lore sections using @@ marker across all house sections
-    lore_pattern = r'@@([^\n]+)'
-    lore_matches = list(re.finditer(lore_pattern, relevant_content))
-    
-    for i, match in enumerate(lore_matches):
-        lore_name = match.group(1).strip()
-        
-        # Clean up the lore name (remove ## markers and extra spaces)
-        lore_name = lore_name.replace('##', '').strip()
-        
-        # Normalize the name for better comparison
-        normalized_name = lore_name.lower().replace(' ', '').replace('loreof', 'lore of')
-        
-        # Skip if it's not actually a lore (like empty or ## markers)
-        if not lore_name or lore_name == '##' or 'lore' not in normalized_name:
+    for lore in document.lores:
+        lore_name = clean_lore_name(lore.name)
+        if not lore_name:
             continue
         
-        # Fix common OCR issues
-        if 'loreof' in lore_name.lower():
-            lore_name = lore_name.lower().replace('loreof', 'Lore of')
-        if 'lof' in lore_name.lower():
-            lore_name = lore_name.lower().replace('lof', 'Lore of')
-            
-        # Find the end of this lore section by processing line by line like the extraction script
-        start_pos = match.end()
-        
-        # Process lines to find the correct boundary
-        lines = relevant_content[start_pos:].split('\n')
-        lore_content_lines = []
-        
-        for line in lines:
-            line_stripped = line.strip()
-            
-            # Stop at next lore, house, or apocalyptic form (same logic as extraction script)
-            if (line_stripped.startswith('@@') or 
-                (line_stripped.startswith('##') and re.match(r'^##[A-Z][a-zA-Z]+', line_stripped)) or
-                line_stripped.startswith('xx') or
-                (line_stripped.startswith('TTT') and not line_stripped.endswith('TTT'))):
-                break
-            
-            lore_content_lines.append(line)
-        
-        lore_content = '\n'.join(lore_content_lines).strip()
-        
         lores[lore_name] = {
             'name': lore_name,
-            'content': lore_content,
-            'evocations': parse_source_evocations(lore_content)
+            'content': lore.body.text.strip(),
+            'evocations': [
+                {'level': evocation.level, 'name': evocation.name}
+                for evocation in lore.evocations
+            ]
         }
     
     return lores
 
-def parse_source_evocations(lore_content: str):
-    """Parse evocations from lore content using bullet point format"""
-    evocations = []
-    
-    # Find evocation sections using bullet points (•, ••, •••, etc.)
-    evocation_pattern = r'(•+)\s*([^\n]+?)(?=\n|$)'
-    evocation_matches = list(re.finditer(evocation_pattern, lore_content, re.MULTILINE))
-    
-    for match in evocation_matches:
-        bullets = match.group(1)  # •, ••, •••, etc.
-        evocation_name = match.group(2).strip()
-        level = len(bullets)  # Count bullets to determine level
-        
-        evocations.append({
-            'level': level,
-            'name': evocation_name,
-        })
-    
-    return evocations
-
 def analyze_missing_evocations():
     content = load_source_data()
     extracted_data = load_extracted_data()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Benchmark the evaluation pipeline on synthetic corpora.
+
+For each scale a corpus is generated in memory (see
+generate_synthetic_corpus.py) and four stages are timed, best of --repeat:
+
+    parse      tokenize lore.md into a SourceDocument and decode both JSON files
+    normalize  OCR-normalize every lore, evocation, visage and power name
+    match      pair source lores and visages with their extracted entries
+    report     build the per-lore and per-form comparisons and the JSON diff
+
+Timings are compared with a stored baseline and the run fails when a stage
+is slower than baseline * (1 + --tolerance). Record a baseline for this
+machine with --update-baseline; it is kept next to this script. Without a
+baseline nothing is compared and the run exits 2.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict
+
+from evaluate_apocalyptic_extraction import compare_form, parse_source_apocalyptic_forms
+from evaluate_apocalyptic_extraction import normalize_name as normalize_form_name
+from evaluate_lore_extraction import compare_lore, parse_source_lores
+from evaluate_lore_extraction import normalize_name as normalize_lore_name
+from generate_synthetic_corpus import generate_corpus
+from wodsource import (
+    diff_lore_presence,
+    diff_report,
+    match_names,
+    normalize_batch,
+    parse_document,
+)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+STAGES = ('parse', 'normalize', 'match', 'report')
+# Differences below this many seconds are treated as noise
+MIN_REGRESSION = 0.005
+
+def best_of(repeat: int, func: Callable):
+    """(result of the last run, best wall time in seconds)"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+def benchmark_scale(scale: int, repeat: int) -> Dict[str, float]:
+    """Time every stage on one corpus"""
+    source, lore_data, forms_data = generate_corpus(scale)
+    source_bytes = source.encode('utf-8')
+    lore_json = json.dumps(lore_data)
+    forms_json = json.dumps(forms_data)
+    timings = {}
+
+    def parse():
+        return parse_document(source_bytes), json.loads(lore_json), json.loads(forms_json)
+    (document, extracted_lores, extracted_forms), timings['parse'] = best_of(repeat, parse)
+
+    names = [lore.name for lore in document.lores]
+    names += [evocation.name for lore in document.lores for evocation in lore.evocations]
+    names += [visage.name for visage in document.visages]
+    names += [power.name for visage in document.visages for power in visage.powers]
+    _, timings['normalize'] = best_of(repeat, lambda: normalize_batch(names))
+
+    source_lores = parse_source_lores(document)
+    source_forms = parse_source_apocalyptic_forms(document)
+    lore_entries = {lore['name']: lore for lore in extracted_lores['lorePaths']}
+    form_entries = {form['name']: form for form in extracted_forms['apocalypticForms']}
+
+    def match():
+        return (
+            match_names(source_lores, lore_entries, normalize=normalize_lore_name),
+            match_names(source_forms, form_entries, normalize=normalize_form_name),
+        )
+    (lore_matches, form_matches), timings['match'] = best_of(repeat, match)
+
+    def report():
+        entries = diff_lore_presence(source_lores, lore_entries.values(), normalize_lore_name)
+        for name, lore_match in lore_matches.items():
+            if lore_match:
+                entries.extend(compare_lore(name, source_lores[name], lore_entries[lore_match.candidate])['diff'])
+        form_issues = {
+            name: compare_form(name, source_forms[name], form_entries[form_match.candidate])
+            for name, form_match in form_matches.items() if form_match
+        }
+        return json.dumps({'lore': diff_report(entries, 'lore.md', 'lore.json'), 'forms': form_issues})
+    _, timings['report'] = best_of(repeat, report)
+
+    return timings
+
+def load_baseline(path: str) -> Dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def find_regressions(results: Dict, baseline: Dict, tolerance: float):
+    """(scale, stage, baseline, current) for every stage past the tolerance"""
+    regressions = []
+    for scale, timings in results.items():
+        for stage, current in timings.items():
+            previous = baseline.get(scale, {}).get(stage)
+            if previous is None:
+                continue
+            if current > previous * (1 + tolerance) and current - previous > MIN_REGRESSION:
+                regressions.append((scale, stage, previous, current))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parse/normalize/match/report on synthetic corpora")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help="corpus sizes relative to the real book (default: 1 10 100)")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per stage; the best is kept")
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help="allowed slowdown over the baseline as a fraction (default 0.5)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="store these timings as the new baseline")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("⏱️  EVALUATION PIPELINE BENCHMARK")
+    print("=" * 70)
+    print(f"{'scale':>6}  " + ''.join(f"{stage:>12}" for stage in STAGES))
+
+    results = {}
+    for scale in args.scales:
+        timings = benchmark_scale(scale, args.repeat)
+        results[f"{scale}x"] = timings
+        print(f"{scale:>5}x  " + ''.join(f"{timings[stage] * 1000:10.1f}ms" for stage in STAGES))
+
+    if args.update_baseline:
+        baseline = load_baseline(args.baseline)
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\n📄 Baseline updated: {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print(f"\n❌ No baseline at {args.baseline}; nothing compared. Run with --update-baseline to record one")
+        return 2
+
+    regressions = find_regressions(results, baseline, args.tolerance)
+    if not regressions:
+        print(f"\n✅ No stage slower than baseline by more than {args.tolerance:.0%}")
+        return 0
+
+    print(f"\n❌ REGRESSIONS ({len(regressions)}):")
+    for scale, stage, previous, current in regressions:
+        print(f"  {scale} {stage}: {previous * 1000:.1f}ms → {current * 1000:.1f}ms "
+              f"({current / previous:.2f}x)")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass OCR normalizer against the old chain of re.sub calls.
+
+Names come from datasource/D20/lore.md when it is present, otherwise from a
+built-in sample, and are repeated to reach --names entries.
+"""
+
+import argparse
+import os
+import re
+import time
+
+from wodsource import load_document, normalize_batch, normalize_power_name
+
+SAMPLE_NAMES = [
+    "Bel, the visaGeoF the celestials",
+    "ereshkiGal, visaGeoF the realms",
+    "Qingu, the Visage of radianCe",
+    "Zaltu, the viSage the Beast",
+    "•SPHEREOF CHAOS",
+    "••WAVEOF MUTILATION",
+    "•••SUMMON OUTSIDER",
+    "•LASHOF CORRUPTION",
+    "••VISIONOF TERROR",
+    "• liGht",
+    "•• maniPulate Gravity",
+    "••• shaPe Matter",
+]
+
+def legacy_normalize_ocr_text(text: str) -> str:
+    """The sequential chain the debug scripts used before the compiled engine"""
+    if not text:
+        return text
+    text = re.sub(r'visaGeoF', 'the Visage of', text, flags=re.IGNORECASE)
+    text = re.sub(r'viSage', 'the Visage of', text, flags=re.IGNORECASE)
+    text = re.sub(r'the\s+the\s+Visage\s+of', 'the Visage of', text, flags=re.IGNORECASE)
+    text = re.sub(r'of\s+of+', 'of', text)
+    text = re.sub(r'the\s+the+', 'the', text)
+    text = re.sub(r'\bthe Visage of\b', 'the Visage of', text)
+    return text
+
+def legacy_normalize_power_name(power_name: str) -> str:
+    """The sequential power name chain from debug_power_parsing.py"""
+    name = legacy_normalize_ocr_text(power_name)
+    name = re.sub(r'([A-Z]+)OF\s+([A-Z]+)', r'\1 of \2', name)
+    name = re.sub(r'([A-Z]+)OF([A-Z]+)', r'\1 of \2', name)
+    name = re.sub(r'([A-Z]+)THE\s+([A-Z]+)', r'\1 the \2', name)
+    name = re.sub(r'([A-Z]+)THE([A-Z]+)', r'\1 the \2', name)
+    name = re.sub(r'([a-z])([A-Z])([a-z])', r'\1\2\3', name)
+    bullets = ''
+    if name.startswith('•'):
+        bullets = '•' * (len(name) - len(name.lstrip('•')))
+        name = name.lstrip('•').strip()
+    name = name.replace('liGht', 'Light')
+    name = name.replace('maniPulate', 'Manipulate')
+    name = name.replace('shaPe', 'Shape')
+    return bullets + name.capitalize()
+
+def load_corpus(size: int):
+    """Visage, lore, evocation and power names, repeated up to size entries"""
+    names = []
+    if os.path.exists('datasource/D20/lore.md'):
+        document = load_document('datasource/D20/lore.md')
+        for lore in document.lores:
+            names.append(lore.name)
+            names.extend(e.header.text.strip() for e in lore.evocations)
+        for visage in document.visages:
+            names.append(visage.name)
+            names.extend(p.header.text.strip().split(':', 1)[0] for p in visage.powers)
+    if not names:
+        names = list(SAMPLE_NAMES)
+    return (names * (size // len(names) + 1))[:size]
+
+def timed(label: str, func, names):
+    start = time.perf_counter()
+    result = func(names)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:28} {elapsed * 1000:9.2f} ms  ({elapsed / len(names) * 1e6:6.2f} µs/name)")
+    return result, elapsed
+
+def benchmark_normalization(size: int):
+    names = load_corpus(size)
+    print("=" * 60)
+    print(f"⏱️  OCR NORMALIZATION BENCHMARK ({len(names)} names)")
+    print("=" * 60)
+    
+    legacy, legacy_time = timed("legacy re.sub chain", lambda ns: [legacy_normalize_power_name(n) for n in ns], names)
+    single, _ = timed("compiled engine, per name", lambda ns: [normalize_power_name(n) for n in ns], names)
+    batch, batch_time = timed("compiled engine, batch", normalize_batch, names)
+    
+    print(f"\n🚀 Batch speedup over legacy: {legacy_time / batch_time:.1f}x")
+    
+    assert single == batch, "batch and per-name results differ"
+    mismatches = sorted({(n, old, new) for n, old, new in zip(names, legacy, batch) if old != new})
+    print(f"\n🔍 Names normalized differently from the legacy chain: {len(mismatches)}")
+    for name, old, new in mismatches[:20]:
+        print(f"  '{name}': legacy '{old}' → engine '{new}'")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark OCR name normalization")
+    parser.add_argument('--names', type=int, default=100000, help="number of names to normalize")
+    args = parser.parse_args()
+    benchmark_normalization(args.names)
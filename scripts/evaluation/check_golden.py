@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Regression check against a golden manifest of per-entity hashes.
+
+Every extracted lore, evocation, visage, power and Earthbound feature, and
+every lore/visage section of lore.md, is hashed (see wodsource/snapshot.py)
+and compared with the golden manifest. Only the entities whose hash changed
+are re-evaluated, with the same comparisons the full evaluators use, so a
+one-line data fix re-checks one lore instead of all of them.
+
+    python scripts/evaluation/check_golden.py --update   # record the golden manifest
+    python scripts/evaluation/check_golden.py            # re-evaluate what changed since
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Set
+
+from evaluate_apocalyptic_extraction import compare_form, parse_source_apocalyptic_forms
+from evaluate_apocalyptic_extraction import normalize_name as normalize_form_name
+from evaluate_earthbound_apocalyptic_extraction import cost_category, count_source_features
+from evaluate_lore_extraction import clean_lore_name, compare_lore, parse_source_lores
+from evaluate_lore_extraction import normalize_name as normalize_lore_name
+from wodsource import (
+    ADDED,
+    REMOVED,
+    NameIndex,
+    compare_manifests,
+    file_digest,
+    hash_features,
+    hash_forms,
+    hash_lores,
+    hash_source,
+    load_document_cached,
+    load_json_cached,
+    load_manifest,
+    write_manifest,
+)
+
+SOURCE_PATH = 'datasource/D20/lore.md'
+LORE_PATH = 'datasource/D20/lore.json'
+FORMS_PATH = 'datasource/D20/apocalyptic_forms.json'
+FEATURES_PATH = 'datasource/D20/apocalyptic_powers.json'
+EARTHBOUND_SOURCE_PATH = 'datasource/D20/earthbound-apocaliptic.md'
+DEFAULT_MANIFEST = 'datasource/D20/golden_manifest.json'
+
+def _load(path: str):
+    return load_json_cached(path) if os.path.exists(path) else None
+
+def _lore_key(name: str) -> str:
+    cleaned = clean_lore_name(name)
+    return normalize_lore_name(cleaned) if cleaned else ''
+
+def current_entities(document, lore_data, forms_data, features_data) -> Dict[str, str]:
+    """Hashes of every extracted and source entity that exists now"""
+    entities = {}
+    entities.update(hash_lores(lore_data))
+    entities.update(hash_forms(forms_data))
+    entities.update(hash_features(features_data))
+    if document is not None:
+        entities.update(hash_source(document, _lore_key, normalize_form_name))
+    if os.path.exists(EARTHBOUND_SOURCE_PATH):
+        entities['source-earthbound:features'] = file_digest(EARTHBOUND_SOURCE_PATH)
+    return entities
+
+def _split(key: str):
+    kind, _, name = key.partition(':')
+    return kind, name
+
+def check_lores(document, lore_data, changed: Dict[str, Set], issues: Dict[str, List[str]]):
+    """Re-compare the lores that own a changed lore/evocation hash"""
+    extracted = {}
+    for key in ('lorePaths', 'blackKnowledge'):
+        for lore in (lore_data or {}).get(key) or []:
+            extracted[lore.get('id')] = lore
+    source_lores = parse_source_lores(document) if document is not None else {}
+    source_by_key = {normalize_lore_name(name): (name, lore) for name, lore in source_lores.items()}
+    extracted_by_key = {normalize_lore_name(lore['name']): identifier for identifier, lore in extracted.items()}
+
+    # A changed source section re-checks the lore extracted from it
+    for key in changed.pop('source-lore', set()):
+        if key in extracted_by_key:
+            changed['lore'].add(extracted_by_key[key])
+        elif key in source_by_key:
+            issues[f"source-lore:{key}"].append("Source lore has no extracted counterpart")
+
+    for identifier in sorted(changed['lore']):
+        lore = extracted.get(identifier)
+        if lore is None:
+            continue
+        source = source_by_key.get(normalize_lore_name(lore['name']))
+        if source is None:
+            issues[f"lore:{identifier}"].append("Extracted lore not found in lore.md")
+            continue
+        result = compare_lore(source[0], source[1], lore)
+        for entry in result['diff']:
+            issues[f"lore:{identifier}"].append(
+                f"Level {entry['level']}: {entry['kind']}"
+                + (f" (source '{entry.get('source')}', extracted '{entry.get('extracted')}')"
+                   if entry.get('source') or entry.get('extracted') else ''))
+
+def check_forms(document, forms_data, changed: Dict[str, Set], issues: Dict[str, List[str]]):
+    """Re-compare the visages that own a changed visage/power hash"""
+    extracted = {form.get('id'): form for form in (forms_data or {}).get('apocalypticForms') or []}
+    source_forms = parse_source_apocalyptic_forms(document) if document is not None else {}
+    source_index = NameIndex(source_forms, normalize=normalize_form_name)
+    extracted_by_key = {normalize_form_name(form['name']): identifier for identifier, form in extracted.items()}
+    source_keys = {normalize_form_name(name) for name in source_forms}
+
+    for key in changed.pop('source-visage', set()):
+        if key in extracted_by_key:
+            changed['visage'].add(extracted_by_key[key])
+        elif key in source_keys:
+            issues[f"source-visage:{key}"].append("Source visage has no extracted counterpart")
+
+    for identifier in sorted(changed['visage']):
+        form = extracted.get(identifier)
+        if form is None:
+            continue
+        match = source_index.match(form['name'])
+        if match is None:
+            issues[f"visage:{identifier}"].append("Extracted visage not found in lore.md")
+            continue
+        issues[f"visage:{identifier}"].extend(compare_form(match.candidate, source_forms[match.candidate], form))
+
+def check_features(features_data, changed: Dict[str, Set], issues: Dict[str, List[str]]):
+    """Field checks for changed features; a changed source book re-counts all of them"""
+    features = (features_data or {}).get('apocalypticPowers') or []
+    if changed.pop('source-earthbound', None) and os.path.exists(EARTHBOUND_SOURCE_PATH):
+        with open(EARTHBOUND_SOURCE_PATH, 'r', encoding='utf-8') as f:
+            source_counts = count_source_features(f.read())
+        extracted_counts = defaultdict(int)
+        for feature in features:
+            cost = feature.get('pointCost')
+            extracted_counts[cost_category(cost) if isinstance(cost, int) else 'other'] += 1
+        for category, count in source_counts.items():
+            if extracted_counts[category] != count:
+                issues['source-earthbound:features'].append(
+                    f"{category}: {count} in source, {extracted_counts[category]} extracted")
+        changed['feature'].update(feature.get('id') for feature in features if feature.get('id'))
+
+    wanted = changed['feature']
+    for feature in features:
+        identifier = feature.get('id')
+        if identifier not in wanted:
+            continue
+        key = f"feature:{identifier}"
+        if not feature.get('name'):
+            issues[key].append("Missing name")
+        if not isinstance(feature.get('pointCost'), int):
+            issues[key].append("Missing pointCost")
+        description = feature.get('description', '')
+        if not description:
+            issues[key].append("Missing description")
+        elif 'POINT FEATURES' in description:
+            issues[key].append("Description contains section header contamination")
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-evaluate only the entities changed since the golden manifest")
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST, help=f"golden manifest (default {DEFAULT_MANIFEST})")
+    parser.add_argument('--update', action='store_true', help="record the current hashes as the golden manifest")
+    parser.add_argument('--json', metavar='PATH', help="write changes and issues as JSON")
+    args = parser.parse_args()
+
+    inputs = (SOURCE_PATH, LORE_PATH, FORMS_PATH)
+    if not any(os.path.exists(path) for path in inputs):
+        print(f"❌ None of {', '.join(inputs)} found; run from the directory that holds datasource/")
+        return 2
+
+    start = time.perf_counter()
+    document = load_document_cached(SOURCE_PATH) if os.path.exists(SOURCE_PATH) else None
+    lore_data, forms_data, features_data = _load(LORE_PATH), _load(FORMS_PATH), _load(FEATURES_PATH)
+    entities = current_entities(document, lore_data, forms_data, features_data)
+
+    golden = None if args.update else load_manifest(args.manifest)
+    if golden is None:
+        if not entities:
+            print(f"❌ No entities found; refusing to record an empty golden manifest")
+            return 2
+        write_manifest(args.manifest, entities)
+        verb = "Recorded" if args.update else "No golden manifest yet; creating a baseline:"
+        print(f"📄 {verb} {len(entities)} entities in {args.manifest} (nothing compared)")
+        return 0
+
+    changes = compare_manifests(golden, entities)
+    # Removed entities are not among the current ones, so they are counted apart
+    removed = sum(1 for change in changes.values() if change == REMOVED)
+    print("=" * 80)
+    print(f"🔍 GOLDEN CHECK: {len(changes) - removed} of {len(entities)} entities added or changed, "
+          f"{removed} removed")
+    print("=" * 80)
+
+    # Group the changed keys by entity kind; evocations and powers re-check their
+    # owner, and removed entities re-check whatever still refers to them
+    changed: Dict[str, Set] = defaultdict(set)
+    for key in changes:
+        kind, name = _split(key)
+        if kind == 'evocation':
+            changed['lore'].add(name.rsplit('.', 1)[0])
+        elif kind == 'power':
+            changed['visage'].add(name.rsplit('.', 1)[0])
+        elif kind == 'feature':
+            changed['feature'].add(name.split('#', 1)[0])
+        else:
+            changed[kind].add(name)
+
+    issues: Dict[str, List[str]] = defaultdict(list)
+    rechecked = {kind: len(names) for kind, names in changed.items()}
+    check_lores(document, lore_data, changed, issues)
+    check_forms(document, forms_data, changed, issues)
+    check_features(features_data, changed, issues)
+    elapsed = time.perf_counter() - start
+
+    icons = {ADDED: '➕', REMOVED: '➖'}
+    for key, change in sorted(changes.items()):
+        print(f"{icons.get(change, '🔄')} {key}: {change}")
+    if rechecked:
+        print(f"\n🔁 Re-evaluated: " + ', '.join(f"{count} {kind}" for kind, count in sorted(rechecked.items())))
+
+    failing = {key: found for key, found in issues.items() if found}
+    if failing:
+        print(f"\n❌ ISSUES IN CHANGED ENTITIES:")
+        for key, found in sorted(failing.items()):
+            print(f"  {key}")
+            for issue in found:
+                print(f"    - {issue}")
+    else:
+        print(f"\n✅ No issues in changed entities")
+    print(f"⏱️  {elapsed * 1000:.1f} ms")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'changes': changes, 'issues': failing}, f, indent=2, ensure_ascii=False, sort_keys=True)
+            f.write('\n')
+        print(f"📄 JSON report: {args.json}")
+    return 1 if failing else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
-import json
+from wodsource import load_json_cached
 
 def check_power_counts():
     """Check power counts for all apocalyptic forms"""
-    with open('datasource/D20/apocalyptic_forms.json', 'r') as f:
-        data = json.load(f)
+    data = load_json_cached('datasource/D20/apocalyptic_forms.json')
     
     print("🔍 APOCALYPTIC FORM POWER COUNTS")
     print("=" * 50)
@@ -37,6 +36,11 @@ def check_power_counts():
             print(f"\n{form['name']} ({form['house']}): {form['count']} powers")
             for i, power in enumerate(form['powers'], 1):
                 print(f"  {i}. {power}")
+    
+    return {
+        'total_forms': len(data['apocalypticForms']),
+        'incorrect_forms': incorrect_forms
+    }
 
 if __name__ == "__main__":
     check_power_counts()
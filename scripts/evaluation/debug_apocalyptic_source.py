@@ -5,24 +5,19 @@ Debug script to see what's actually in the source for apocalyptic forms
 
 import re
 
-def load_source_data():
-    """Load the source lore.md file"""
-    with open('datasource/D20/lore.md', 'r', encoding='utf-8') as f:
-        content = f.read()
-    return content
+from wodsource import load_document
 
 def debug_apocalyptic_source():
-    content = load_source_data()
+    document = load_document('datasource/D20/lore.md')
     
     # Find a specific form to analyze
     target_form = "Zaltu, the visaGeoF the Beast"
     
     # Find the form section
-    form_pattern = rf'xx{re.escape(target_form)}\s*\n(.*?)(?=\nxx|\n##|\Z)'
-    form_match = re.search(form_pattern, content, re.DOTALL | re.MULTILINE)
+    visage = next((v for v in document.visages if v.name == target_form), None)
     
-    if form_match:
-        form_content = form_match.group(1)
+    if visage:
+        form_content = visage.body.text
         print(f"Found: {target_form}")
         print("=" * 80)
         print("Full content:")
@@ -1,38 +1,17 @@
 #!/usr/bin/env python3
-import re
-
-def normalize_ocr_text(text: str) -> str:
-    """Normalize OCR variations consistently"""
-    if not text:
-        return text
-    
-    # Handle specific OCR patterns more carefully
-    text = re.sub(r'visaGeoF', 'the Visage of', text, flags=re.IGNORECASE)
-    text = re.sub(r'viSage', 'the Visage of', text, flags=re.IGNORECASE)
-    text = re.sub(r'the\s+the\s+Visage\s+of', 'the Visage of', text, flags=re.IGNORECASE)
-    text = re.sub(r'of\s+of+', 'of', text)
-    text = re.sub(r'the\s+the+', 'the', text)
-    text = re.sub(r'\bthe Visage of\b', 'the Visage of', text)
-    return text
+from wodsource import load_document, normalize_power_name
 
 def debug_bel_parsing():
     """Debug Bel's power parsing"""
-    with open('datasource/D20/lore.md', 'r', encoding='utf-8') as f:
-        content = f.read()
+    document = load_document('datasource/D20/lore.md')
     
     # Find and extract Bel's section
-    bel_start = content.find('xxBel, the visaGeoF the celestials')
-    if bel_start == -1:
+    bel = document.find_visage('Bel, the visaGeoF the celestials')
+    if not bel:
         print("Bel section not found!")
         return
     
-    # Find the end of Bel's section
-    next_xx = content.find('\nxx', bel_start + 1)
-    if next_xx == -1:
-        next_xx = len(content)
-    
-    bel_section = content[bel_start:next_xx]
-    lines = bel_section.strip().split('\n')
+    lines = [bel.header.text] + bel.body.text.strip().split('\n')
     
     print("🔍 BEL'S POWER PARSING DEBUG:")
     print("=" * 50)
@@ -73,26 +52,8 @@ def debug_bel_parsing():
                 power_name = line.strip()
                 power_desc = ""
             
-            # Normalize power name
-            normalized_name = normalize_ocr_text(power_name)
-            # Fix specific evocation name patterns
-            normalized_name = re.sub(r'([A-Z]+)OF\s+([A-Z]+)', r'\1 of \2', normalized_name)
-            normalized_name = re.sub(r'([A-Z]+)OF([A-Z]+)', r'\1 of \2', normalized_name)
-            normalized_name = re.sub(r'([A-Z]+)THE\s+([A-Z]+)', r'\1 the \2', normalized_name)
-            normalized_name = re.sub(r'([A-Z]+)THE([A-Z]+)', r'\1 the \2', normalized_name)
-            # Fix weird capitalization patterns
-            normalized_name = re.sub(r'([a-z])([A-Z])([a-z])', r'\1\2\3', normalized_name)
-            # Fix specific known patterns (preserve bullet points)
-            bullets = ''
-            if normalized_name.startswith('•'):
-                bullets = '•' * (len(normalized_name) - len(normalized_name.lstrip('•')))
-                normalized_name = normalized_name.lstrip('•').strip()
-            # Apply fixes
-            normalized_name = normalized_name.replace('liGht', 'Light')
-            normalized_name = normalized_name.replace('maniPulate', 'Manipulate') 
-            normalized_name = normalized_name.replace('shaPe', 'Shape')
-            # Capitalize first letter only
-            normalized_name = bullets + normalized_name.capitalize()
+            # Normalize power name (OCR fixes, word splitting, casing; bullets kept)
+            normalized_name = normalize_power_name(power_name)
             
             power_data = {
                 'name': normalized_name,
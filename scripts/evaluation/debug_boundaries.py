@@ -1,31 +1,17 @@
 #!/usr/bin/env python3
-import re
+from wodsource import load_document
 
 def debug_boundaries():
     """Debug what's causing boundary detection to trigger for Bel"""
-    with open('datasource/D20/lore.md', 'r', encoding='utf-8') as f:
-        content = f.read()
+    document = load_document('datasource/D20/lore.md')
     
     # Find Bel's section
-    bel_start = content.find('xxBel, the visaGeoF the celestials')
-    if bel_start == -1:
+    bel = document.find_visage('Bel, the visaGeoF the celestials')
+    if not bel:
         print("Bel section not found!")
         return
     
-    # Extract Bel's section using the same logic as the extraction script
-    sections = re.split(r'\nxx', content)
-    bel_section = None
-    
-    for section in sections:
-        if 'Bel, the visaGeoF the celestials' in section:
-            bel_section = section
-            break
-    
-    if not bel_section:
-        print("Bel section not found in split sections!")
-        return
-    
-    lines = bel_section.strip().split('\n')
+    lines = [bel.name] + bel.body.text.strip().split('\n')
     
     print("🔍 BEL'S SECTION BOUNDARY DEBUG:")
     print("=" * 50)
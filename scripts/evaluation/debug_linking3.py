@@ -1,14 +1,10 @@
 #!/usr/bin/env python3
-import json
+from wodsource import LazyJSONFile
 
-# Load data
-with open('datasource/D20/apocalyptic_forms.json', 'r') as f:
-    apocalyptic_data = json.load(f)
-
-# Create mapping
-apocalyptic_mapping = {}
-for form in apocalyptic_data['apocalypticForms']:
-    apocalyptic_mapping[form['name']] = form['id']
+# Create mapping from the offset index; no form is decoded
+with LazyJSONFile('datasource/D20/apocalyptic_forms.json') as apocalyptic_data:
+    apocalyptic_mapping = dict(zip(apocalyptic_data.names('apocalypticForms'),
+                                   apocalyptic_data.ids('apocalypticForms')))
 
 # Test the exact names from the JSON
 test_names = [
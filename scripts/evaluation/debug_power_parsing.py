@@ -1,38 +1,17 @@
 #!/usr/bin/env python3
-import re
-
-def normalize_ocr_text(text: str) -> str:
-    """Normalize OCR variations consistently"""
-    if not text:
-        return text
-    
-    text = re.sub(r'visaGeoF', 'the Visage of', text, flags=re.IGNORECASE)
-    text = re.sub(r'viSage', 'the Visage of', text, flags=re.IGNORECASE)
-    text = re.sub(r'the\s+the\s+Visage\s+of', 'the Visage of', text, flags=re.IGNORECASE)
-    text = re.sub(r'of\s+of+', 'of', text)
-    text = re.sub(r'the\s+the+', 'the', text)
-    text = re.sub(r'\bthe Visage of\b', 'the Visage of', text)
-    return text
+from wodsource import load_document, normalize_ocr_text, normalize_power_name
 
 def debug_power_parsing():
     """Debug the power parsing logic step by step"""
-    with open('datasource/D20/lore.md', 'r', encoding='utf-8') as f:
-        content = f.read()
+    document = load_document('datasource/D20/lore.md')
     
     # Find Bel's section
-    sections = re.split(r'\nxx', content)
-    bel_section = None
-    
-    for section in sections:
-        if 'Bel, the visaGeoF the celestials' in section:
-            bel_section = section
-            break
-    
-    if not bel_section:
+    bel = document.find_visage('Bel, the visaGeoF the celestials')
+    if not bel:
         print("Bel section not found!")
         return
     
-    lines = bel_section.strip().split('\n')
+    lines = [bel.name] + bel.body.text.strip().split('\n')
     
     print("🔍 BEL'S POWER PARSING STEP-BY-STEP:")
     print("=" * 50)
@@ -76,24 +55,8 @@ def debug_power_parsing():
             normalized_power_name = normalize_ocr_text(power_name)
             print(f"   After OCR normalize: '{normalized_power_name}'")
             
-            # Fix specific evocation name patterns
-            normalized_power_name = re.sub(r'([A-Z]+)OF\s+([A-Z]+)', r'\1 of \2', normalized_power_name)
-            normalized_power_name = re.sub(r'([A-Z]+)OF([A-Z]+)', r'\1 of \2', normalized_power_name)
-            normalized_power_name = re.sub(r'([A-Z]+)THE\s+([A-Z]+)', r'\1 the \2', normalized_power_name)
-            normalized_power_name = re.sub(r'([A-Z]+)THE([A-Z]+)', r'\1 the \2', normalized_power_name)
-            # Fix weird capitalization patterns
-            normalized_power_name = re.sub(r'([a-z])([A-Z])([a-z])', r'\1\2\3', normalized_power_name)
-            # Fix specific known patterns (preserve bullet points)
-            bullets = ''
-            if normalized_power_name.startswith('•'):
-                bullets = '•' * (len(normalized_power_name) - len(normalized_power_name.lstrip('•')))
-                normalized_power_name = normalized_power_name.lstrip('•').strip()
-            # Apply fixes
-            normalized_power_name = normalized_power_name.replace('liGht', 'Light')
-            normalized_power_name = normalized_power_name.replace('maniPulate', 'Manipulate') 
-            normalized_power_name = normalized_power_name.replace('shaPe', 'Shape')
-            # Capitalize first letter only
-            normalized_power_name = bullets + normalized_power_name.capitalize()
+            # Split concatenated words, fix known OCR words and recase, keeping bullets
+            normalized_power_name = normalize_power_name(power_name)
             
             print(f"   Final normalized: '{normalized_power_name}'")
             print(f"   Section: {current_section}")
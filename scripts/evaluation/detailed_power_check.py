@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
-import json
+from wodsource import load_json_cached
 
 def detailed_power_check():
     """Detailed check of all power counts"""
-    with open('datasource/D20/apocalyptic_forms.json', 'r') as f:
-        data = json.load(f)
+    data = load_json_cached('datasource/D20/apocalyptic_forms.json')
     
     print("🔍 DETAILED POWER COUNT ANALYSIS:")
     print("=" * 60)
@@ -34,6 +33,12 @@ def detailed_power_check():
     print(f"Correct (8 powers): {correct_count}")
     print(f"Incorrect (!=8 powers): {incorrect_count}")
     print(f"Accuracy: {correct_count/total_forms*100:.1f}%")
+    
+    return {
+        'total_forms': total_forms,
+        'correct_count': correct_count,
+        'incorrect_count': incorrect_count
+    }
 
 if __name__ == "__main__":
     detailed_power_check()
@@ -3,32 +3,46 @@
 Comprehensive evaluation of apocalyptic forms extraction from lore.md
 """
 
+import argparse
 import re
-import json
 from typing import Dict, List, Set
 
-def load_source_data():
-    """Load the source lore.md file"""
-    with open('datasource/D20/lore.md', 'r', encoding='utf-8') as f:
-        content = f.read()
-    return content
+from wodsource import (
+    NameIndex,
+    SourceDocument,
+    StageProfiler,
+    Visage,
+    file_digest,
+    load_document_cached,
+    load_document_incremental,
+    load_json_cached,
+    match_names,
+    print_profile,
+    remember_results,
+    reusable_results,
+    source_location,
+)
+
+SOURCE_PATH = 'datasource/D20/lore.md'
+EXTRACTED_PATH = 'datasource/D20/apocalyptic_forms.json'
+# Incremental state of per-entity results (renamed when their format changes)
+RESULTS_KIND = 'form-results-v2'
+
+def load_source_data() -> SourceDocument:
+    """Load and parse the source lore.md file (cached by content hash)"""
+    return load_document_cached(SOURCE_PATH)
 
 def load_extracted_data():
-    """Load the extracted apocalyptic_forms.json file"""
-    with open('datasource/D20/apocalyptic_forms.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return data
+    """Load the extracted apocalyptic_forms.json file (cached by content hash)"""
+    return load_json_cached(EXTRACTED_PATH)
 
-def parse_source_apocalyptic_forms(content: str) -> Dict[str, Dict]:
-    """Parse apocalyptic forms from lore.md"""
+def parse_source_apocalyptic_forms(document: SourceDocument) -> Dict[str, Dict]:
+    """Collect apocalyptic forms from the parsed lore.md tree"""
     forms = {}
     
-    # Find all apocalyptic form sections using xx marker
-    form_pattern = r'^xx([^\n]+)'
-    form_matches = list(re.finditer(form_pattern, content, re.MULTILINE))
-    
-    for match in form_matches:
-        form_name = match.group(1).strip()
+    # Each xx section runs until the next form, house, or section marker
+    for visage in document.visages:
+        form_name = visage.name
         
         # Skip format instruction lines
         if ('indicate' in form_name.lower() or 
@@ -36,65 +50,28 @@ def parse_source_apocalyptic_forms(content: str) -> Dict[str, Dict]:
             'will indicate' in form_name.lower()):
             continue
         
-        # Find the end of this form section (next xx, ##, or end)
-        start_pos = match.end()
-        
-        # Process lines to find the correct boundary
-        lines = content[start_pos:].split('\n')
-        form_content_lines = []
-        
-        for line in lines:
-            line_stripped = line.strip()
-            
-            # Stop at next form, house, or section marker
-            if (line_stripped.startswith('xx') or 
-                (line_stripped.startswith('##') and re.match(r'^##[A-Z][a-zA-Z]+', line_stripped)) or
-                line_stripped.startswith('TTT') and not line_stripped.endswith('TTT')):
-                break
-            
-            form_content_lines.append(line)
-        
-        form_content = '\n'.join(form_content_lines).strip()
-        
         forms[form_name] = {
             'name': form_name,
-            'content': form_content,
-            'powers': parse_form_powers(form_content)
+            'content': visage.body,  # SourceView; .text when needed
+            'line': visage.line,
+            'powers': parse_form_powers(visage)
         }
     
     return forms
 
-def parse_form_powers(form_content: str) -> List[Dict]:
-    """Parse powers from apocalyptic form content"""
+def parse_form_powers(visage: Visage) -> List[Dict]:
+    """Parse powers from the bullet entries of an apocalyptic form"""
     powers = []
     
-    # Find power sections using bullet points (•, ••, etc.)
-    power_pattern = r'(•+)\s*([^\n]+?)(?=\n|$)'
-    power_matches = list(re.finditer(power_pattern, form_content, re.MULTILINE))
-    
-    for match in power_matches:
-        bullets = match.group(1)
-        power_name = match.group(2).strip()
-        is_high_torment = bullets.count('•') > 1  # Multiple bullets = high torment
-        
-        # Extract description (everything after the name until next bullet or end)
-        desc_start = match.end()
-        remaining_content = form_content[desc_start:]
-        
-        # Find the next bullet point or end of section
-        next_bullet_match = re.search(r'\n•', remaining_content)
-        if next_bullet_match:
-            description = remaining_content[:next_bullet_match.start()].strip()
-        else:
-            description = remaining_content.strip()
-        
-        # Clean up description
-        description = re.sub(r'\n+', ' ', description).strip()
+    for power in visage.powers:
+        # Description is everything after the name until the next bullet or end
+        description = re.sub(r'\n+', ' ', power.description.text).strip()
         
         powers.append({
-            'name': power_name,
+            'name': power.name,
             'description': description,
-            'isHighTorment': is_high_torment
+            'isHighTorment': power.is_high_torment,  # Multiple bullets = high torment
+            'line': power.line
         })
     
     return powers
@@ -103,16 +80,91 @@ def normalize_name(name: str) -> str:
     """Normalize name for comparison"""
     return re.sub(r'[^a-zA-Z0-9\s]', '', name.lower()).strip()
 
-def evaluate_apocalyptic_extraction():
+def form_id(name: str) -> str:
+    """The apocalyptic_forms.json id of a form: every non-alphanumeric character becomes '_'"""
+    return re.sub(r'[^a-zA-Z0-9]', '_', name.lower())
+
+def where(line: int) -> str:
+    """' (lore.md:LINE)' suffix for a diagnostic, '' when the line is unknown"""
+    found = source_location(SOURCE_PATH, line)
+    return f" ({found})" if found else ''
+
+def describe_match(match) -> str:
+    """'exact (normalized)' when the names only differ in spacing, else the similarity
+    
+    Fuzzy scores ignore spaces, so 'visaGeoF' scores 1.0 against 'Visage of'
+    without being an exact hit; real fuzzy scores get three places so a near
+    miss never reads as 1.00.
+    """
+    if match.exact or match.score >= 1.0:
+        return "exact (normalized)"
+    return f"similarity {match.score:.3f}"
+
+def missing_powers(source_form: Dict, extracted_form: Dict) -> List[Dict]:
+    """Source powers of a form with no extracted power of the same normalized name"""
+    extracted_power_names = {normalize_name(p['name']) for p in extracted_form['powers']}
+    return [p for p in source_form['powers'] if normalize_name(p['name']) not in extracted_power_names]
+
+def compare_form(source_name: str, source_form: Dict, extracted_form: Dict) -> List[str]:
+    """Compare one source form with its extracted counterpart and list the issues
+    
+    Issues carry no source line numbers, so they compare equal across runs
+    (watch mode, --json reports, incremental reuse); the report adds locations.
+    """
+    issues = []
+    
+    # Check powers
+    source_powers = source_form['powers']
+    extracted_powers = extracted_form['powers']
+    
+    if len(source_powers) != len(extracted_powers):
+        issues.append(f"Power count mismatch: {len(source_powers)} vs {len(extracted_powers)}")
+    
+    # Check power names
+    source_power_names = {normalize_name(p['name']) for p in source_powers}
+    extracted_power_names = {normalize_name(p['name']) for p in extracted_powers}
+    
+    missing = source_power_names - extracted_power_names
+    extra_powers = extracted_power_names - source_power_names
+    
+    if missing:
+        issues.append(f"Missing powers: {sorted(missing)}")
+    if extra_powers:
+        issues.append(f"Extra powers: {sorted(extra_powers)}")
+    
+    # Check ID format
+    expected_id = form_id(source_name)
+    if extracted_form['id'] != expected_id:
+        issues.append(f"ID mismatch: expected '{expected_id}', got '{extracted_form['id']}'")
+    
+    # Check house assignment
+    if 'house' not in extracted_form or extracted_form['house'] == 'Unknown':
+        issues.append("House not assigned or Unknown")
+    
+    # Check associated lore
+    if not extracted_form.get('associatedLore'):
+        issues.append("No associated lore linked")
+    
+    return issues
+
+def evaluate_apocalyptic_extraction(incremental: bool = False, profile: bool = False,
+                                    profile_dump: str = None):
+    profiler = StageProfiler(profile, profile_dump)
     print("=" * 80)
     print("🔍 APOCALYPTIC FORMS EXTRACTION EVALUATION")
     print("=" * 80)
     
     # Load data
-    source_content = load_source_data()
+    profiler.stage('file_load')
+    if incremental:
+        source_content, changes = load_document_incremental(SOURCE_PATH, RESULTS_KIND)
+    else:
+        source_content, changes = load_source_data(), None
+    profiler.stage('json_decode')
     extracted_data = load_extracted_data()
     
     # Parse source
+    profiler.stage('source_parse')
     source_forms = parse_source_apocalyptic_forms(source_content)
     
     # Get extracted forms
@@ -130,76 +182,64 @@ def evaluate_apocalyptic_extraction():
         'power_completeness': {},
         'id_issues': [],
         'house_issues': [],
-        'lore_linking_issues': []
+        'lore_linking_issues': [],
+        'fuzzy_matches': {}
     }
     
-    # Check for missing forms
+    # In incremental mode, forms outside the edited sections keep last run's issues
+    reusable = {}
+    if incremental:
+        extracted_digest = file_digest(EXTRACTED_PATH)
+        changed_names = changes.visages if changes else set()
+        reusable = reusable_results(RESULTS_KIND, SOURCE_PATH, changes, extracted_digest, changed_names)
+    recompared = 0
+    
+    # Pair source and extracted forms once: exact names first, then OCR-tolerant fuzzy matches
+    profiler.stage('normalization')
+    extracted_index = NameIndex(extracted_forms.keys(), normalize_name)
+    profiler.stage('matching')
+    matches = match_names(source_forms.keys(), extracted_index)
+    
     for source_name, source_form in source_forms.items():
-        normalized_source = normalize_name(source_name)
+        match = matches[source_name]
+        if match is None:
+            metrics['missing_forms'].append(source_name)
+            continue
         
-        # Find matching extracted form
-        found = False
-        for extracted_name, extracted_form in extracted_forms.items():
-            if normalize_name(extracted_name) == normalized_source:
-                found = True
-                
-                # Compare details
-                issues = []
-                
-                # Check powers
-                source_powers = source_form['powers']
-                extracted_powers = extracted_form['powers']
-                
-                if len(source_powers) != len(extracted_powers):
-                    issues.append(f"Power count mismatch: {len(source_powers)} vs {len(extracted_powers)}")
-                
-                # Check power names
-                source_power_names = {normalize_name(p['name']) for p in source_powers}
-                extracted_power_names = {normalize_name(p['name']) for p in extracted_powers}
-                
-                missing_powers = source_power_names - extracted_power_names
-                extra_powers = extracted_power_names - source_power_names
-                
-                if missing_powers:
-                    issues.append(f"Missing powers: {list(missing_powers)}")
-                if extra_powers:
-                    issues.append(f"Extra powers: {list(extra_powers)}")
-                
-                # Check ID format
-                expected_id = re.sub(r'[^a-zA-Z0-9]', '_', source_name.lower())
-                if extracted_form['id'] != expected_id:
-                    issues.append(f"ID mismatch: expected '{expected_id}', got '{extracted_form['id']}'")
-                
-                # Check house assignment
-                if 'house' not in extracted_form or extracted_form['house'] == 'Unknown':
-                    issues.append("House not assigned or Unknown")
-                
-                # Check associated lore
-                if not extracted_form.get('associatedLore'):
-                    issues.append("No associated lore linked")
-                
-                metrics['form_accuracy'][source_name] = issues
-                break
+        # Compare details
+        issues = reusable.get(source_name)
+        if issues is None:
+            issues = compare_form(source_name, source_form, extracted_forms[match.candidate])
+            if not match.exact:
+                issues.insert(0, f"Name mismatch: extracted as '{match.candidate}' ({describe_match(match)})")
+            recompared += 1
         
-        if not found:
-            metrics['missing_forms'].append(source_name)
+        metrics['form_accuracy'][source_name] = issues
+        if not match.exact:
+            metrics['fuzzy_matches'][source_name] = match
     
-    # Check for extra forms
-    extracted_normalized = {normalize_name(name): name for name in extracted_forms.keys()}
-    source_normalized = {normalize_name(name): name for name in source_forms.keys()}
+    if incremental:
+        remember_results(RESULTS_KIND, SOURCE_PATH, extracted_digest, metrics['form_accuracy'])
     
-    for norm_name, extracted_name in extracted_normalized.items():
-        if norm_name not in source_normalized:
+    # Check for extra forms
+    matched = {match.candidate for match in matches.values() if match}
+    for extracted_name in extracted_forms:
+        if extracted_name not in matched:
             metrics['extra_forms'].append(extracted_name)
     
     # Detailed analysis
+    profiler.stage('report')
     print(f"\n🔍 DETAILED ANALYSIS:")
     
     for form_name, issues in metrics['form_accuracy'].items():
-        print(f"\n📚 {form_name}")
+        print(f"\n📚 {form_name}{where(source_forms[form_name].get('line'))}")
         if issues:
             for issue in issues:
                 print(f"   ❌ {issue}")
+            # Locations come from the current document, never from reused results
+            extracted_form = extracted_forms[matches[form_name].candidate]
+            for power in missing_powers(source_forms[form_name], extracted_form):
+                print(f"      ↳ {power['name']}{where(power.get('line'))}")
         else:
             print(f"   ✅ No issues found")
     
@@ -211,12 +251,16 @@ def evaluate_apocalyptic_extraction():
     print(f"\n📈 COMPLETENESS:")
     print(f"Missing forms: {len(metrics['missing_forms'])}")
     for form in metrics['missing_forms']:
-        print(f"  - {form}")
+        print(f"  - {form}{where(source_forms[form].get('line'))}")
     
     print(f"Extra forms: {len(metrics['extra_forms'])}")
     for form in metrics['extra_forms']:
         print(f"  - {form}")
     
+    print(f"Fuzzy-matched forms: {len(metrics['fuzzy_matches'])}")
+    for form, match in metrics['fuzzy_matches'].items():
+        print(f"  - {form} -> {match.candidate} ({describe_match(match)})")
+    
     print(f"\n🎯 ACCURACY:")
     total_issues = sum(len(issues) for issues in metrics['form_accuracy'].values())
     print(f"Total accuracy issues: {total_issues}")
@@ -229,6 +273,23 @@ def evaluate_apocalyptic_extraction():
         print("❌ EXTRACTION QUALITY: NEEDS IMPROVEMENT")
     
     print(f"\nTotal issues found: {total_issues + len(metrics['missing_forms']) + len(metrics['extra_forms'])}")
+    
+    if incremental:
+        print(f"\n♻️  Incremental: re-compared {recompared} of {len(metrics['form_accuracy'])} forms")
+    
+    metrics['profile'] = profiler.finish()
+    print_profile(metrics['profile'])
+    
+    return metrics
 
 if __name__ == "__main__":
-    evaluate_apocalyptic_extraction()
+    parser = argparse.ArgumentParser(description="Evaluate apocalyptic_forms.json against lore.md")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only re-compare forms in sections edited since the last incremental run")
+    parser.add_argument('--profile', action='store_true',
+                        help="record wall time and peak memory per stage")
+    parser.add_argument('--profile-dump', metavar='PATH',
+                        help="also write cProfile stats to PATH (implies --profile)")
+    args = parser.parse_args()
+    evaluate_apocalyptic_extraction(incremental=args.incremental, profile=args.profile,
+                                    profile_dump=args.profile_dump)
@@ -4,86 +4,74 @@ Evaluation script for Earthbound Apocalyptic Powers extraction
 Calculates completeness metrics and validates extraction quality
 """
 
-import json
-import re
+import argparse
 from typing import Dict, List, Set
 
+from wodsource import (
+    LineIndex,
+    StageProfiler,
+    find_duplicates,
+    load_json_cached,
+    load_text_cached,
+    print_profile,
+    scan_point_features,
+)
+
+SOURCE_PATH = 'datasource/D20/earthbound-apocaliptic.md'
+FREE_FEATURES = r'Face\s+of\s+Terror'
+COST_CATEGORIES = {0: 'free', 1: 'one', 2: 'two', 3: 'three', 4: 'four'}
+
 def load_source_data():
-    """Load the source earthbound-apocaliptic.md file"""
-    with open('datasource/D20/earthbound-apocaliptic.md', 'r', encoding='utf-8') as f:
-        content = f.read()
-    return content
+    """Load the source earthbound-apocaliptic.md file (cached by content hash)"""
+    return load_text_cached(SOURCE_PATH)
 
 def load_extracted_data():
-    """Load the extracted apocalyptic_powers.json file"""
-    with open('datasource/D20/apocalyptic_powers.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return data
+    """Load the extracted apocalyptic_powers.json file (cached by content hash)"""
+    return load_json_cached('datasource/D20/apocalyptic_powers.json')
+
+def cost_category(cost: int) -> str:
+    """'free', 'one' ... 'four', then '5-point' and up for larger lists"""
+    return COST_CATEGORIES.get(cost, f"{cost}-point")
 
 def count_source_features(content: str) -> Dict[str, int]:
     """Count features in source markdown by point cost"""
-    counts = {'free': 0, 'one': 0, 'two': 0, 'three': 0, 'four': 0}
-    
-    # Count free feature (Face of Terror)
-    if re.search(r'Face\s+of\s+Terror:', content, re.IGNORECASE):
-        counts['free'] = 1
+    counts = {category: 0 for category in COST_CATEGORIES.values()}
     
-    # Count bullet points in each section
-    for point_cost in [1, 2, 3, 4]:
-        section_pattern = rf'{point_cost}-POINT\s+FEATURES'
-        section_match = re.search(section_pattern, content, re.IGNORECASE)
-        
-        if section_match:
-            start_pos = section_match.end()
-            next_section_pattern = r'\d+-POINT\s+FEATURES|TOTAL:\s*\d+'
-            next_match = re.search(next_section_pattern, content[start_pos:])
-            
-            if next_match:
-                section_content = content[start_pos:start_pos + next_match.start()]
-            else:
-                section_content = content[start_pos:]
-            
-            # Count bullet points
-            bullet_count = len(re.findall(r'•\s*[^:]+:', section_content))
-            
-            if point_cost == 1:
-                counts['one'] = bullet_count
-            elif point_cost == 2:
-                counts['two'] = bullet_count
-            elif point_cost == 3:
-                counts['three'] = bullet_count
-            elif point_cost == 4:
-                counts['four'] = bullet_count
+    # One scan splits every N-POINT FEATURES section; the free feature is filed under 0
+    for cost, features in sorted(scan_point_features(content, free=FREE_FEATURES).items()):
+        counts[cost_category(cost)] = len(features)
     
     return counts
 
-def validate_extraction_quality(source_counts: Dict[str, int], extracted_data: Dict) -> Dict:
+def locate_feature(content: str, lines: LineIndex, name: str) -> str:
+    """'earthbound-apocaliptic.md:LINE' of a feature name, '' when not found"""
+    if not content or not name:
+        return ''
+    offset = content.find(f"{name}:")
+    return lines.location(offset) if offset >= 0 else ''
+
+def validate_extraction_quality(source_counts: Dict[str, int], extracted_data: Dict,
+                                source_content: str = None) -> Dict:
     """Validate extraction quality and calculate metrics"""
     extracted_features = extracted_data.get('apocalypticPowers', [])
+    lines = LineIndex.build(source_content or '', SOURCE_PATH)
     
     # Count extracted features by point cost
-    extracted_counts = {'free': 0, 'one': 0, 'two': 0, 'three': 0, 'four': 0}
+    extracted_counts = {category: 0 for category in source_counts}
     
     for feature in extracted_features:
         cost = feature.get('pointCost', 0)
-        if cost == 0:
-            extracted_counts['free'] += 1
-        elif cost == 1:
-            extracted_counts['one'] += 1
-        elif cost == 2:
-            extracted_counts['two'] += 1
-        elif cost == 3:
-            extracted_counts['three'] += 1
-        elif cost == 4:
-            extracted_counts['four'] += 1
+        if isinstance(cost, int):
+            category = cost_category(cost)
+            extracted_counts[category] = extracted_counts.get(category, 0) + 1
     
     # Calculate completeness for each category
     completeness = {}
     total_source = 0
     total_extracted = 0
     
-    for category in ['free', 'one', 'two', 'three', 'four']:
-        source_count = source_counts[category]
+    for category in extracted_counts:
+        source_count = source_counts.get(category, 0)
         extracted_count = extracted_counts[category]
         
         if source_count > 0:
@@ -97,32 +85,46 @@ def validate_extraction_quality(source_counts: Dict[str, int], extracted_data: D
     # Overall completeness
     overall_completeness = (total_extracted / total_source * 100) if total_source > 0 else 0
     
-    # Check for issues
+    # Check for issues; locations are kept apart so issues compare equal across runs
     issues = []
+    locations = {}
+    
+    def issue(text: str, name: str = None):
+        issues.append(text)
+        found = locate_feature(source_content, lines, name)
+        if found:
+            locations[text] = found
     
     # Check Face of Terror description contamination
     face_of_terror = next((f for f in extracted_features if f['id'] == 'face_of_terror'), None)
     if face_of_terror:
         desc = face_of_terror.get('description', '')
         if '1-POINT FEATURES' in desc or 'The features listed here are available to all Earthbound' in desc:
-            issues.append("Face of Terror description contains section header contamination")
+            issue("Face of Terror description contains section header contamination", face_of_terror.get('name'))
     
     # Check for missing required fields
     for i, feature in enumerate(extracted_features):
+        name = feature.get('name')
         if not feature.get('id'):
-            issues.append(f"Feature {i}: Missing ID")
-        if not feature.get('name'):
-            issues.append(f"Feature {i}: Missing name")
+            issue(f"Feature {i}: Missing ID", name)
+        if not name:
+            issue(f"Feature {i}: Missing name")
         if feature.get('pointCost') is None:
-            issues.append(f"Feature {i}: Missing pointCost")
+            issue(f"Feature {i}: Missing pointCost", name)
         if not feature.get('description'):
-            issues.append(f"Feature {i}: Missing description")
+            issue(f"Feature {i}: Missing description", name)
     
     # Check for duplicate IDs
     ids = [f.get('id') for f in extracted_features if f.get('id')]
-    duplicate_ids = [id for id in set(ids) if ids.count(id) > 1]
+    duplicate_ids = find_duplicates(ids)
+    duplicates = []
     if duplicate_ids:
         issues.append(f"Duplicate IDs found: {duplicate_ids}")
+        for feature in extracted_features:
+            if feature.get('id') in duplicate_ids:
+                found = locate_feature(source_content, lines, feature.get('name'))
+                if found:
+                    duplicates.append(f"'{feature['id']}' from {feature.get('name')} ({found})")
     
     return {
         'source_counts': source_counts,
@@ -132,36 +134,45 @@ def validate_extraction_quality(source_counts: Dict[str, int], extracted_data: D
         'total_source': total_source,
         'total_extracted': total_extracted,
         'issues': issues,
+        'locations': locations,
+        'duplicates': duplicates,
         'metadata': extracted_data.get('metadata', {})
     }
 
-def main():
+def main(profile: bool = False, profile_dump: str = None):
     """Main evaluation function"""
+    profiler = StageProfiler(profile, profile_dump)
     print("==================================")
     print("EARTHBOUND APOCALYPTIC POWERS EVALUATION")
     print("==================================")
     
     # Load data
     try:
+        profiler.stage('file_load')
         source_content = load_source_data()
+        profiler.stage('json_decode')
         extracted_data = load_extracted_data()
     except Exception as e:
+        profiler.finish()
         print(f"ERROR: Could not load data: {e}")
         return
     
     # Count source features
     print("Analyzing source data...")
+    profiler.stage('source_parse')
     source_counts = count_source_features(source_content)
     print(f"Source feature counts: {source_counts}")
     
     # Validate extraction
     print("\nValidating extraction...")
-    results = validate_extraction_quality(source_counts, extracted_data)
+    profiler.stage('matching')
+    results = validate_extraction_quality(source_counts, extracted_data, source_content)
     
     # Print results
+    profiler.stage('report')
     print(f"\nSource vs Extracted Comparison:")
-    for category in ['free', 'one', 'two', 'three', 'four']:
-        source = results['source_counts'][category]
+    for category in results['extracted_counts']:
+        source = results['source_counts'].get(category, 0)
         extracted = results['extracted_counts'][category]
         completeness = results['completeness'][category]
         print(f"  {category.capitalize()}: {source} → {extracted} ({completeness:.1f}%)")
@@ -175,7 +186,10 @@ def main():
     if results['issues']:
         print(f"\nIssues Found ({len(results['issues'])}):")
         for issue in results['issues']:
-            print(f"  ⚠️  {issue}")
+            found = results['locations'].get(issue)
+            print(f"  ⚠️  {issue}" + (f" ({found})" if found else ''))
+        for duplicate in results['duplicates']:
+            print(f"      {duplicate}")
     else:
         print(f"\n✅ No issues found!")
     
@@ -195,8 +209,17 @@ def main():
     print("EVALUATION COMPLETE")
     print("==================================")
     
+    results['profile'] = profiler.finish()
+    print_profile(results['profile'])
+    
     # Return results for potential use in scripts
     return results
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Evaluate apocalyptic_powers.json against earthbound-apocaliptic.md")
+    parser.add_argument('--profile', action='store_true',
+                        help="record wall time and peak memory per stage")
+    parser.add_argument('--profile-dump', metavar='PATH',
+                        help="also write cProfile stats to PATH (implies --profile)")
+    args = parser.parse_args()
+    main(profile=args.profile, profile_dump=args.profile_dump)
@@ -4,123 +4,106 @@ Comprehensive evaluation script for lore extraction accuracy.
 Compares extracted lore.json with source lore.md to ensure 100% correctness.
 """
 
-import json
+import argparse
 import re
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set
 from collections import defaultdict
 
-def load_source_data():
-    """Load the source lore.md file"""
-    with open('datasource/D20/lore.md', 'r', encoding='utf-8') as f:
-        content = f.read()
-    return content
+from wodsource import (
+    EXTRA,
+    MISSING,
+    RENAMED,
+    Lore,
+    SourceDocument,
+    StageProfiler,
+    as_text,
+    diff_evocations,
+    diff_lore_presence,
+    diff_report,
+    file_digest,
+    load_document_cached,
+    load_document_incremental,
+    load_json_cached,
+    lore_id,
+    print_profile,
+    remember_results,
+    source_location,
+    reusable_results,
+    write_diff_report,
+)
+
+SOURCE_PATH = 'datasource/D20/lore.md'
+EXTRACTED_PATH = 'datasource/D20/lore.json'
+# Incremental state of per-entity results (renamed when their format changes)
+RESULTS_KIND = 'lore-results'
+SYSTEM_PATTERN = re.compile(rb'\nSystem:', re.IGNORECASE)
+
+def load_source_data() -> SourceDocument:
+    """Load and parse the source lore.md file (cached by content hash)"""
+    return load_document_cached(SOURCE_PATH)
 
 def load_extracted_data():
-    """Load the extracted lore.json file"""
-    with open('datasource/D20/lore.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return data
+    """Load the extracted lore.json file (cached by content hash)"""
+    return load_json_cached(EXTRACTED_PATH)
+
+def clean_lore_name(raw_name: str) -> str:
+    """Clean an @@ header into a lore name, or return '' if it is not a lore"""
+    # Clean up the lore name (remove ## markers and extra spaces)
+    lore_name = raw_name.replace('##', '').strip()
+    
+    # Normalize the name for better comparison
+    normalized_name = lore_name.lower().replace(' ', '').replace('loreof', 'lore of')
+    
+    # Skip if it's not actually a lore (like empty or ## markers)
+    if not lore_name or lore_name == '##' or 'lore' not in normalized_name:
+        return ''
+    
+    # Fix common OCR issues
+    if 'loreof' in lore_name.lower():
+        lore_name = lore_name.lower().replace('loreof', 'Lore of')
+    if 'lof' in lore_name.lower():
+        lore_name = lore_name.lower().replace('lof', 'Lore of')
+    if 'loreoF' in lore_name:
+        lore_name = lore_name.replace('loreoF', 'Lore of')
+    return lore_name
 
-def parse_source_lores(content: str) -> Dict[str, Dict]:
-    """Parse source lores from lore.md"""
+def parse_source_lores(document: SourceDocument) -> Dict[str, Dict]:
+    """Collect source lores from the parsed lore.md tree"""
     lores = {}
     
-    # Skip the comment section at the beginning
-    content_start = content.find('TTTCommon lore')
-    if content_start == -1:
-        content_start = content.find('@@Lore of the Fundament')
-    if content_start == -1:
-        content_start = 0
-    
-    relevant_content = content[content_start:]
-    
-    # Find all lore sections using @@ marker across all house sections
-    lore_pattern = r'@@([^\n]+)'
-    lore_matches = list(re.finditer(lore_pattern, relevant_content))
-    
-    for i, match in enumerate(lore_matches):
-        lore_name = match.group(1).strip()
-        
-        # Clean up the lore name (remove ## markers and extra spaces)
-        lore_name = lore_name.replace('##', '').strip()
-        
-        # Normalize the name for better comparison
-        normalized_name = lore_name.lower().replace(' ', '').replace('loreof', 'lore of')
-        
-        # Skip if it's not actually a lore (like empty or ## markers)
-        if not lore_name or lore_name == '##' or 'lore' not in normalized_name:
+    # Each @@ section runs until the next lore, house, or apocalyptic form
+    for lore in document.lores:
+        lore_name = clean_lore_name(lore.name)
+        if not lore_name:
             continue
         
-        # Fix common OCR issues
-        if 'loreof' in lore_name.lower():
-            lore_name = lore_name.lower().replace('loreof', 'Lore of')
-        if 'lof' in lore_name.lower():
-            lore_name = lore_name.lower().replace('lof', 'Lore of')
-        if 'loreoF' in lore_name:
-            lore_name = lore_name.replace('loreoF', 'Lore of')
-            
-        # Find the end of this lore section by processing line by line like the extraction script
-        start_pos = match.end()
-        
-        # Process lines to find the correct boundary
-        lines = relevant_content[start_pos:].split('\n')
-        lore_content_lines = []
-        
-        for line in lines:
-            line_stripped = line.strip()
-            
-            # Stop at next lore, house, or apocalyptic form (same logic as extraction script)
-            if (line_stripped.startswith('@@') or 
-                (line_stripped.startswith('##') and re.match(r'^##[A-Z][a-zA-Z]+', line_stripped)) or
-                line_stripped.startswith('xx') or
-                (line_stripped.startswith('TTT') and not line_stripped.endswith('TTT'))):
-                break
-            
-            lore_content_lines.append(line)
-        
-        lore_content = '\n'.join(lore_content_lines).strip()
-        
         lores[lore_name] = {
             'name': lore_name,
-            'content': lore_content,
-            'evocations': parse_source_evocations(lore_content)
+            'line': lore.line,
+            'content': lore.body,  # SourceView; .text when needed
+            'evocations': parse_source_evocations(lore)
         }
     
     return lores
 
-def parse_source_evocations(lore_content: str) -> List[Dict]:
-    """Parse evocations from lore content using bullet point format"""
+def parse_source_evocations(lore: Lore) -> List[Dict]:
+    """Parse evocations from the bullet entries of a lore"""
     evocations = []
+    buffer = lore.body.buffer
     
-    # Split content by System: sections to avoid counting descriptive bullets
-    sections = re.split(r'\nSystem:', lore_content, flags=re.IGNORECASE)
-    main_content = sections[0]  # Only process bullets before the first System:
-    
-    # Find evocation sections using bullet points (•, ••, •••, etc.)
-    # Also handle - bullets for descriptive items within System: sections
-    evocation_pattern = r'(•+|-)\s*([^\n]+?)(?=\n|$)'
-    evocation_matches = list(re.finditer(evocation_pattern, main_content, re.MULTILINE))
+    # Only bullets before the first System: line are evocations
+    system_match = SYSTEM_PATTERN.search(buffer, lore.header.end, lore.body.end)
+    main_end = system_match.start() if system_match else lore.body.end
     
-    for match in evocation_matches:
-        bullets = match.group(1)  # •, ••, •••, etc. or -
-        evocation_name = match.group(2).strip()
+    for evocation in lore.evocations:
+        if evocation.header.start >= main_end:
+            break
         
-        # Skip - bullets as they're descriptive, not evocations
-        if bullets == '-':
-            continue
-            
-        level = len(bullets)  # Count bullets to determine level
-        
-        # Extract description (everything after the name until next bullet or end)
-        desc_start = match.end()
-        remaining_content = main_content[desc_start:]
-        
-        # Find the next bullet point or end of section
-        next_bullet_match = re.search(r'\n[•-]', remaining_content)
-        if next_bullet_match:
-            description = remaining_content[:next_bullet_match.start()].strip()
-        else:
-            description = remaining_content.strip()
+        # Description runs until the next bullet, a - item, or the System: cut
+        description = as_text(buffer[evocation.description.start:min(evocation.description.end, main_end)])
+        dash_match = re.search(r'\n-', '\n' + description)
+        if dash_match:
+            description = description[:dash_match.start()]
         
         # Clean up description
         description = re.sub(r'\n+', ' ', description).strip()
@@ -130,8 +113,9 @@ def parse_source_evocations(lore_content: str) -> List[Dict]:
         description = re.sub(r'Torment:.*', '', description, flags=re.DOTALL).strip()
         
         evocations.append({
-            'level': level,
-            'name': evocation_name,
+            'level': evocation.level,
+            'name': evocation.name,
+            'line': evocation.line,
             'description': description
         })
     
@@ -141,17 +125,119 @@ def normalize_name(name: str) -> str:
     """Normalize name for comparison"""
     return re.sub(r'\s+', ' ', name.lower().strip())
 
-def evaluate_lore_extraction():
+def where(line: int) -> str:
+    """' (lore.md:LINE)' suffix for a diagnostic, '' when the line is unknown"""
+    found = source_location(SOURCE_PATH, line)
+    return f" ({found})" if found else ''
+
+def compare_lore(source_name: str, source_lore: Dict, extracted_lore: Dict) -> Dict:
+    """Compare one source lore with its extracted counterpart
+    
+    The result holds no line numbers, only which evocation level a report line
+    or issue refers to ('located'), so it stays valid for incremental reuse
+    after lines shift; locate_result() resolves levels against the current
+    source when reporting.
+    """
+    result = {
+        'report': [],
+        'source_evocations': 0,
+        'extracted_evocations': 0,
+        'lore_accuracy': {},
+        'evocation_completeness': {},
+        'ocr_issues': [],
+        'diff': [],
+        'located': {}
+    }
+    located = result['located']
+    
+    # [text, level]: level of the evocation to locate, 0 for the lore header, None for no location
+    def report(text: str, level: Optional[int] = None):
+        result['report'].append([text, level])
+    
+    report(f"\n📚 {source_name}", 0)
+    
+    # Compare evocations
+    source_evs = source_lore['evocations']
+    extracted_evs = extracted_lore['evocations']
+    
+    result['source_evocations'] = len(source_evs)
+    result['extracted_evocations'] = len(extracted_evs)
+    
+    report(f"   Source evocations: {len(source_evs)}")
+    report(f"   Extracted evocations: {len(extracted_evs)}")
+    
+    # Both sides are indexed by level once; the diff entries drive the report
+    identifier = extracted_lore.get('id') or lore_id(source_name)
+    result['diff'] = diff_evocations(source_name, identifier, source_evs, extracted_evs, normalize_name)
+    
+    for entry in result['diff']:
+        level = entry['level']
+        if entry['kind'] == MISSING:
+            report(f"   ❌ Level {level}: Missing evocation", level)
+            key = f"{source_name}_level_{level}"
+            result['evocation_completeness'][key] = "missing"
+        elif entry['kind'] == EXTRA:
+            report(f"   ⚠️  Level {level}: Extra evocation: {entry['extracted']}")
+            key = f"{source_name}_level_{level}"
+            result['evocation_completeness'][key] = "extra"
+            continue
+        elif entry['kind'] == RENAMED:
+            report(f"   ⚠️  Level {level}: Name mismatch", level)
+            report(f"      Source: '{entry['source']}'")
+            report(f"      Extracted: '{entry['extracted']}'")
+            key = f"{source_name}_level_{level}_name"
+            result['lore_accuracy'][key] = "mismatch"
+        else:
+            report(f"   ⚠️  Level {level}: Description differs", level)
+            continue
+        located[key] = level
+    
+    # Check for OCR issues in evocations present on both sides
+    source_levels = {ev['level'] for ev in source_evs}
+    for extracted_ev in extracted_evs:
+        level = extracted_ev['level']
+        if level in source_levels and ('loreoF' in extracted_ev['name'].lower() or 'conFess' in extracted_ev['name']):
+            report(f"   🔧 Level {level}: OCR issue detected in name", level)
+            result['ocr_issues'].append(f"{source_name}_level_{level}_name")
+            located[f"{source_name}_level_{level}_name"] = level
+    
+    return result
+
+def locate_result(result: Dict, source_lore: Dict) -> Tuple[List[str], Dict[str, str], List[Dict]]:
+    """(report lines, {issue key: 'lore.md:LINE'}, diff entries) of a comparison, located in the current source"""
+    lines = {ev['level']: ev.get('line') for ev in source_lore['evocations']}
+    lines[0] = source_lore.get('line')
+    report = [text + where(lines.get(level)) if level is not None else text
+              for text, level in result['report']]
+    locations = {}
+    for key, level in result['located'].items():
+        found = source_location(SOURCE_PATH, lines.get(level))
+        if found:
+            locations[key] = found
+    # Diff entries of a reused result may predate a line shift
+    diff = [dict(entry, line=lines.get(entry['level'], entry.get('line'))) if entry.get('level') is not None else entry
+            for entry in result['diff']]
+    return report, locations, diff
+
+def evaluate_lore_extraction(incremental: bool = False, diff_path: str = None,
+                             profile: bool = False, profile_dump: str = None):
     """Main evaluation function"""
+    profiler = StageProfiler(profile, profile_dump)
     print("=" * 80)
     print("🔍 LORE EXTRACTION EVALUATION")
     print("=" * 80)
     
     # Load data
-    source_content = load_source_data()
+    profiler.stage('file_load')
+    if incremental:
+        source_content, changes = load_document_incremental(SOURCE_PATH, RESULTS_KIND)
+    else:
+        source_content, changes = load_source_data(), None
+    profiler.stage('json_decode')
     extracted_data = load_extracted_data()
     
     # Parse source
+    profiler.stage('source_parse')
     source_lores = parse_source_lores(source_content)
     
     # Get extracted lores
@@ -176,80 +262,68 @@ def evaluate_lore_extraction():
         'evocation_completeness': {},
         'ocr_issues': [],
         'total_source_evocations': 0,
-        'total_extracted_evocations': 0
+        'total_extracted_evocations': 0,
+        'diff': [],
+        'locations': {}
     }
     
-    # Check for missing lores
-    source_norm_names = {normalize_name(name): name for name in source_lores.keys()}
-    extracted_norm_names = {normalize_name(name): name for name in extracted_lores.keys()}
-    
-    # Include Black Knowledge in the comparison
-    all_extracted_names = set(extracted_norm_names.keys())
-    if extracted_black_knowledge:
-        all_extracted_names.update({normalize_name(name): name for name in extracted_black_knowledge.keys()})
+    # Check for missing and extra lores (Black Knowledge counts as present)
+    profiler.stage('normalization')
+    presence = diff_lore_presence(source_lores, extracted_lores.values(), normalize_name,
+                                  extracted_black_knowledge.values())
+    metrics['missing_lores'] = [entry['lore'] for entry in presence if entry['kind'] == MISSING]
+    metrics['extra_lores'] = [entry['lore'] for entry in presence if entry['kind'] == EXTRA]
+    metrics['diff'] = list(presence)
     
-    for norm_name, original_name in source_norm_names.items():
-        if norm_name not in all_extracted_names:
-            metrics['missing_lores'].append(original_name)
+    extracted_norm_names = {normalize_name(name): name for name in extracted_lores.keys()}
     
-    # Check for extra lores
-    for norm_name, original_name in extracted_norm_names.items():
-        if norm_name not in source_norm_names:
-            metrics['extra_lores'].append(original_name)
+    # In incremental mode, lores outside the edited sections keep last run's result
+    reusable = {}
+    if incremental:
+        extracted_digest = file_digest(EXTRACTED_PATH)
+        changed_names = {clean_lore_name(name) for name in changes.lores} if changes else set()
+        reusable = reusable_results(RESULTS_KIND, SOURCE_PATH, changes, extracted_digest, changed_names)
+    comparisons = {}
+    recompared = 0
     
     # Detailed comparison
+    profiler.stage('matching')
     print(f"\n🔍 DETAILED ANALYSIS:")
     
     for source_name, source_lore in source_lores.items():
         source_norm = normalize_name(source_name)
         
         if source_norm not in extracted_norm_names:
-            print(f"❌ MISSING: {source_name}")
+            print(f"❌ MISSING: {source_name}{where(source_lore.get('line'))}")
             continue
             
         extracted_name = extracted_norm_names[source_norm]
         extracted_lore = extracted_lores[extracted_name]
         
-        print(f"\n📚 {source_name}")
-        
-        # Compare evocations
-        source_evs = source_lore['evocations']
-        extracted_evs = extracted_lore['evocations']
+        result = reusable.get(source_name)
+        if result is None:
+            result = compare_lore(source_name, source_lore, extracted_lore)
+            recompared += 1
+        comparisons[source_name] = result
         
-        metrics['total_source_evocations'] += len(source_evs)
-        metrics['total_extracted_evocations'] += len(extracted_evs)
+        report, locations, diff = locate_result(result, source_lore)
+        for line in report:
+            print(line)
         
-        print(f"   Source evocations: {len(source_evs)}")
-        print(f"   Extracted evocations: {len(extracted_evs)}")
-        
-        # Check each level
-        for level in range(1, 6):
-            source_ev = next((ev for ev in source_evs if ev['level'] == level), None)
-            extracted_ev = next((ev for ev in extracted_evs if ev['level'] == level), None)
-            
-            if source_ev and not extracted_ev:
-                print(f"   ❌ Level {level}: Missing evocation")
-                metrics['evocation_completeness'][f"{source_name}_level_{level}"] = "missing"
-            elif extracted_ev and not source_ev:
-                print(f"   ⚠️  Level {level}: Extra evocation: {extracted_ev['name']}")
-                metrics['evocation_completeness'][f"{source_name}_level_{level}"] = "extra"
-            elif source_ev and extracted_ev:
-                # Compare names
-                source_norm_name = normalize_name(source_ev['name'])
-                extracted_norm_name = normalize_name(extracted_ev['name'])
-                
-                if source_norm_name != extracted_norm_name:
-                    print(f"   ⚠️  Level {level}: Name mismatch")
-                    print(f"      Source: '{source_ev['name']}'")
-                    print(f"      Extracted: '{extracted_ev['name']}'")
-                    metrics['lore_accuracy'][f"{source_name}_level_{level}_name"] = "mismatch"
-                
-                # Check for OCR issues
-                if 'loreoF' in extracted_ev['name'].lower() or 'conFess' in extracted_ev['name']:
-                    print(f"   🔧 Level {level}: OCR issue detected in name")
-                    metrics['ocr_issues'].append(f"{source_name}_level_{level}_name")
+        metrics['total_source_evocations'] += result['source_evocations']
+        metrics['total_extracted_evocations'] += result['extracted_evocations']
+        metrics['lore_accuracy'].update(result['lore_accuracy'])
+        metrics['evocation_completeness'].update(result['evocation_completeness'])
+        metrics['ocr_issues'].extend(result['ocr_issues'])
+        metrics['diff'].extend(diff)
+        metrics['locations'].update(locations)
+    
+    if incremental:
+        remember_results(RESULTS_KIND, SOURCE_PATH, extracted_digest, comparisons)
+        print(f"\n♻️  Incremental: re-compared {recompared} of {len(comparisons)} lores")
     
     # Summary
+    profiler.stage('report')
     print(f"\n" + "=" * 80)
     print("📋 SUMMARY REPORT")
     print("=" * 80)
@@ -258,7 +332,7 @@ def evaluate_lore_extraction():
     print(f"Missing lores: {len(metrics['missing_lores'])}")
     if metrics['missing_lores']:
         for lore in metrics['missing_lores']:
-            print(f"  - {lore}")
+            print(f"  - {lore}{where(source_lores[lore].get('line'))}")
     
     print(f"Extra lores: {len(metrics['extra_lores'])}")
     if metrics['extra_lores']:
@@ -276,12 +350,14 @@ def evaluate_lore_extraction():
     print(f"OCR issues found: {len(metrics['ocr_issues'])}")
     if metrics['ocr_issues']:
         for issue in metrics['ocr_issues']:
-            print(f"  - {issue}")
+            found = metrics['locations'].get(issue)
+            print(f"  - {issue}" + (f" ({found})" if found else ''))
     
     print(f"\nName accuracy issues: {len(metrics['lore_accuracy'])}")
     if metrics['lore_accuracy']:
         for issue, status in metrics['lore_accuracy'].items():
-            print(f"  - {issue}: {status}")
+            found = metrics['locations'].get(issue)
+            print(f"  - {issue}: {status}" + (f" ({found})" if found else ''))
     
     # Overall score
     issues = (len(metrics['missing_lores']) + len(metrics['extra_lores']) + 
@@ -298,7 +374,24 @@ def evaluate_lore_extraction():
     
     print(f"\nTotal issues found: {issues}")
     
+    if diff_path:
+        write_diff_report(diff_report(metrics['diff'], SOURCE_PATH, EXTRACTED_PATH), diff_path)
+    
+    metrics['profile'] = profiler.finish()
+    print_profile(metrics['profile'])
+    
     return metrics
 
 if __name__ == "__main__":
-    evaluate_lore_extraction()
+    parser = argparse.ArgumentParser(description="Evaluate lore.json against lore.md")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only re-compare lores in sections edited since the last incremental run")
+    parser.add_argument('--diff-json', metavar='PATH',
+                        help="write the missing/extra/renamed/description-changed diff as JSON ('-' for stdout)")
+    parser.add_argument('--profile', action='store_true',
+                        help="record wall time and peak memory per stage")
+    parser.add_argument('--profile-dump', metavar='PATH',
+                        help="also write cProfile stats to PATH (implies --profile)")
+    args = parser.parse_args()
+    evaluate_lore_extraction(incremental=args.incremental, diff_path=args.diff_json,
+                             profile=args.profile, profile_dump=args.profile_dump)
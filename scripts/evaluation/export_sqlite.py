@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Export the datasource JSON to SQLite and search it (see wodsource/export.py).
+
+Only files whose content hash changed since the last export are rewritten,
+so running this after every edit is cheap. Run from the repository root:
+
+    python scripts/evaluation/export_sqlite.py --db datasource.sqlite
+    python scripts/evaluation/export_sqlite.py --db datasource.sqlite --search "Ba'al"
+    python scripts/evaluation/export_sqlite.py --db datasource.sqlite --search 'wings OR flight' --raw
+
+--search matches the words as typed; --raw takes FTS5 query syntax instead.
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+
+from wodsource import export_sqlite, search_sqlite
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the datasource to SQLite with a full-text index")
+    parser.add_argument('--root', default='datasource', help="datasource directory (default: datasource)")
+    parser.add_argument('--db', default='datasource.sqlite', help="database file (default: datasource.sqlite)")
+    parser.add_argument('--force', action='store_true', help="re-export every file even if unchanged")
+    parser.add_argument('--search', metavar='QUERY', help="words to search for after the export")
+    parser.add_argument('--raw', action='store_true',
+                        help="treat --search as an FTS5 query (OR, NOT, NEAR, \"phrases\", column:term)")
+    parser.add_argument('--kind', help="restrict --search to one kind (lore, evocation, form, power, ...)")
+    parser.add_argument('--limit', type=int, default=20, help="search hits shown (default 20)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    status = export_sqlite(args.root, args.db, force=args.force)
+    elapsed = time.perf_counter() - start
+
+    icons = {'added': '➕', 'updated': '🔄', 'removed': '➖', 'unchanged': '✅'}
+    for path, state in status.items():
+        print(f"{icons[state]} {path}: {state}")
+    print(f"📄 {args.db} up to date in {elapsed * 1000:.1f} ms")
+
+    if args.search:
+        try:
+            hits = search_sqlite(args.db, args.search, limit=args.limit, kind=args.kind, raw=args.raw)
+        except sqlite3.OperationalError as e:
+            print(f"❌ Invalid search {args.search!r}: {e}")
+            return 2
+        print(f"\n🔍 {len(hits)} hits for {args.search!r}:")
+        for hit in hits:
+            print(f"  {hit['kind']:10} {hit['name']}  [{hit['ref']}]")
+            if hit['snippet']:
+                print(f"             {hit['snippet']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
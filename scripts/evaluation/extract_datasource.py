@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Extract lore.json, apocalyptic_forms.json and apocalyptic_powers.json in one pass.
+
+lore.md is read and tokenized once (wodsource.parse_document); the same
+section tree yields the lore paths, the Black Knowledge lores and the
+visages with their low/high-Torment powers and house. The Earthbound
+point-cost features live in their own book (earthbound-apocaliptic.md),
+which is read once as well. The boundary rules, the form id rule and the
+names are the ones the evaluators check against, imported from them so
+the two cannot drift: names are written as lore.md prints them (OCR
+damage included), since that is what the evaluators compare with.
+
+Output is deterministic: entries keep source order, keys keep a fixed
+order, no timestamps are written, and unchanged files are not rewritten.
+
+    python scripts/evaluation/extract_datasource.py [--out datasource/D20] [--check]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from evaluate_apocalyptic_extraction import form_id, parse_form_powers
+from evaluate_lore_extraction import clean_lore_name, normalize_name, parse_source_evocations
+from wodsource import (
+    SourceDocument,
+    Visage,
+    load_document,
+    lore_id,
+    scan_point_features,
+)
+
+SOURCE_PATH = 'datasource/D20/lore.md'
+EARTHBOUND_SOURCE_PATH = 'datasource/D20/earthbound-apocaliptic.md'
+OUTPUT_DIR = 'datasource/D20'
+
+_SYSTEM = re.compile(r'System:\s*(.*?)\s*(?=Torment:|$)', re.DOTALL)
+_TORMENT = re.compile(r'Torment:\s*(.*?)\s*$', re.DOTALL)
+_CONFERRED_LORE = re.compile(r'lore\s*of\s+(.+)', re.IGNORECASE)
+_FREE_FEATURES = r'Face\s+of\s+Terror'
+# Sentences that introduce a section rather than describe a feature
+_FEATURE_PREAMBLE = re.compile(r'The features listed here.*', re.DOTALL)
+
+def house_name(raw: str) -> str:
+    """'House of Devils' -> 'Devils', 'Common lore' -> 'Common'"""
+    name = re.sub(r'^House\s+of\s+', '', raw.strip(), flags=re.IGNORECASE)
+    return 'Common' if name.lower().startswith('common') else name
+
+def _single_line(text: str) -> str:
+    return re.sub(r'\s+', ' ', text).strip()
+
+def _inside(visages: List[Visage], offset: int) -> Optional[Visage]:
+    """The visage whose section contains offset"""
+    for visage in visages:
+        if visage.header.start <= offset < visage.body.end:
+            return visage
+    return None
+
+def extract_lore_and_forms(document: SourceDocument) -> Tuple[Dict, Dict]:
+    """(lore.json data, apocalyptic_forms.json data) from one section tree"""
+    lore_paths = []
+    black_knowledge = []
+    forms = []
+    conferred = {}  # visage header offset -> conferred lore name
+
+    for house in document.houses:
+        if not house.name:
+            continue
+        house_label = house_name(house.name)
+        target = black_knowledge if 'black knowledge' in house.name.lower() else lore_paths
+        for lore in house.lores:
+            # "@@ this visage confers the Lore of X" lines sit inside a visage
+            visage = _inside(house.visages, lore.header.start)
+            if visage is not None:
+                match = _CONFERRED_LORE.search(lore.name)
+                if match:
+                    conferred[visage.header.start] = match.group(1).strip()
+                continue
+            name = clean_lore_name(lore.name)
+            if not name:
+                continue
+            evocations = []
+            for source, entry in zip(parse_source_evocations(lore), lore.evocations):
+                full_text = _single_line(entry.description.text)
+                system = _SYSTEM.search(full_text)
+                torment = _TORMENT.search(full_text)
+                evocations.append({
+                    'level': source['level'],
+                    'name': source['name'],
+                    'description': source['description'],
+                    'system': system.group(1) if system else '',
+                    'torment': torment.group(1) if torment else '',
+                })
+            target.append({
+                'id': lore_id(name),
+                'name': name,
+                'house': house_label,
+                'evocations': evocations,
+            })
+
+    lore_ids = {normalize_name(lore['name']): lore['id'] for lore in lore_paths + black_knowledge}
+    for house in document.houses:
+        for visage in house.visages:
+            if 'indicate' in visage.name.lower() or 'wildcard' in visage.name.lower():
+                continue
+            name = visage.name
+            lore = conferred.get(visage.header.start)
+            powers = []
+            for power in parse_form_powers(visage):
+                # Bullets read "• Name: description", the description may run on
+                power_name, _, inline = power['name'].partition(':')
+                powers.append({
+                    'name': power_name.strip(),
+                    'description': _single_line(f"{inline} {power['description']}"),
+                    'isHighTorment': power['isHighTorment'],
+                })
+            forms.append({
+                'id': form_id(name),
+                'name': name,
+                'house': house_name(house.name) if house.name else '',
+                'associatedLore': lore_ids.get(normalize_name(f"Lore of {lore}"), '') if lore else '',
+                'powers': powers,
+            })
+
+    lore_data = {'lorePaths': lore_paths}
+    if black_knowledge:
+        lore_data['blackKnowledge'] = black_knowledge
+    return lore_data, {'apocalypticForms': forms}
+
+def extract_earthbound_features(content: str, source_file: str) -> Dict:
+    """apocalyptic_powers.json data from the Earthbound features book, in one scan"""
+    sections = scan_point_features(content, free=_FREE_FEATURES)
+    features = sorted((feature for found in sections.values() for feature in found),
+                      key=lambda feature: feature.start)
+
+    powers = []
+    for feature in features:
+        name = _single_line(feature.name)
+        powers.append({'id': lore_id(name), 'name': name, 'pointCost': feature.cost,
+                       'description': _single_line(_FEATURE_PREAMBLE.sub('', feature.description))})
+    return {
+        'metadata': {'sourceFile': source_file, 'totalFeatures': len(powers)},
+        'apocalypticPowers': powers,
+    }
+
+def serialize(data: Dict) -> str:
+    """Stable JSON text for an output file"""
+    return json.dumps(data, indent=2, ensure_ascii=False) + '\n'
+
+def write_if_changed(path: str, text: str) -> bool:
+    """Write text to path unless it already holds it; True when written"""
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return True
+
+def extract_all(source_path: str = SOURCE_PATH,
+                earthbound_path: str = EARTHBOUND_SOURCE_PATH) -> Dict[str, str]:
+    """{output file name: JSON text} for every artefact whose source exists"""
+    outputs = {}
+    if os.path.exists(source_path):
+        lore_data, forms_data = extract_lore_and_forms(load_document(source_path))
+        outputs['lore.json'] = serialize(lore_data)
+        outputs['apocalyptic_forms.json'] = serialize(forms_data)
+    if os.path.exists(earthbound_path):
+        with open(earthbound_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        outputs['apocalyptic_powers.json'] = serialize(
+            extract_earthbound_features(content, os.path.basename(earthbound_path)))
+    return outputs
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract the D20 lore, form and Earthbound feature JSON")
+    parser.add_argument('--source', default=SOURCE_PATH, help=f"lore book (default {SOURCE_PATH})")
+    parser.add_argument('--earthbound-source', default=EARTHBOUND_SOURCE_PATH,
+                        help=f"Earthbound features book (default {EARTHBOUND_SOURCE_PATH})")
+    parser.add_argument('--out', default=OUTPUT_DIR, help=f"output directory (default {OUTPUT_DIR})")
+    parser.add_argument('--check', action='store_true',
+                        help="only report which outputs would change; exit 1 if any would")
+    args = parser.parse_args()
+
+    outputs = extract_all(args.source, args.earthbound_source)
+    if not outputs:
+        print(f"❌ Neither {args.source} nor {args.earthbound_source} exists")
+        return 1
+
+    changed = []
+    for name, text in outputs.items():
+        path = os.path.join(args.out, name)
+        if args.check:
+            current = None
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    current = f.read()
+            if current != text:
+                changed.append(name)
+            print(f"{'🔄' if current != text else '✅'} {path}: {'would change' if current != text else 'up to date'}")
+            continue
+        os.makedirs(args.out, exist_ok=True)
+        if write_if_changed(path, text):
+            changed.append(name)
+            print(f"📄 {path}: written")
+        else:
+            print(f"✅ {path}: unchanged")
+    return 1 if args.check and changed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
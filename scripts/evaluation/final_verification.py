@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-import json
+from wodsource import load_json_cached
 
 def final_verification():
     """Final verification of all fixes"""
@@ -7,18 +7,17 @@ def final_verification():
     print("=" * 50)
     
     # Check apocalyptic forms
-    with open('datasource/D20/apocalyptic_forms.json', 'r') as f:
-        apoc_data = json.load(f)
+    apoc_data = load_json_cached('datasource/D20/apocalyptic_forms.json')
     
     # Check lore
-    with open('datasource/D20/lore.json', 'r', encoding='utf-8') as f:
-        lore_data = json.load(f)
+    lore_data = load_json_cached('datasource/D20/lore.json')
     
     print("\n📊 APOCALYPTIC FORMS:")
     print(f"Total forms: {len(apoc_data['apocalypticForms'])}")
     
     # Find Ereshkigal
     ereshkigal = None
+    chaos_powers = []
     for form in apoc_data['apocalypticForms']:
         if 'ereshkigal' in form['name'].lower():
             ereshkigal = form
@@ -76,6 +75,15 @@ def final_verification():
     print(f"   - No cross-contamination between sections")
     print(f"   - OCR normalization working for evocation names")
     print(f"   - Proper section boundaries enforced")
+    
+    return {
+        'total_forms': len(apoc_data['apocalypticForms']),
+        'ereshkigal_found': ereshkigal is not None,
+        'ereshkigal_house': ereshkigal['house'] if ereshkigal else None,
+        'chaos_contamination': [p['name'] for p in chaos_powers],
+        'houses': houses,
+        'total_lore_evocations': total_lore_evocations
+    }
 
 if __name__ == "__main__":
     final_verification()
@@ -3,69 +3,54 @@
 Find the exact line numbers where the 4 missing evocations are located
 """
 
-import re
+from wodsource import document_lines, load_document
 
 def load_source_data():
-    """Load the source lore.md file"""
-    with open('datasource/D20/lore.md', 'r', encoding='utf-8') as f:
-        content = f.read()
-    return content
+    """Load and parse the source lore.md file"""
+    return load_document('datasource/D20/lore.md')
 
 def find_missing_evocation_lines():
-    content = load_source_data()
-    lines = content.split('\n')
+    document = load_source_data()
+    lines = document_lines(document)
     
     # Find "Lore of violation" section
     target_lore = "LOREOF VIOLATION"
     
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Check for @@Lore Name@@ or @@Lore Name## markers
-        lore_match = re.match(r'^@@([^@#]+?)(?:##|@@)?$', line)
-        if lore_match:
-            lore_name = lore_match.group(1).strip()
-            
-            if lore_name == target_lore:
-                print(f"Found target lore: {lore_name}")
-                print("=" * 80)
-                
-                # Show context around the missing evocations
-                start_context = max(0, i - 2)
-                end_context = min(len(lines), i + 50)  # Show 50 lines after
-                
-                in_missing_section = False
-                missing_patterns = [
-                    "A point of temporary Faith",
-                    "A point of temporary Willpower", 
-                    "A temporary Ability increase",
-                    "A particular memory or linked set"
-                ]
-                
-                for j in range(start_context, end_context):
-                    line_num = j + 1
-                    line_content = lines[j]
-                    
-                    # Check if this line contains one of the missing evocations
-                    is_missing = any(pattern in line_content for pattern in missing_patterns)
-                    
-                    if is_missing:
-                        in_missing_section = True
-                    
-                    if j == i:
-                        print(f">>> {line_num}: {repr(line_content)}")
-                    elif is_missing or in_missing_section:
-                        print(f"!!! {line_num}: {repr(line_content)}")
-                        # Stop the missing section after we hit a non-missing line
-                        if in_missing_section and not is_missing and line_content.strip() and not line_content.startswith('•'):
-                            in_missing_section = False
-                    elif line_content.startswith('•') or line_content.startswith('xx') or line_content.startswith('##'):
-                        print(f"### {line_num}: {repr(line_content)}")
-                
-                return
-        
-        i += 1
+    lore = next((l for l in document.lores if l.name == target_lore), None)
+    if not lore:
+        return
+    
+    print(f"Found target lore: {lore.name} ({lines.location(lore.header.start)})")
+    print("=" * 80)
+    
+    missing_patterns = [
+        "A point of temporary Faith",
+        "A point of temporary Willpower", 
+        "A temporary Ability increase",
+        "A particular memory or linked set"
+    ]
+    
+    # Search the lore's own bytes; the line index turns each hit into lore.md:LINE
+    for pattern in missing_patterns:
+        offset = document.buffer.find(pattern.encode('utf-8'), lore.header.start, lore.body.end)
+        if offset < 0:
+            print(f"??? not in section: {pattern!r}")
+            continue
+        line_num = lines.line(offset)
+        start, end = lines.span(line_num)
+        print(f"!!! {lines.location(offset)}: {repr(document.view(start, end).text)}")
+    
+    # Show the section outline around them
+    print()
+    first = lines.line(lore.header.start)
+    last = lines.line(max(lore.body.end - 1, lore.header.start))
+    for line_num in range(first, min(last, first + 49) + 1):
+        start, end = lines.span(line_num)
+        line_content = document.view(start, end).text
+        if line_num == first:
+            print(f">>> {line_num}: {repr(line_content)}")
+        elif line_content.startswith('•') or line_content.startswith('xx') or line_content.startswith('##'):
+            print(f"### {line_num}: {repr(line_content)}")
 
 if __name__ == "__main__":
     find_missing_evocation_lines()
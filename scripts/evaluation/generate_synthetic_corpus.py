@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic lore.md books with matching extracted JSON.
+
+Each corpus uses the real markup (TTT house titles, ## houses, @@ lores,
+xx apocalyptic forms and • bullets) and injects the OCR artefacts the
+evaluators have to cope with: loreoF / LOREOF headers, visaGeoF and viSage
+visages, stray capitals, doubled words and XOF Y power names. The JSON
+files hold what an extraction passing the evaluators records (case slips
+corrected, other artefacts kept as printed), so a fresh corpus evaluates
+with no issues; --check verifies that.
+
+A 1x corpus is about the size of the real D20 book; larger scales repeat
+the houses with new names. Output is deterministic for a given seed.
+
+    python scripts/evaluation/generate_synthetic_corpus.py --scales 1 10 --out /tmp/corpora
+
+writes /tmp/corpora/1x/datasource/D20/{lore.md,lore.json,apocalyptic_forms.json}
+and the same for 10x, so an evaluator can be run from inside 1x/.
+
+    python scripts/evaluation/generate_synthetic_corpus.py --scales 1 --out /tmp/corpora --check
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+from typing import Dict, List, Tuple
+
+HOUSES = ['Devils', 'Scourges', 'Malefactors', 'Fiends', 'Defilers', 'Devourers', 'Slayers']
+SUBJECTS = [
+    'Radiance', 'the Celestials', 'the Flesh', 'the Wild', 'the Winds', 'the Realms',
+    'the Spirit', 'Awakening', 'Humanity', 'Storms', 'Transfiguration', 'Paths',
+    'Patterns', 'Forge', 'Longing', 'Death', 'the Firmament', 'Portals', 'Light',
+    'the Deep', 'Violation', 'Chaos', 'Contamination', 'Hunger',
+]
+VISAGE_NAMES = [
+    'Bel', 'Nusku', 'Qingu', 'Ellil', 'Dagan', 'Anshar', 'Mammetum', 'Nergal',
+    'Ninurtu', 'Kishar', 'Antu', 'Adad', 'Zaltu', 'Aruru', 'Namtar', 'Ereshkigal',
+    'Shamash', 'Sin', 'Ninsun', 'Tiamat', 'Apsu',
+]
+WORDS = [
+    'demon', 'mortal', 'power', 'shadow', 'flame', 'voice', 'storm', 'bone',
+    'blood', 'soul', 'gaze', 'wind', 'stone', 'wound', 'oath', 'memory',
+    'faith', 'chain', 'gate', 'veil', 'light', 'dark', 'river', 'hunger',
+]
+VERBS = [
+    'Manipulate', 'Shape', 'Summon', 'Command', 'Quicken', 'Call', 'Bind',
+    'Sever', 'Kindle', 'Shatter', 'Weave', 'Reveal', 'Silence', 'Unmake',
+]
+POWER_NAMES = [
+    'Wings', 'Lordly Mien', 'Enhanced Senses', 'Increased Awareness', 'Claws/Teeth',
+    'Scales', 'Increased Size', 'Dread Gaze', 'Armor', 'Aura of Terror',
+    'Extra Actions', 'Unholy Strength', 'Wave of Mutilation', 'Sphere of Chaos',
+]
+
+# Evaluators whose inputs a corpus provides (see --check)
+CHECKED_EVALUATORS = ('lore', 'apocalyptic')
+# Probability that a name gets an OCR artefact
+OCR_RATE = 0.2
+
+def suffix(index: int) -> str:
+    """'' for the first copy of a house, then B, C, ... Z, Ba, Bb, ..."""
+    if index == 0:
+        return ''
+    letters = ''
+    while index:
+        index, rem = divmod(index, 26)
+        letters = chr(ord('A') + rem) + letters
+    return letters.capitalize()
+
+def slug(name: str) -> str:
+    return re.sub(r'[^a-zA-Z0-9]', '_', name.lower())
+
+def sentence(rng: random.Random, words: int) -> str:
+    text = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return text.capitalize() + '.'
+
+def paragraph(rng: random.Random, lines: int) -> List[str]:
+    return [' '.join(sentence(rng, rng.randint(6, 12)) for _ in range(2)) for _ in range(lines)]
+
+def ocr_lore_header(rng: random.Random, name: str) -> str:
+    """An @@ header as the OCR left it"""
+    roll = rng.random()
+    if roll > OCR_RATE:
+        return name
+    subject = name[len('Lore of '):]
+    if roll < OCR_RATE / 3:
+        return f"loreoF {subject}##"
+    if roll < OCR_RATE * 2 / 3:
+        return f"LOREOF {subject.upper()}"
+    return f"{name}@@"
+
+def ocr_visage(rng: random.Random, name: str, subject: str) -> str:
+    """A visage name as the OCR left it"""
+    roll = rng.random()
+    if roll > OCR_RATE:
+        return f"{name}, the Visage of {subject}"
+    if roll < OCR_RATE / 3:
+        return f"{name}, the visaGeoF {subject}"
+    if roll < OCR_RATE * 2 / 3:
+        return f"{name}, the viSage {subject}"
+    # A stray capital in the last word
+    word = subject.split()[-1]
+    broken = word[:-2] + word[-2].upper() + word[-1] if len(word) > 2 else word
+    return f"{name}, the Visage of {subject[:-len(word)]}{broken}"
+
+def ocr_power(rng: random.Random, name: str) -> str:
+    """A power name as the OCR left it"""
+    if rng.random() > OCR_RATE or ' of ' not in name:
+        return name
+    head, tail = name.split(' of ', 1)
+    return f"{head.upper()}OF {tail.upper()}"
+
+def ocr_evocation(rng: random.Random, name: str) -> str:
+    if rng.random() > OCR_RATE:
+        return name
+    for word, broken in (('Light', 'liGht'), ('Manipulate', 'maniPulate'), ('Shape', 'shaPe')):
+        if word in name:
+            return name.replace(word, broken)
+    return name.replace(' the ', ' the the ') if ' the ' in name else name
+
+def recorded_name(printed: str, clean: str) -> str:
+    """The name an extraction that passes the evaluators records for a printed name
+
+    The evaluators compare case-insensitively, so case-only slips are
+    corrected; any other artefact is part of the source name they check
+    against and is kept as printed.
+    """
+    return clean if printed.lower() == clean.lower() else printed
+
+def build_lore(rng: random.Random, name: str, house: str) -> Tuple[List[str], Dict]:
+    """lore.md lines and the lore.json entry for one lore"""
+    lines = [f"@@{ocr_lore_header(rng, name)}"]
+    lines += paragraph(rng, rng.randint(2, 4))
+    evocations = []
+    for level in range(1, 6):
+        evocation = f"{rng.choice(VERBS)} {rng.choice(WORDS).capitalize()}"
+        if rng.random() < 0.3:
+            evocation = f"{rng.choice(VERBS)} the {rng.choice(WORDS).capitalize()}"
+        system = f"Roll {rng.choice(['Wits', 'Manipulation', 'Stamina', 'Charisma'])} + {rng.choice(['Occult', 'Science', 'Intimidation', 'Empathy'])}."
+        torment = sentence(rng, rng.randint(8, 14))
+        printed = ocr_evocation(rng, evocation)
+        lines.append(f"{'•' * level} {printed}")
+        # System and Torment run on from the description, as in the scanned book
+        description = paragraph(rng, rng.randint(1, 3))
+        description[-1] += f" System: {system} Torment: {torment}"
+        lines += description
+        evocations.append({'level': level, 'name': recorded_name(printed, evocation), 'system': system, 'torment': torment})
+    return lines, {'id': slug(name), 'name': name, 'house': house, 'evocations': evocations}
+
+def build_visage(rng: random.Random, name: str, subject: str, house: str, lore: str) -> Tuple[List[str], Dict]:
+    """lore.md lines and the apocalyptic_forms.json entry for one visage"""
+    printed = ocr_visage(rng, name, subject)
+    form_name = recorded_name(printed, f"{name}, the Visage of {subject}")
+    lines = [f"xx{printed}"]
+    lines += paragraph(rng, rng.randint(1, 3))
+    powers = []
+    chosen = rng.sample(POWER_NAMES, 8)
+    for i, power in enumerate(chosen):
+        high = i >= 4
+        if i == 4:
+            lines.append("high-Torment abilities")
+        description = sentence(rng, rng.randint(8, 20))
+        # The name has the bullet line to itself; the description follows, as in lore.md
+        power_name = ocr_power(rng, power)
+        lines.append(f"{'••' if high else '•'} {power_name}")
+        lines.append(description)
+        powers.append({'name': recorded_name(power_name, power), 'description': description, 'isHighTorment': high})
+    return lines, {
+        'id': slug(form_name),
+        'name': form_name,
+        'house': house,
+        'associatedLore': slug(lore),
+        'powers': powers,
+    }
+
+def generate_corpus(scale: int, seed: int = 0) -> Tuple[str, Dict, Dict]:
+    """(lore.md text, lore.json data, apocalyptic_forms.json data) for a scale"""
+    rng = random.Random(seed * 1000003 + scale)
+    lines = [
+        "TTTFormat notes TTT",
+        "xx will indicate an apocalyptic form",
+        "@@ marks a lore, ## marks a house",
+        "TTTCommon lore",
+    ]
+    lore_paths = []
+    forms = []
+
+    common_lines, common = build_lore(rng, 'Lore of the Fundament', 'Common')
+    lines += common_lines
+    lore_paths.append(common)
+
+    for copy in range(scale):
+        for h, base in enumerate(HOUSES):
+            house = f"{base}{suffix(copy)}"
+            lines.append(f"##{house}")
+            lines.append(f"TTTHouse of {house}")
+            house_lores = []
+            for i in range(3):
+                subject = SUBJECTS[(h * 3 + i) % len(SUBJECTS)]
+                name = f"Lore of {subject}" if copy == 0 else f"Lore of {subject} {house}"
+                lore_lines, lore = build_lore(rng, name, house)
+                lines += lore_lines
+                lore_paths.append(lore)
+                house_lores.append(name)
+            for i in range(3):
+                visage = VISAGE_NAMES[(h * 3 + i) % len(VISAGE_NAMES)]
+                if copy:
+                    visage = f"{visage} {house}"
+                subject = SUBJECTS[(h * 3 + i) % len(SUBJECTS)]
+                visage_lines, form = build_visage(rng, visage, subject, house, house_lores[i])
+                lines += visage_lines
+                forms.append(form)
+
+    return '\n'.join(lines) + '\n', {'lorePaths': lore_paths}, {'apocalypticForms': forms}
+
+def write_corpus(scale: int, out_dir: str, seed: int = 0) -> str:
+    """Write a corpus under out_dir/<scale>x/datasource/D20 and return that directory"""
+    root = os.path.join(out_dir, f"{scale}x")
+    target = os.path.join(root, 'datasource', 'D20')
+    os.makedirs(target, exist_ok=True)
+
+    source, lore_data, forms_data = generate_corpus(scale, seed)
+    with open(os.path.join(target, 'lore.md'), 'w', encoding='utf-8') as f:
+        f.write(source)
+    with open(os.path.join(target, 'lore.json'), 'w', encoding='utf-8') as f:
+        json.dump(lore_data, f, indent=2, ensure_ascii=False)
+    with open(os.path.join(target, 'apocalyptic_forms.json'), 'w', encoding='utf-8') as f:
+        json.dump(forms_data, f, indent=2, ensure_ascii=False)
+    return root
+
+def check_corpus(root: str) -> Dict[str, List[str]]:
+    """{evaluator: issues} for the evaluators that read a corpus; a fresh corpus has none"""
+    # The evaluators are imported by name, from next to this script, after the chdir
+    here = os.path.dirname(os.path.abspath(__file__))
+    if here not in sys.path:
+        sys.path.insert(0, here)
+    from run_evaluations import run_evaluator
+    cwd = os.getcwd()
+    os.chdir(root)
+    try:
+        results = {name: run_evaluator(name) for name in CHECKED_EVALUATORS}
+    finally:
+        os.chdir(cwd)
+    return {name: result['issues'] or ([result['error'].strip().splitlines()[-1]] if result['error'] else [])
+            for name, result in results.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic lore.md corpora")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100, 1000],
+                        help="corpus sizes relative to the real book (default: 1 10 100 1000)")
+    parser.add_argument('--out', default='synthetic_corpora', help="output directory")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    parser.add_argument('--check', action='store_true',
+                        help="run the lore and apocalyptic evaluators on each corpus; exit 1 on any issue")
+    args = parser.parse_args()
+
+    failed = False
+    for scale in args.scales:
+        root = write_corpus(scale, args.out, args.seed)
+        size = os.path.getsize(os.path.join(root, 'datasource', 'D20', 'lore.md'))
+        print(f"✅ {scale}x: {root} (lore.md {size / 1024:.0f} KB)")
+        if args.check:
+            for name, issues in check_corpus(root).items():
+                print(f"   {'✅' if not issues else '❌'} {name}: {len(issues)} issues")
+                for issue in issues[:5]:
+                    print(f"      - {issue}")
+                failed = failed or bool(issues)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Ad-hoc queries over the indexed datasource (see wodsource/query.py).
+
+Run from the repository root; every filter narrows the result:
+
+    python scripts/evaluation/query_datasource.py --kind power --prefix deathgrip
+    python scripts/evaluation/query_datasource.py --kind form --powers '!=8'
+    python scripts/evaluation/query_datasource.py --kind feature --cost '>=3'
+    python scripts/evaluation/query_datasource.py --house devils --kind lore
+
+The datasource is loaded and indexed once; the reported query time
+excludes loading.
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from wodsource import RECORD_KINDS, DatasourceIndex
+
+def describe(index: DatasourceIndex, record) -> str:
+    """One line for a record, naming its lore/form when it has one"""
+    text = f"{record.kind:10} {record.line} {record.name}"
+    parent = index.parent(record)
+    if parent:
+        text += f"  ← {parent.name}"
+    details = []
+    if record.house:
+        details.append(f"house {record.house}")
+    if record.torment:
+        details.append(f"{record.torment} torment")
+    if record.cost is not None:
+        details.append(f"cost {record.cost}")
+    if record.kind == 'form':
+        details.append(f"{len(record.data.get('powers') or [])} powers")
+    if details:
+        text += f" ({', '.join(details)})"
+    return text
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the D20/M20 datasource through its indexes")
+    parser.add_argument('--root', default='datasource', help="datasource directory (default: datasource)")
+    parser.add_argument('--kind', choices=RECORD_KINDS, help="record kind")
+    parser.add_argument('--id', help="record id (case-insensitive)")
+    parser.add_argument('--house', help="house name")
+    parser.add_argument('--lore', help="lore id, e.g. lore_of_the_flesh")
+    parser.add_argument('--prefix', help="name prefix, e.g. deathgrip")
+    parser.add_argument('--torment', choices=['high', 'low'], help="torment tier of form powers")
+    parser.add_argument('--cost', help="point cost, e.g. 3 or '>=2'")
+    parser.add_argument('--powers', help="power count of forms, e.g. 8 or '!=8'")
+    parser.add_argument('--line', choices=['D20', 'M20'], help="game line")
+    parser.add_argument('--json', action='store_true', help="print the matching JSON entries")
+    parser.add_argument('--limit', type=int, default=100, help="records printed (default 100)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = DatasourceIndex.load(args.root)
+    load_time = time.perf_counter() - start
+
+    filters = {key: getattr(args, key) for key in ('kind', 'id', 'house', 'lore', 'prefix', 'torment', 'cost', 'powers', 'line')}
+    start = time.perf_counter()
+    try:
+        results = index.query(**filters)
+    except ValueError as e:
+        parser.error(str(e))
+    query_time = time.perf_counter() - start
+
+    if args.json:
+        json.dump([record.data for record in results[:args.limit]], sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write('\n')
+        return 0
+
+    for record in results[:args.limit]:
+        print(describe(index, record))
+    if len(results) > args.limit:
+        print(f"... and {len(results) - args.limit} more")
+    print(f"\n📊 {len(results)} of {len(index)} records; "
+          f"query {query_time * 1e6:.0f} µs (index built in {load_time * 1000:.1f} ms)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Run every extraction evaluator in parallel and merge their results.
+
+The inputs are loaded once in this process (and kept by the wodsource
+cache), then the evaluators run in a pool of worker processes, each with
+its own timeout. Their metrics are merged into one JSON report and a
+JUnit-style XML file that CI can show per evaluator.
+
+Run from the repository root:
+
+    python scripts/evaluation/run_evaluations.py --json report.json --junit report.xml
+
+Exits 0 when every evaluator passed and 1 when any of them reported issues,
+raised or timed out, so CI fails on extraction regressions.
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+from xml.etree import ElementTree
+
+from wodsource import load_document_cached, load_json_cached
+
+SOURCE_PATH = 'datasource/D20/lore.md'
+JSON_INPUTS = [
+    'datasource/D20/lore.json',
+    'datasource/D20/apocalyptic_forms.json',
+    'datasource/D20/apocalyptic_powers.json',
+]
+DEFAULT_TIMEOUT = 300
+
+def lore_issues(metrics: Dict) -> List[str]:
+    """Issues counted by the lore evaluator's overall score"""
+    return (
+        [f"Missing lore: {name}" for name in metrics['missing_lores']] +
+        [f"Extra lore: {name}" for name in metrics['extra_lores']] +
+        [f"OCR issue: {issue}" for issue in metrics['ocr_issues']] +
+        [f"Name mismatch: {issue}" for issue in metrics['lore_accuracy']]
+    )
+
+def apocalyptic_issues(metrics: Dict) -> List[str]:
+    """Missing/extra forms and per-form accuracy issues"""
+    issues = [f"Missing form: {name}" for name in metrics['missing_forms']]
+    issues += [f"Extra form: {name}" for name in metrics['extra_forms']]
+    for form_name, form_issues in metrics['form_accuracy'].items():
+        issues += [f"{form_name}: {issue}" for issue in form_issues]
+    return issues
+
+def earthbound_issues(results: Dict) -> List[str]:
+    return list(results['issues']) if results else ["Could not load data"]
+
+def power_count_issues(results: Dict) -> List[str]:
+    return [f"{form['name']}: {form['count']} powers" for form in results['incorrect_forms']]
+
+def detailed_power_issues(results: Dict) -> List[str]:
+    return [f"{results['incorrect_count']} forms without 8 powers"] if results['incorrect_count'] else []
+
+def verification_issues(results: Dict) -> List[str]:
+    issues = []
+    if not results['ereshkigal_found']:
+        issues.append("Ereshkigal not found")
+    if results['chaos_contamination']:
+        issues.append(f"Chaos contamination: {results['chaos_contamination']}")
+    return issues
+
+# name -> (module, function, issue extractor)
+EVALUATORS = {
+    'lore': ('evaluate_lore_extraction', 'evaluate_lore_extraction', lore_issues),
+    'apocalyptic': ('evaluate_apocalyptic_extraction', 'evaluate_apocalyptic_extraction', apocalyptic_issues),
+    'earthbound': ('evaluate_earthbound_apocalyptic_extraction', 'main', earthbound_issues),
+    'power_counts': ('check_power_counts', 'check_power_counts', power_count_issues),
+    'detailed_power_check': ('detailed_power_check', 'detailed_power_check', detailed_power_issues),
+    'final_verification': ('final_verification', 'final_verification', verification_issues),
+}
+
+def preload_inputs():
+    """Parse the shared inputs once so every worker starts with them loaded"""
+    if os.path.exists(SOURCE_PATH):
+        load_document_cached(SOURCE_PATH)
+    for path in JSON_INPUTS:
+        if os.path.exists(path):
+            load_json_cached(path)
+
+def run_evaluator(name: str) -> Dict:
+    """Run one evaluator in a worker, capturing its console output"""
+    module_name, function_name, extract_issues = EVALUATORS[name]
+    output = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output):
+            function = getattr(importlib.import_module(module_name), function_name)
+            metrics = function()
+        issues = extract_issues(metrics)
+        status = 'failed' if issues else 'passed'
+        error = None
+    except Exception:
+        metrics, issues, status = None, [], 'error'
+        error = traceback.format_exc()
+    return {
+        'status': status,
+        'duration': time.perf_counter() - start,
+        'issues': issues,
+        'metrics': metrics,
+        'error': error,
+        'output': output.getvalue(),
+    }
+
+def _pool_context():
+    # Forked workers inherit the preloaded inputs instead of loading them again
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+def run_all(names: List[str], timeout: float, jobs: int) -> Tuple[Dict[str, Dict], float]:
+    """Run the named evaluators in parallel; returns (results by name, wall time)"""
+    start = time.perf_counter()
+    preload_inputs()
+
+    results = {}
+    pool = _pool_context().Pool(processes=jobs)
+    try:
+        pending = {name: pool.apply_async(run_evaluator, (name,)) for name in names}
+        # With one worker per evaluator they all start together, so each gets
+        # the same deadline; with fewer workers the deadline is per batch
+        batches = max(1, -(-len(names) // jobs))
+        deadline = start + timeout * batches
+        for name, async_result in pending.items():
+            try:
+                results[name] = async_result.get(max(0.0, deadline - time.perf_counter()))
+            except multiprocessing.TimeoutError:
+                results[name] = {
+                    'status': 'timeout',
+                    'duration': timeout,
+                    'issues': [],
+                    'metrics': None,
+                    'error': f"Timed out after {timeout:.0f}s",
+                    'output': '',
+                }
+    finally:
+        # Stops any evaluator still running past its timeout
+        pool.terminate()
+        pool.join()
+
+    return results, time.perf_counter() - start
+
+def _json_default(value):
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return str(value)
+
+def build_report(results: Dict[str, Dict], wall_time: float) -> Dict:
+    """Merged JSON report for all evaluators"""
+    return {
+        'generatedAt': datetime.now(timezone.utc).isoformat(),
+        'wallTime': wall_time,
+        'summary': {
+            status: sum(1 for result in results.values() if result['status'] == status)
+            for status in ('passed', 'failed', 'error', 'timeout')
+        },
+        'evaluators': results,
+    }
+
+def write_json_report(report: Dict, path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False, default=_json_default)
+        f.write('\n')
+
+def write_junit_report(report: Dict, path: str):
+    """One JUnit test case per evaluator"""
+    results = report['evaluators']
+    suite = ElementTree.Element('testsuite', {
+        'name': 'extraction-evaluation',
+        'tests': str(len(results)),
+        'failures': str(report['summary']['failed']),
+        'errors': str(report['summary']['error'] + report['summary']['timeout']),
+        'time': f"{report['wallTime']:.3f}",
+        'timestamp': report['generatedAt'],
+    })
+    for name, result in results.items():
+        case = ElementTree.SubElement(suite, 'testcase', {
+            'classname': 'evaluation',
+            'name': name,
+            'time': f"{result['duration']:.3f}",
+        })
+        if result['status'] == 'failed':
+            failure = ElementTree.SubElement(case, 'failure', {
+                'message': f"{len(result['issues'])} issues",
+            })
+            failure.text = '\n'.join(result['issues'])
+        elif result['status'] in ('error', 'timeout'):
+            error = ElementTree.SubElement(case, 'error', {'message': result['status']})
+            error.text = result['error']
+        if result['output']:
+            ElementTree.SubElement(case, 'system-out').text = result['output']
+
+    tree = ElementTree.ElementTree(suite)
+    ElementTree.indent(tree)
+    tree.write(path, encoding='utf-8', xml_declaration=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run all extraction evaluators in parallel")
+    parser.add_argument('--only', nargs='+', choices=sorted(EVALUATORS), metavar='NAME',
+                        help=f"evaluators to run (default: all of {', '.join(EVALUATORS)})")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f"seconds each evaluator may run (default {DEFAULT_TIMEOUT})")
+    parser.add_argument('--jobs', type=int, default=None,
+                        help="worker processes (default: one per evaluator)")
+    parser.add_argument('--json', metavar='PATH', help="write the merged JSON report")
+    parser.add_argument('--junit', metavar='PATH', help="write a JUnit-style XML report")
+    parser.add_argument('--verbose', action='store_true', help="print each evaluator's output")
+    args = parser.parse_args()
+
+    names = args.only or list(EVALUATORS)
+    jobs = max(1, min(args.jobs or len(names), len(names)))
+
+    print("=" * 80)
+    print(f"🚀 RUNNING {len(names)} EVALUATORS ({jobs} workers)")
+    print("=" * 80)
+
+    results, wall_time = run_all(names, args.timeout, jobs)
+    report = build_report(results, wall_time)
+
+    icons = {'passed': '✅', 'failed': '❌', 'error': '💥', 'timeout': '⏱️ '}
+    for name, result in results.items():
+        if args.verbose and result['output']:
+            print(f"\n{result['output']}")
+        print(f"{icons[result['status']]} {name:22} {result['status']:8} "
+              f"{result['duration']:7.2f}s  {len(result['issues'])} issues")
+        if result['error']:
+            print(f"   {result['error'].strip().splitlines()[-1]}")
+
+    slowest = max((result['duration'] for result in results.values()), default=0.0)
+    print(f"\n⏱️  Wall time: {wall_time:.2f}s (slowest evaluator {slowest:.2f}s)")
+
+    if args.json:
+        write_json_report(report, args.json)
+        print(f"📄 JSON report: {args.json}")
+    if args.junit:
+        write_junit_report(report, args.junit)
+        print(f"📄 JUnit report: {args.junit}")
+
+    return 0 if report['summary']['passed'] == len(results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
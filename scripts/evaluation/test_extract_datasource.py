@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+from evaluate_apocalyptic_extraction import compare_form, parse_source_apocalyptic_forms
+from extract_datasource import extract_lore_and_forms
+from wodsource import match_names, parse_document
+
+# A house with one lore and one visage that confers it, with OCR-damaged
+# names as lore.md prints them ("visaGeoF", "Auraof Terror")
+SOURCE = """TTTCommon lore
+##Devils
+TTTHouse of Devils
+@@Lore of Radiance@@
+• Voice of Heaven
+Speak and be heard. System: Roll Charisma + Leadership.
+xxBel, the visaGeoF Radiance
+A form of light.
+@@This visage confers the Lore of Radiance
+• Auraof Terror
+Mortals flee.
+• Wings
+Flight.
+high-Torment abilities
+•• Lordly Mien
+Awe.
+""".encode('utf-8')
+
+document = parse_document(SOURCE)
+_, forms_data = extract_lore_and_forms(document)
+extracted = {form['name']: form for form in forms_data['apocalypticForms']}
+source_forms = parse_source_apocalyptic_forms(document)
+
+for source_name, match in match_names(source_forms, extracted).items():
+    assert match is not None and match.exact, f"{source_name!r} not extracted under its source name"
+    form = extracted[match.candidate]
+    print(f"'{source_name}' → id '{form['id']}', powers {[power['name'] for power in form['powers']]}")
+    # The extractor's output must pass the evaluator's own checks
+    issues = compare_form(source_name, source_forms[source_name], form)
+    assert issues == [], issues
+
+assert extracted["Bel, the visaGeoF Radiance"]['id'] == 'bel__the_visageof_radiance'
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+from wodsource import parse_document, strip_lore_markers
+
+# Trailing ## and @@ markers are dropped from lore names; the baseline
+# evaluator kept a trailing @@ ("Lore of the Flesh@@")
+test_names = {
+    "Lore of the Flesh": "Lore of the Flesh",
+    "Lore of the Flesh##": "Lore of the Flesh",
+    "Lore of the Flesh@@": "Lore of the Flesh",
+    "Lore of the Flesh @@": "Lore of the Flesh",
+    "Lore of the Flesh##@@": "Lore of the Flesh",
+    "Lore of the Flesh@@##": "Lore of the Flesh",
+    "  Lore of the Flesh  ": "Lore of the Flesh",
+    "Lore of ## the Flesh": "Lore of ## the Flesh",
+    "##": "",
+}
+
+for name, expected in test_names.items():
+    stripped = strip_lore_markers(name)
+    print(f"'{name}' → '{stripped}'")
+    assert stripped == expected, f"{name!r}: expected {expected!r}, got {stripped!r}"
+
+# Parsed documents apply it to every lore header, and evocation bullets stay
+# with their lore
+document = parse_document("@@Lore of the Flesh@@\n• Body Control\n@@Lore of the Wild##\n•• Beast Speech\n".encode('utf-8'))
+lores = {lore.name: [(evocation.name, evocation.level) for evocation in lore.evocations] for lore in document.lores}
+print(lores)
+assert lores == {"Lore of the Flesh": [("Body Control", 1)], "Lore of the Wild": [("Beast Speech", 2)]}, lores
+
+# A lore header behind stray house markers still starts a lore, as it did
+# when lore headers were found with an unanchored @@ search
+document = parse_document("##Devils\n##@@Lore of Radiance@@\n• Voice of Heaven\n## @@Lore of the Celestials\n".encode('utf-8'))
+lores = {lore.name: [evocation.name for evocation in lore.evocations] for lore in document.lores}
+print(lores)
+assert lores == {"Lore of Radiance": ["Voice of Heaven"], "Lore of the Celestials": []}, lores
+assert [house.name for house in document.houses] == ["Devils"], [house.name for house in document.houses]
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Validate every datasource file GameDataService loads.
+
+Checks each file against its schema (required fields and types), that ids
+and names are unique, and that cross-file references resolve:
+apocalypticForms.associatedLore -> lore.json ids, forms and lores ->
+houses.json, affinity spheres -> spheres.json and status effect
+categories/tags -> the lists declared in status-effects.json.
+
+Each file is read once and checked in a single hashed pass (see
+wodsource/validation.py), so the run stays in milliseconds even on the
+large synthetic corpora.
+
+    python scripts/evaluation/validate_datasource.py [--root datasource] [--json report.json]
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+
+from wodsource import ERROR, WARNING, validate_datasource
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate the datasource JSON files")
+    parser.add_argument('--root', default='datasource', help="datasource directory (default: datasource)")
+    parser.add_argument('--json', metavar='PATH', help="write the issues as JSON ('-' for stdout)")
+    parser.add_argument('--strict', action='store_true', help="fail on warnings too")
+    parser.add_argument('--limit', type=int, default=50, help="issues printed per file (default 50)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    validator = validate_datasource(args.root)
+    elapsed = time.perf_counter() - start
+
+    counts = Counter(issue.severity for issue in validator.issues)
+    failed = counts[ERROR] > 0 or (args.strict and counts[WARNING] > 0)
+
+    if args.json:
+        report = {
+            'root': args.root,
+            'entries': validator.entries,
+            'elapsedMs': round(elapsed * 1000, 3),
+            'errors': counts[ERROR],
+            'warnings': counts[WARNING],
+            'issues': [issue._asdict() for issue in validator.issues],
+        }
+        if args.json == '-':
+            json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+            sys.stdout.write('\n')
+            return 1 if failed else 0
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+
+    print("=" * 80)
+    print("🔍 DATASOURCE VALIDATION")
+    print("=" * 80)
+
+    by_file = {}
+    for issue in validator.issues:
+        by_file.setdefault(issue.file, []).append(issue)
+    for file, issues in by_file.items():
+        print(f"\n📄 {file}: {len(issues)} issues")
+        for issue in issues[:args.limit]:
+            icon = '❌' if issue.severity == ERROR else '⚠️ '
+            location = f" {issue.path}:" if issue.path else ''
+            print(f"  {icon}{location} {issue.message}")
+        if len(issues) > args.limit:
+            print(f"  ... and {len(issues) - args.limit} more")
+
+    print(f"\n📊 {validator.entries} entries checked in {elapsed * 1000:.2f} ms: "
+          f"{counts[ERROR]} errors, {counts[WARNING]} warnings")
+    if args.json and args.json != '-':
+        print(f"📄 JSON report: {args.json}")
+    print("❌ Validation failed" if failed else "✅ Validation passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Watch the datasource and re-run the evaluators whose inputs change.
+
+The process stays up, so the interpreter, the evaluator modules and the
+parsed inputs (kept in memory by the wodsource cache) survive between
+runs; an edit only costs re-reading the file that changed. datasource/D20
+and datasource/M20 are polled for mtime/size changes, the evaluators that
+read a changed file are re-run in-process, and their issues are diffed
+against the previous run. Which files an evaluator reads is recorded from
+its last run (every load through wodsource reports its path), so there is
+no input list to keep in step with the evaluators. Run from the repository
+root:
+
+    python scripts/evaluation/watch_evaluations.py [--only lore apocalyptic] [--interval 0.5]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Set, Tuple
+
+from run_evaluations import EVALUATORS, run_evaluator
+from wodsource import record_reads
+
+WATCHED_DIRS = ['datasource/D20', 'datasource/M20']
+DEFAULT_INTERVAL = 0.5
+
+def snapshot(directories: List[str]) -> Dict[str, Tuple[int, int]]:
+    """{path: (mtime_ns, size)} for every file under the directories"""
+    files = {}
+    pending = [d for d in directories if os.path.isdir(d)]
+    while pending:
+        directory = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    stat = entry.stat()
+                    files[os.path.normpath(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+def changed_paths(before: Dict, after: Dict) -> Set[str]:
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+def affected_evaluators(paths: Set[str], names: List[str], inputs: Dict[str, Set[str]]) -> List[str]:
+    """Evaluators, in run order, whose last run read any of paths
+
+    An evaluator that read nothing (it failed before loading its inputs) is
+    always re-run.
+    """
+    changed = {os.path.abspath(path) for path in paths}
+    return [name for name in names if not inputs.get(name) or inputs[name] & changed]
+
+def diff_results(previous: Dict, current: Dict) -> Tuple[List[str], List[str]]:
+    """(new issues, resolved issues) between two runs of one evaluator"""
+    before = set(previous['issues']) if previous else set()
+    after = set(current['issues'])
+    return ([issue for issue in current['issues'] if issue not in before],
+            [issue for issue in (previous['issues'] if previous else []) if issue not in after])
+
+def report(name: str, previous: Dict, current: Dict, limit: int):
+    icons = {'passed': '✅', 'failed': '❌', 'error': '💥'}
+    line = (f"{icons.get(current['status'], '❔')} {name:22} {current['status']:8} "
+            f"{current['duration'] * 1000:8.1f} ms  {len(current['issues'])} issues")
+    if previous and previous['status'] != current['status']:
+        line += f"  (was {previous['status']})"
+    print(line)
+    if current['error']:
+        print(f"   {current['error'].strip().splitlines()[-1]}")
+    if previous is None:
+        return
+    added, resolved = diff_results(previous, current)
+    for issue in resolved[:limit]:
+        print(f"   - {issue}")
+    for issue in added[:limit]:
+        print(f"   + {issue}")
+    hidden = max(0, len(resolved) - limit) + max(0, len(added) - limit)
+    if hidden:
+        print(f"   ... and {hidden} more changes")
+    if not added and not resolved:
+        print("   (no change in issues)")
+
+def run(names: List[str], results: Dict[str, Dict], inputs: Dict[str, Set[str]], limit: int, verbose: bool):
+    for name in names:
+        with record_reads() as paths:
+            current = run_evaluator(name)
+        inputs[name] = paths
+        if verbose and current['output']:
+            print(current['output'])
+        report(name, results.get(name), current, limit)
+        results[name] = current
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-run evaluators when their datasource inputs change")
+    parser.add_argument('--only', nargs='+', choices=sorted(EVALUATORS), metavar='NAME',
+                        help=f"evaluators to watch (default: all of {', '.join(EVALUATORS)})")
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL,
+                        help=f"seconds between polls (default {DEFAULT_INTERVAL})")
+    parser.add_argument('--limit', type=int, default=20, help="issue changes shown per evaluator (default 20)")
+    parser.add_argument('--verbose', action='store_true', help="print each evaluator's output")
+    args = parser.parse_args()
+
+    names = args.only or list(EVALUATORS)
+    results: Dict[str, Dict] = {}
+    inputs: Dict[str, Set[str]] = {}   # evaluator -> absolute paths its last run read
+
+    print("=" * 80)
+    print(f"👀 WATCHING {', '.join(WATCHED_DIRS)} ({len(names)} evaluators, Ctrl-C to stop)")
+    print("=" * 80)
+
+    state = snapshot(WATCHED_DIRS)
+    run(names, results, inputs, args.limit, args.verbose)
+
+    try:
+        while True:
+            time.sleep(args.interval)
+            current = snapshot(WATCHED_DIRS)
+            paths = changed_paths(state, current)
+            state = current
+            if not paths:
+                continue
+            print(f"\n🔄 {time.strftime('%H:%M:%S')} changed: {', '.join(sorted(paths))}")
+            affected = affected_evaluators(paths, names, inputs)
+            if not affected:
+                print("   no watched evaluator reads these files")
+                continue
+            run(affected, results, inputs, args.limit, args.verbose)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
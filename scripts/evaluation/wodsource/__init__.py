@@ -0,0 +1,152 @@
+"""
+Shared helpers for reading the D20/M20 datasource books.
+
+Import from the package root; the submodules are implementation detail.
+"""
+
+from .bundle import (
+    BUNDLE_FILES,
+    BUNDLE_SUFFIX,
+    BUNDLE_VERSION,
+    build_bundle,
+    bundle_path,
+    bundled_record,
+    read_bundle,
+    read_bundle_tries,
+)
+from .cache import (
+    cache_enabled,
+    cached_load,
+    content_digest,
+    file_digest,
+    load_document_cached,
+    load_json_cached,
+    load_text_cached,
+    record_reads,
+)
+from .diff import (
+    DESCRIPTION_CHANGED,
+    DIFF_KINDS,
+    EXTRA,
+    MISSING,
+    RENAMED,
+    diff_evocations,
+    diff_lore_presence,
+    diff_lores,
+    diff_report,
+    lore_id,
+    summarize,
+    write_diff_report,
+)
+from .document import (
+    DEFAULT_SOURCE,
+    Evocation,
+    House,
+    Lore,
+    Power,
+    SourceDocument,
+    SourceView,
+    Visage,
+    build_document,
+    load_document,
+    map_file,
+    parse_document,
+    strip_lore_markers,
+)
+from .export import (
+    EXPORTS,
+    export_sqlite,
+    fts_query,
+    search_sqlite,
+)
+from .features import (
+    PointFeature,
+    scan_point_features,
+)
+from .incremental import (
+    ChangeSet,
+    load_document_incremental,
+    remember_results,
+    reparse,
+    reusable_results,
+)
+from .lazyjson import (
+    DEFAULT_ARRAYS,
+    LazyJSONFile,
+    scan_offsets,
+)
+from .lines import (
+    LineIndex,
+    document_lines,
+    line_index,
+    source_location,
+)
+from .matching import (
+    Match,
+    NameIndex,
+    match_names,
+    normalize_key,
+)
+from .normalize import (
+    normalize_batch,
+    normalize_ocr_text,
+    normalize_power_name,
+)
+from .profiling import (
+    StageProfiler,
+    print_profile,
+)
+from .query import (
+    RECORD_KINDS,
+    DatasourceIndex,
+    Record,
+    parse_comparison,
+)
+from .snapshot import (
+    ADDED,
+    CHANGED,
+    REMOVED,
+    compare_manifests,
+    entity_hash,
+    hash_features,
+    hash_forms,
+    hash_lores,
+    hash_source,
+    load_manifest,
+    write_manifest,
+)
+from .tokenizer import (
+    BULLET,
+    FORM,
+    FORM_CLOSERS,
+    HOUSE,
+    HOUSE_TITLE,
+    LORE,
+    SECTION_KINDS,
+    Section,
+    SectionEvent,
+    as_text,
+    find_content_start,
+    group_sections,
+    tokenize,
+)
+from .trie import (
+    TRIE_INDICES,
+    TRIE_VERSION,
+    build_line_tries,
+    build_trie,
+    search_trie,
+)
+from .validation import (
+    DATASOURCE_SPECS,
+    ERROR,
+    WARNING,
+    Collection,
+    Field,
+    FileSpec,
+    Issue,
+    Ref,
+    Validator,
+    find_duplicates,
+    validate_datasource,
+)
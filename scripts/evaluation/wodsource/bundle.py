@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Compiled per-game-line datasource bundles.
+
+GameDataService used to fetch every datasource file on its own, one after
+another. A bundle holds all of a line's files in one minified text so the
+client makes a single request per line:
+
+    {"version":3,"line":"D20","systemVersion":"1.0.0","digest":"...","files":{"lore.json":[2,5120],...},
+     "ids":{"lore.json":{"lore_of_radiance":[40,980],...},...},
+     "tries":{"d20MeritsFlaws":[18,20480]},"missing":[]}
+    {"merits_flaws.json":{...},"backgrounds.json":{...},...}
+    {"m20MeritsFlaws":{"labels":[...],"ends":[...],...},...}
+
+The first line is the header, the second the body and the third the
+prebuilt search tries (see wodsource/trie.py). Header offsets are
+[start, end) into the body ("files", "ids") or the trie line ("tries"), so
+a client can parse one file, record or trie with text.slice(start, end)
+without parsing the rest. The tries are built from the same parsed files
+as the body, so the two can never disagree. The body is written
+ASCII-only, which makes character, byte and UTF-16 offsets the same number
+in Python and JavaScript. Files keep the order of BUNDLE_FILES and their
+keys keep source order, so unchanged data rebuilds to identical bytes.
+
+"systemVersion" is the system.json version the bundle was built for. The
+client only uses a bundle whose stamp matches the running system, so a
+bundle left from another release is never served in place of its files.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from .trie import build_line_tries
+
+BUNDLE_VERSION = 3
+BUNDLE_SUFFIX = '.bundle'
+
+# Files per game line, in the order GameDataService.initialize() loads them
+BUNDLE_FILES: Dict[str, Tuple[str, ...]] = {
+    'M20': ('merits_flaws.json', 'backgrounds.json', 'spheres.json', 'charms.json',
+            's-advantages.json', 'affinities.json'),
+    'D20': ('merits_flaws.json', 'backgrounds.json', 'apocalyptic_forms.json', 'lore.json',
+            'houses.json'),
+}
+
+
+def _dump(value) -> str:
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=True)
+
+
+def _serialize_array(items: list, offset: int, ids: Dict[str, List[int]]) -> str:
+    parts = []
+    position = offset + 1
+    for index, item in enumerate(items):
+        if index:
+            position += 1
+        text = _dump(item)
+        if isinstance(item, dict) and isinstance(item.get('id'), str):
+            ids.setdefault(item['id'], [position, position + len(text)])
+        parts.append(text)
+        position += len(text)
+    return '[' + ','.join(parts) + ']'
+
+
+def _serialize_file(data, offset: int, ids: Dict[str, List[int]]) -> str:
+    """Minified JSON for one file, recording the span of every top-level array record with an id"""
+    if not isinstance(data, dict):
+        return _dump(data)
+    parts = []
+    position = offset + 1
+    for index, (key, value) in enumerate(data.items()):
+        prefix = (',' if index else '') + _dump(key) + ':'
+        position += len(prefix)
+        text = _serialize_array(value, position, ids) if isinstance(value, list) else _dump(value)
+        parts.append(prefix + text)
+        position += len(text)
+    return '{' + ''.join(parts) + '}'
+
+
+def bundle_path(root: str, line: str) -> str:
+    """datasource/D20.bundle for root 'datasource' and line 'D20'"""
+    return os.path.join(root, f"{line}{BUNDLE_SUFFIX}")
+
+
+def _serialize_sections(sections: Dict[str, object]) -> Tuple[str, Dict[str, List[int]]]:
+    """Minified {name: value} object and the [start, end) span of every value"""
+    spans: Dict[str, List[int]] = {}
+    parts = []
+    position = 1
+    for name, value in sections.items():
+        prefix = (',' if parts else '') + _dump(name) + ':'
+        position += len(prefix)
+        text = _dump(value)
+        spans[name] = [position, position + len(text)]
+        parts.append(prefix + text)
+        position += len(text)
+    return '{' + ''.join(parts) + '}', spans
+
+
+def build_bundle(root: str, line: str, files: Optional[Tuple[str, ...]] = None,
+                 system_version: str = '') -> str:
+    """Text of the bundle for one game line, stamped with system_version; absent files are listed as missing"""
+    files = BUNDLE_FILES[line] if files is None else files
+    loaded: Dict[str, object] = {}
+    spans: Dict[str, List[int]] = {}
+    ids: Dict[str, Dict[str, List[int]]] = {}
+    missing = []
+    parts = []
+    position = 1
+    for name in files:
+        path = os.path.join(root, line, name)
+        if not os.path.exists(path):
+            missing.append(name)
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        loaded[name] = data
+        prefix = (',' if parts else '') + _dump(name) + ':'
+        position += len(prefix)
+        file_ids: Dict[str, List[int]] = {}
+        text = _serialize_file(data, position, file_ids)
+        spans[name] = [position, position + len(text)]
+        if file_ids:
+            ids[name] = file_ids
+        parts.append(prefix + text)
+        position += len(text)
+    body = '{' + ''.join(parts) + '}'
+    tries, trie_spans = _serialize_sections(build_line_tries(line, loaded))
+    header = {
+        'version': BUNDLE_VERSION,
+        'line': line,
+        'systemVersion': system_version,
+        'digest': hashlib.sha256(body.encode('ascii')).hexdigest(),
+        'files': spans,
+        'ids': ids,
+        'tries': trie_spans,
+        'missing': missing,
+    }
+    return _dump(header) + '\n' + body + '\n' + tries + '\n'
+
+
+def read_bundle(path: str) -> Tuple[Dict, str]:
+    """(header, body) of a bundle file"""
+    with open(path, 'r', encoding='ascii') as f:
+        header = json.loads(f.readline())
+        body = f.readline().rstrip('\n')
+    if header.get('version') != BUNDLE_VERSION:
+        raise ValueError(f"{path}: bundle version {header.get('version')}, expected {BUNDLE_VERSION}")
+    return header, body
+
+
+def read_bundle_tries(path: str) -> Dict[str, Dict]:
+    """{trie name: serialized trie} stored in a bundle file"""
+    with open(path, 'r', encoding='ascii') as f:
+        header = json.loads(f.readline())
+        f.readline()
+        tries = f.readline().rstrip('\n')
+    if header.get('version') != BUNDLE_VERSION:
+        raise ValueError(f"{path}: bundle version {header.get('version')}, expected {BUNDLE_VERSION}")
+    return json.loads(tries) if tries else {}
+
+
+def bundled_record(header: Dict, body: str, name: str, identifier: str):
+    """One record of a bundled file, parsed on its own, or None"""
+    span = header['ids'].get(name, {}).get(identifier)
+    return json.loads(body[span[0]:span[1]]) if span else None
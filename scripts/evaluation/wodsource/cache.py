@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Content-hash-keyed on-disk cache for parsed source books and decoded JSON.
+
+Entries are pickles named after the SHA-256 of the input file, so editing
+a file changes its key and the stale entry is simply never read again (it
+is removed the next time that file is cached). Set WODSOURCE_NO_CACHE=1
+to bypass the cache, or WODSOURCE_CACHE_DIR to move it.
+
+Inputs are memory-mapped: the digest is computed from the map and, on a
+miss, the value is built from the same map, so a file is never copied into
+memory just to be hashed. Memory-mapped buffers are pickled as bytes.
+
+Loaded values are also kept in memory for the life of the process, so a
+runner can load every input once and hand it to forked workers for free.
+Values are shared between callers and must be treated as read-only.
+
+Every path loaded through this package is reported to the active
+record_reads() blocks, so a caller can learn which files a run depended on:
+
+    with record_reads() as paths:
+        evaluate_lore_extraction()
+    paths   # {'/.../datasource/D20/lore.md', '/.../datasource/D20/lore.json'}
+"""
+
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import tempfile
+from typing import Any, Callable, Iterator, List, Optional, Set
+
+from .document import DEFAULT_SOURCE, SourceDocument, map_file, parse_document
+
+# Bump when the pickled structures change shape so old entries are ignored
+CACHE_VERSION = 3
+DEFAULT_CACHE_DIR = '.wodsource_cache'
+
+# (kind, absolute path) -> (content digest, value) for this process
+_MEMORY = {}
+# Path sets of the active record_reads() blocks
+_READS: List[Set[str]] = []
+
+
+def cache_dir() -> str:
+    return os.environ.get('WODSOURCE_CACHE_DIR', DEFAULT_CACHE_DIR)
+
+
+def cache_enabled() -> bool:
+    return os.environ.get('WODSOURCE_NO_CACHE', '') in ('', '0')
+
+
+def content_digest(data) -> str:
+    """SHA-256 hex digest of a file's bytes (bytes or a memory map)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+@contextlib.contextmanager
+def record_reads() -> Iterator[Set[str]]:
+    """Collect the absolute path of every file loaded through the cache inside the block"""
+    paths: Set[str] = set()
+    _READS.append(paths)
+    try:
+        yield paths
+    finally:
+        _READS.remove(paths)
+
+
+def note_read(path: str):
+    """Report path to the active record_reads() blocks; called before the file is opened"""
+    if _READS:
+        absolute = os.path.abspath(path)
+        for paths in _READS:
+            paths.add(absolute)
+
+
+def _entry_prefix(kind: str, path: str) -> str:
+    """Per-file prefix so a new entry can replace the previous one"""
+    path_tag = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:12]
+    return f"{kind}-v{CACHE_VERSION}-{path_tag}-"
+
+
+def _read_entry(entry_path: str) -> Optional[Any]:
+    try:
+        with open(entry_path, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # A truncated or incompatible entry is treated as a miss
+        return None
+
+
+class _EntryPickler(pickle.Pickler):
+    """Pickler that stores memory maps as their bytes (once per map, via the memo)"""
+
+    def reducer_override(self, obj):
+        if isinstance(obj, mmap.mmap):
+            return bytes, (obj[:],)
+        return NotImplemented
+
+
+def _write_entry(directory: str, prefix: str, entry_path: str, value: Any):
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            _EntryPickler(f, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+        os.replace(tmp_path, entry_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return
+
+    # Drop superseded entries for the same file
+    keep = os.path.basename(entry_path)
+    for name in os.listdir(directory):
+        if name.startswith(prefix) and name != keep:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+
+
+def cached_load(path: str, kind: str, build: Callable[[Any], Any],
+                directory: Optional[str] = None) -> Any:
+    """Return build(file buffer), reusing the cached result when the bytes are unchanged
+
+    build() receives the read-only memory map of the file (b'' when empty).
+    """
+    note_read(path)
+    data = map_file(path)
+    if not cache_enabled():
+        return build(data)
+
+    digest = content_digest(data)
+    memory_key = (kind, os.path.abspath(path))
+    remembered = _MEMORY.get(memory_key)
+    if remembered is not None and remembered[0] == digest:
+        return remembered[1]
+
+    directory = directory or cache_dir()
+    prefix = _entry_prefix(kind, path)
+    entry_path = os.path.join(directory, f"{prefix}{digest}.pickle")
+
+    value = _read_entry(entry_path)
+    if value is None:
+        value = build(data)
+        _write_entry(directory, prefix, entry_path, value)
+    _MEMORY[memory_key] = (digest, value)
+    return value
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 hex digest of a file on disk, hashed from its memory map"""
+    note_read(path)
+    return content_digest(map_file(path))
+
+
+def load_state(kind: str, path: str) -> Optional[Any]:
+    """The last value stored for path under kind, whatever the file holds now"""
+    if not cache_enabled():
+        return None
+    prefix = _entry_prefix(f"state-{kind}", path)
+    return _read_entry(os.path.join(cache_dir(), f"{prefix}latest.pickle"))
+
+
+def store_state(kind: str, path: str, value: Any):
+    """Remember value for path under kind for the next run"""
+    if not cache_enabled():
+        return
+    directory = cache_dir()
+    prefix = _entry_prefix(f"state-{kind}", path)
+    _write_entry(directory, prefix, os.path.join(directory, f"{prefix}latest.pickle"), value)
+
+
+def load_document_cached(path: str = DEFAULT_SOURCE) -> SourceDocument:
+    """load_document backed by the parse cache; parses the mapped file on a miss"""
+    return cached_load(path, 'document', lambda data: parse_document(data, path))
+
+
+def load_json_cached(path: str) -> Any:
+    """json.load backed by the parse cache"""
+    return cached_load(path, 'json', lambda data: json.loads(str(data, 'utf-8')))
+
+
+def load_text_cached(path: str) -> str:
+    """The UTF-8 text of path with newlines translated as open(path) does, backed by the parse cache"""
+    return cached_load(path, 'text', lambda data: str(data, 'utf-8').replace('\r\n', '\n').replace('\r', '\n'))
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Entity-level diff between parsed source lores and an extracted lore.json.
+
+Both sides are indexed once by (lore id, level), then every key is visited
+a single time, so a diff costs O(source + extracted) however many lores and
+levels there are. Entries are plain dicts that serialize straight to JSON:
+
+    {"kind": "renamed", "lore": "Lore of the Flesh", "lore_id": "lore_of_the_flesh",
+     "level": 2, "line": 812, "source": "...", "extracted": "..."}
+
+kind is one of missing, extra, renamed or description_changed. level is
+None for a whole lore that is missing or extra. line is the lore.md line of
+the source entity, or None for entities that only exist in the extraction.
+"""
+
+import json
+import re
+from typing import Callable, Dict, Iterable, List, Optional
+
+MISSING = 'missing'
+EXTRA = 'extra'
+RENAMED = 'renamed'
+DESCRIPTION_CHANGED = 'description_changed'
+DIFF_KINDS = (MISSING, EXTRA, RENAMED, DESCRIPTION_CHANGED)
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+_SPACES = re.compile(r'\s+')
+
+
+def lore_id(name: str) -> str:
+    """The lore.json style id for a lore name"""
+    return _NON_ALNUM.sub('_', name.lower()).strip('_')
+
+
+def _text_key(text: str) -> str:
+    return _SPACES.sub(' ', text.lower()).strip()
+
+
+def _entry(kind: str, lore: str, identifier: str, level: Optional[int], line: Optional[int],
+           source: Optional[str] = None, extracted: Optional[str] = None) -> Dict:
+    entry = {'kind': kind, 'lore': lore, 'lore_id': identifier, 'level': level, 'line': line}
+    if source is not None:
+        entry['source'] = source
+    if extracted is not None:
+        entry['extracted'] = extracted
+    return entry
+
+
+def index_by_level(evocations: Iterable[Dict]) -> Dict[int, Dict]:
+    """Evocations keyed by level; the first evocation at a level wins"""
+    index = {}
+    for evocation in evocations:
+        index.setdefault(evocation.get('level'), evocation)
+    return index
+
+
+def diff_evocations(lore_name: str, identifier: str, source_evocations: Iterable[Dict],
+                    extracted_evocations: Iterable[Dict],
+                    normalize: Callable[[str], str]) -> List[Dict]:
+    """Diff entries for the evocations of one lore present on both sides"""
+    source = index_by_level(source_evocations)
+    extracted = index_by_level(extracted_evocations)
+    entries = []
+
+    for level in sorted(source.keys() | extracted.keys(), key=lambda level: (level is None, level)):
+        source_ev = source.get(level)
+        extracted_ev = extracted.get(level)
+        if extracted_ev is None:
+            entries.append(_entry(MISSING, lore_name, identifier, level, source_ev.get('line'),
+                                  source=source_ev['name']))
+            continue
+        if source_ev is None:
+            entries.append(_entry(EXTRA, lore_name, identifier, level, None,
+                                  extracted=extracted_ev['name']))
+            continue
+
+        line = source_ev.get('line')
+        if normalize(source_ev['name']) != normalize(extracted_ev['name']):
+            entries.append(_entry(RENAMED, lore_name, identifier, level, line,
+                                  source=source_ev['name'], extracted=extracted_ev['name']))
+
+        # Only extractions that carry a description can disagree with the source
+        extracted_description = extracted_ev.get('description')
+        source_description = source_ev.get('description')
+        if extracted_description and source_description is not None:
+            if _text_key(extracted_description) != _text_key(source_description):
+                entries.append(_entry(DESCRIPTION_CHANGED, lore_name, identifier, level, line,
+                                      source=source_description, extracted=extracted_description))
+
+    return entries
+
+
+def _index_lores(lores: Iterable[Dict], normalize: Callable[[str], str]) -> Dict[str, Dict]:
+    index = {}
+    for lore in lores:
+        index.setdefault(normalize(lore['name']), lore)
+    return index
+
+
+def _identifier(name: str, extracted_lore: Optional[Dict]) -> str:
+    if extracted_lore and extracted_lore.get('id'):
+        return extracted_lore['id']
+    return lore_id(name)
+
+
+def diff_lore_presence(source_lores: Dict[str, Dict], extracted_lores: Iterable[Dict],
+                       normalize: Callable[[str], str],
+                       also_extracted: Iterable[Dict] = ()) -> List[Dict]:
+    """Missing and extra entries for whole lores.
+
+    Lores in also_extracted (e.g. blackKnowledge) count as present for the
+    missing check but are never reported as extra.
+    """
+    extracted_index = _index_lores(extracted_lores, normalize)
+    present = set(extracted_index)
+    present.update(normalize(lore['name']) for lore in also_extracted)
+
+    entries = []
+    source_keys = set()
+    for source_name, source_lore in source_lores.items():
+        key = normalize(source_name)
+        source_keys.add(key)
+        if key not in present:
+            entries.append(_entry(MISSING, source_name, lore_id(source_name), None,
+                                  source_lore.get('line'), source=source_name))
+
+    for key, extracted_lore in extracted_index.items():
+        if key not in source_keys:
+            name = extracted_lore['name']
+            entries.append(_entry(EXTRA, name, _identifier(name, extracted_lore), None, None,
+                                  extracted=name))
+
+    return entries
+
+
+def diff_lores(source_lores: Dict[str, Dict], extracted_lores: Iterable[Dict],
+               normalize: Callable[[str], str],
+               also_extracted: Iterable[Dict] = ()) -> List[Dict]:
+    """Diff entries for every lore and evocation.
+
+    source_lores maps names to {'name', 'line', 'evocations'} as built by
+    the lore evaluator; extracted_lores are lore.json entries.
+    """
+    extracted_lores = list(extracted_lores)
+    entries = diff_lore_presence(source_lores, extracted_lores, normalize, also_extracted)
+
+    extracted_index = _index_lores(extracted_lores, normalize)
+    for source_name, source_lore in source_lores.items():
+        extracted_lore = extracted_index.get(normalize(source_name))
+        if extracted_lore is None:
+            continue
+        entries.extend(diff_evocations(source_name, _identifier(source_name, extracted_lore),
+                                       source_lore['evocations'],
+                                       extracted_lore.get('evocations', []), normalize))
+
+    return entries
+
+
+def summarize(entries: Iterable[Dict]) -> Dict[str, int]:
+    """Count of diff entries per kind"""
+    counts = {kind: 0 for kind in DIFF_KINDS}
+    for entry in entries:
+        counts[entry['kind']] += 1
+    return counts
+
+
+def diff_report(entries: List[Dict], source_path: str, extracted_path: str) -> Dict:
+    """The JSON document written for CI and fix-up tooling"""
+    return {
+        'source': source_path,
+        'extracted': extracted_path,
+        'summary': summarize(entries),
+        'entries': entries,
+    }
+
+
+def write_diff_report(report: Dict, path: str):
+    """Write a diff report as JSON; '-' writes to stdout"""
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if path == '-':
+        print(text)
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text + '\n')
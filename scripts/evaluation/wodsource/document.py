@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Parsed document model for lore.md style source books.
+
+The source is tokenized once and turned into an immutable tree:
+
+    house -> lore   -> evocation
+    house -> visage -> power
+
+Every node keeps (start, end) views into the original buffer instead of
+copied strings, so scripts can query names, levels and line numbers for
+free and only pay for text they actually print.
+
+load_document memory-maps the file, so the buffer itself is never copied
+into the process: parsing touches each page once and a view only reads
+its own range when its text is asked for. Documents built from bytes
+(parse_document) can be pickled; mapped ones cannot.
+"""
+
+import mmap
+import os
+from typing import NamedTuple, Optional, Tuple
+
+from .tokenizer import (
+    FORM,
+    FORM_CLOSERS,
+    HOUSE,
+    HOUSE_TITLE,
+    LORE,
+    SECTION_KINDS,
+    SectionEvent,
+    as_text,
+    find_content_start,
+    group_sections,
+    tokenize,
+)
+
+DEFAULT_SOURCE = 'datasource/D20/lore.md'
+
+
+class SourceView:
+    """Lazy (start, end) window onto a source buffer"""
+
+    __slots__ = ('buffer', 'start', 'end')
+
+    def __init__(self, buffer, start: int, end: int):
+        self.buffer = buffer
+        self.start = start
+        self.end = end
+
+    @property
+    def raw(self):
+        """The undecoded slice of the buffer"""
+        return self.buffer[self.start:self.end]
+
+    @property
+    def text(self) -> str:
+        """The decoded slice of the buffer"""
+        return as_text(self.raw)
+
+    def lines(self):
+        """The decoded slice split into lines"""
+        return self.text.split('\n')
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"SourceView({self.start}, {self.end})"
+
+    def __eq__(self, other):
+        if not isinstance(other, SourceView):
+            return NotImplemented
+        return self.raw == other.raw
+
+    def __hash__(self):
+        return hash(self.raw)
+
+    def __getstate__(self):
+        return (self.buffer, self.start, self.end)
+
+    def __setstate__(self, state):
+        self.buffer, self.start, self.end = state
+
+
+class Evocation(NamedTuple):
+    """A bullet entry inside a lore"""
+    name: str
+    level: int
+    line: int
+    header: SourceView
+    description: SourceView
+
+
+class Power(NamedTuple):
+    """A bullet entry inside an apocalyptic form"""
+    name: str
+    level: int
+    line: int
+    header: SourceView
+    description: SourceView
+
+    @property
+    def is_high_torment(self) -> bool:
+        """Multiple bullets mark a high-Torment power"""
+        return self.level > 1
+
+
+class Lore(NamedTuple):
+    """An @@ lore section"""
+    name: str
+    line: int
+    header: SourceView
+    body: SourceView
+    evocations: Tuple[Evocation, ...]
+
+
+class Visage(NamedTuple):
+    """An xx apocalyptic form section"""
+    name: str
+    line: int
+    header: SourceView
+    body: SourceView
+    powers: Tuple[Power, ...]
+
+    @property
+    def low_torment_powers(self) -> Tuple[Power, ...]:
+        return tuple(p for p in self.powers if not p.is_high_torment)
+
+    @property
+    def high_torment_powers(self) -> Tuple[Power, ...]:
+        return tuple(p for p in self.powers if p.is_high_torment)
+
+
+class House(NamedTuple):
+    """A TTT or ## house section and everything declared under it"""
+    name: str
+    marker: str  # HOUSE_TITLE or HOUSE, '' for content before any house
+    line: int
+    lores: Tuple[Lore, ...]
+    visages: Tuple[Visage, ...]
+
+
+class SourceDocument(NamedTuple):
+    """Immutable section tree for one source book"""
+    path: Optional[str]
+    buffer: bytes
+    content_start: int
+    houses: Tuple[House, ...]
+    events: Tuple[SectionEvent, ...]
+
+    @property
+    def lores(self) -> Tuple[Lore, ...]:
+        return tuple(lore for house in self.houses for lore in house.lores)
+
+    @property
+    def visages(self) -> Tuple[Visage, ...]:
+        return tuple(visage for house in self.houses for visage in house.visages)
+
+    def find_lore(self, name: str) -> Optional[Lore]:
+        """First lore whose name matches, ignoring case"""
+        wanted = name.lower()
+        return next((lore for lore in self.lores if lore.name.lower() == wanted), None)
+
+    def find_visage(self, fragment: str) -> Optional[Visage]:
+        """First visage whose name contains the fragment"""
+        return next((v for v in self.visages if fragment in v.name), None)
+
+    def house_of(self, entity) -> Optional[House]:
+        """The house a lore or visage was declared under"""
+        for house in self.houses:
+            if any(e is entity for e in house.lores + house.visages):
+                return house
+        return None
+
+    def view(self, start: int, end: int) -> SourceView:
+        return SourceView(self.buffer, start, end)
+
+
+def strip_lore_markers(name: str) -> str:
+    """Drop the trailing ## / @@ markers (in any order) some @@ headers carry"""
+    name = name.strip()
+    while name.endswith(('##', '@@')):
+        name = name[:-2].rstrip()
+    return name
+
+
+def _entries(buffer, section, entry_type):
+    """Build evocation/power entries from a section's bullets"""
+    return tuple(
+        entry_type(
+            bullet.name,
+            bullet.level,
+            bullet.line,
+            SourceView(buffer, bullet.start, bullet.end),
+            SourceView(buffer, desc_start, desc_end),
+        )
+        for bullet, desc_start, desc_end in section.bullets
+    )
+
+
+def parse_document(buffer: bytes, path: Optional[str] = None) -> SourceDocument:
+    """Parse a source buffer into a SourceDocument"""
+    return build_document(buffer, list(tokenize(buffer)), path)
+
+
+def build_document(buffer: bytes, events, path: Optional[str] = None) -> SourceDocument:
+    """Build the section tree from an already tokenized event stream"""
+    limit = len(buffer)
+    content_start = find_content_start(buffer)
+
+    # Lores only count after the format comments; forms are found anywhere
+    lore_events = [e for e in events if e.start >= content_start]
+    lores = [
+        Lore(
+            strip_lore_markers(section.header.name),
+            section.header.line,
+            SourceView(buffer, section.header.start, section.header.end),
+            SourceView(buffer, section.body_start, section.body_end),
+            _entries(buffer, section, Evocation),
+        )
+        for section in group_sections(lore_events, limit, kinds=(LORE,), closers=SECTION_KINDS)
+    ]
+    visages = [
+        Visage(
+            section.header.name,
+            section.header.line,
+            SourceView(buffer, section.header.start, section.header.end),
+            SourceView(buffer, section.body_start, section.body_end),
+            _entries(buffer, section, Power),
+        )
+        for section in group_sections(events, limit, kinds=(FORM,), closers=FORM_CLOSERS)
+    ]
+
+    # Both lists are in file order, so attaching them to houses is one merge
+    house_events = [e for e in events if e.kind in (HOUSE_TITLE, HOUSE)]
+    houses = []
+    lore_index = visage_index = 0
+    boundaries = [None] + house_events
+    for i, house_event in enumerate(boundaries):
+        next_start = boundaries[i + 1].start if i + 1 < len(boundaries) else limit + 1
+        house_lores = []
+        while lore_index < len(lores) and lores[lore_index].header.start < next_start:
+            house_lores.append(lores[lore_index])
+            lore_index += 1
+        house_visages = []
+        while visage_index < len(visages) and visages[visage_index].header.start < next_start:
+            house_visages.append(visages[visage_index])
+            visage_index += 1
+        if house_event is None:
+            if house_lores or house_visages:
+                houses.append(House('', '', 0, tuple(house_lores), tuple(house_visages)))
+            continue
+        houses.append(House(house_event.name, house_event.kind, house_event.line,
+                            tuple(house_lores), tuple(house_visages)))
+
+    return SourceDocument(path, buffer, content_start, tuple(houses), tuple(events))
+
+
+def map_file(path: str):
+    """Read-only memory map of a file (b'' for an empty file, which mmap refuses)"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        # The map stays valid after the file object is closed
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def load_document(path: str = DEFAULT_SOURCE) -> SourceDocument:
+    """Memory-map and parse a source book"""
+    return parse_document(map_file(path), path)
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Normalized SQLite export of the datasource JSON with an FTS5 search index.
+
+Every row remembers the file it came from, and the sources table keeps the
+SHA-256 of each file as it was exported. export_sqlite() only re-exports
+files whose digest changed (deleting their old rows first), so refreshing
+the database after editing one file touches that file alone.
+
+The search table is an FTS5 index over the name and description of every
+row; search_sqlite() returns bm25-ranked hits. Plain queries match every
+word as typed, so names like Ba'al or deathgrip-claws need no escaping;
+raw=True passes FTS5 syntax through:
+
+    export_sqlite('datasource', 'datasource.sqlite')
+    for hit in search_sqlite('datasource.sqlite', 'wings OR flight', raw=True):
+        print(hit['kind'], hit['name'])
+"""
+
+import json
+import os
+import sqlite3
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from .cache import file_digest
+from .diff import lore_id
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS sources (path TEXT PRIMARY KEY, digest TEXT NOT NULL, rows INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS lores (
+    id TEXT, source TEXT NOT NULL, name TEXT, house TEXT, black_knowledge INTEGER);
+CREATE TABLE IF NOT EXISTS evocations (
+    lore_id TEXT, source TEXT NOT NULL, level INTEGER, name TEXT, description TEXT, system TEXT, torment TEXT);
+CREATE TABLE IF NOT EXISTS forms (
+    id TEXT, source TEXT NOT NULL, name TEXT, house TEXT, associated_lore TEXT, description TEXT);
+CREATE TABLE IF NOT EXISTS form_powers (
+    form_id TEXT, source TEXT NOT NULL, position INTEGER, name TEXT, description TEXT, is_high_torment INTEGER);
+CREATE TABLE IF NOT EXISTS earthbound_features (
+    id TEXT, source TEXT NOT NULL, name TEXT, point_cost INTEGER, description TEXT);
+CREATE TABLE IF NOT EXISTS traits (
+    id TEXT, source TEXT NOT NULL, line TEXT, kind TEXT, name TEXT, value TEXT, description TEXT);
+CREATE TABLE IF NOT EXISTS backgrounds (
+    id TEXT, source TEXT NOT NULL, line TEXT, name TEXT, max_rating INTEGER, description TEXT);
+CREATE TABLE IF NOT EXISTS spheres (
+    id TEXT, source TEXT NOT NULL, name TEXT, subtitle TEXT, description TEXT);
+CREATE TABLE IF NOT EXISTS charms (
+    id TEXT, source TEXT NOT NULL, name TEXT, difficulty TEXT, essence_cost TEXT, description TEXT);
+CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5(
+    kind UNINDEXED, ref UNINDEXED, source UNINDEXED, name, description, tokenize = 'porter unicode61');
+CREATE INDEX IF NOT EXISTS evocations_lore ON evocations (lore_id);
+CREATE INDEX IF NOT EXISTS form_powers_form ON form_powers (form_id);
+"""
+
+DATA_TABLES = (
+    'lores', 'evocations', 'forms', 'form_powers', 'earthbound_features',
+    'traits', 'backgrounds', 'spheres', 'charms',
+)
+
+# A row to insert: (table, columns, search kind, search ref)
+Row = Tuple[str, Dict, str, str]
+
+
+def _text(value) -> str:
+    """Scalar JSON values as text; lists and objects as compact JSON"""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def _entries(data, key: str) -> List[Dict]:
+    value = data.get(key) if isinstance(data, dict) else None
+    return [entry for entry in value if isinstance(entry, dict)] if isinstance(value, list) else []
+
+
+def lore_rows(data) -> Iterator[Row]:
+    for key in ('lorePaths', 'blackKnowledge'):
+        for lore in _entries(data, key):
+            identifier = lore.get('id') or lore_id(lore.get('name', ''))
+            yield 'lores', {
+                'id': identifier, 'name': lore.get('name'), 'house': lore.get('house'),
+                'black_knowledge': int(key == 'blackKnowledge'),
+            }, 'lore', identifier
+            for evocation in lore.get('evocations') or []:
+                yield 'evocations', {
+                    'lore_id': identifier, 'level': evocation.get('level'), 'name': evocation.get('name'),
+                    'description': _text(evocation.get('description')),
+                    'system': _text(evocation.get('system')), 'torment': _text(evocation.get('torment')),
+                }, 'evocation', f"{identifier}.{evocation.get('level')}"
+
+
+def form_rows(data) -> Iterator[Row]:
+    for form in _entries(data, 'apocalypticForms'):
+        identifier = form.get('id') or lore_id(form.get('name', ''))
+        yield 'forms', {
+            'id': identifier, 'name': form.get('name'), 'house': form.get('house'),
+            'associated_lore': form.get('associatedLore'), 'description': _text(form.get('description')),
+        }, 'form', identifier
+        for position, power in enumerate(form.get('powers') or []):
+            yield 'form_powers', {
+                'form_id': identifier, 'position': position, 'name': power.get('name'),
+                'description': _text(power.get('description')),
+                'is_high_torment': int(bool(power.get('isHighTorment'))),
+            }, 'power', f"{identifier}.{position}"
+
+
+def feature_rows(data) -> Iterator[Row]:
+    for feature in _entries(data, 'apocalypticPowers'):
+        identifier = feature.get('id') or lore_id(feature.get('name', ''))
+        yield 'earthbound_features', {
+            'id': identifier, 'name': feature.get('name'), 'point_cost': feature.get('pointCost'),
+            'description': _text(feature.get('description')),
+        }, 'feature', identifier
+
+
+def trait_rows(line: str) -> Callable:
+    def rows(data) -> Iterator[Row]:
+        for key, kind in (('merits', 'merit'), ('flaws', 'flaw')):
+            for trait in _entries(data, key):
+                identifier = trait.get('id') or lore_id(trait.get('name', ''))
+                yield 'traits', {
+                    'id': identifier, 'line': line, 'kind': kind, 'name': trait.get('name'),
+                    'value': _text(trait.get('value')), 'description': _text(trait.get('description')),
+                }, kind, identifier
+    return rows
+
+
+def background_rows(line: str) -> Callable:
+    def rows(data) -> Iterator[Row]:
+        for background in _entries(data, 'backgrounds'):
+            identifier = background.get('id') or lore_id(background.get('name', ''))
+            max_rating = background.get('maxRating')
+            yield 'backgrounds', {
+                'id': identifier, 'line': line, 'name': background.get('name'),
+                'max_rating': max_rating if isinstance(max_rating, int) else None,
+                'description': _text(background.get('description')),
+            }, 'background', identifier
+    return rows
+
+
+def sphere_rows(data) -> Iterator[Row]:
+    for sphere in _entries(data, 'spheres'):
+        identifier = sphere.get('id') or lore_id(sphere.get('name', ''))
+        yield 'spheres', {
+            'id': identifier, 'name': sphere.get('name'), 'subtitle': sphere.get('subtitle'),
+            'description': _text(sphere.get('description')),
+        }, 'sphere', identifier
+
+
+def charm_rows(data) -> Iterator[Row]:
+    for charm in _entries(data, 'charms'):
+        identifier = charm.get('id') or lore_id(charm.get('name', ''))
+        yield 'charms', {
+            'id': identifier, 'name': charm.get('name'), 'difficulty': _text(charm.get('difficulty')),
+            'essence_cost': _text(charm.get('essenceCost')), 'description': _text(charm.get('description')),
+        }, 'charm', identifier
+
+
+# datasource-relative path -> row generator
+EXPORTS = {
+    'D20/lore.json': lore_rows,
+    'D20/apocalyptic_forms.json': form_rows,
+    'D20/apocalyptic_powers.json': feature_rows,
+    'D20/merits_flaws.json': trait_rows('D20'),
+    'D20/backgrounds.json': background_rows('D20'),
+    'M20/merits_flaws.json': trait_rows('M20'),
+    'M20/backgrounds.json': background_rows('M20'),
+    'M20/spheres.json': sphere_rows,
+    'M20/charms.json': charm_rows,
+}
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(db_path)
+    version = connection.execute("PRAGMA user_version").fetchone()[0]
+    if version not in (0, SCHEMA_VERSION):
+        # Built by an older exporter; start over rather than migrate
+        connection.close()
+        os.remove(db_path)
+        connection = sqlite3.connect(db_path)
+    connection.executescript(SCHEMA)
+    connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return connection
+
+
+def _remove_source(connection: sqlite3.Connection, path: str):
+    for table in DATA_TABLES:
+        connection.execute(f"DELETE FROM {table} WHERE source = ?", (path,))
+    connection.execute("DELETE FROM search WHERE source = ?", (path,))
+    connection.execute("DELETE FROM sources WHERE path = ?", (path,))
+
+
+def _insert_source(connection: sqlite3.Connection, path: str, data, rows: Callable) -> int:
+    count = 0
+    search_rows = []
+    for table, columns, kind, ref in rows(data):
+        columns['source'] = path
+        names = ', '.join(columns)
+        marks = ', '.join('?' * len(columns))
+        connection.execute(f"INSERT INTO {table} ({names}) VALUES ({marks})", tuple(columns.values()))
+        # Evocations keep their rules text in system/torment rather than description
+        text = ' '.join(filter(None, (columns.get(key) for key in ('description', 'system', 'torment'))))
+        search_rows.append((kind, ref, path, columns.get('name') or '', text))
+        count += 1
+    connection.executemany(
+        "INSERT INTO search (kind, ref, source, name, description) VALUES (?, ?, ?, ?, ?)", search_rows)
+    return count
+
+
+def export_sqlite(root: str = 'datasource', db_path: str = 'datasource.sqlite',
+                  force: bool = False) -> Dict[str, str]:
+    """Bring db_path up to date with root; returns {path: 'added'|'updated'|'removed'|'unchanged'}"""
+    connection = _connect(db_path)
+    status = {}
+    try:
+        with connection:
+            known = dict(connection.execute("SELECT path, digest FROM sources"))
+            for path, rows in EXPORTS.items():
+                full_path = os.path.join(root, path)
+                if not os.path.exists(full_path):
+                    if path in known:
+                        _remove_source(connection, path)
+                        status[path] = 'removed'
+                    continue
+                digest = file_digest(full_path)
+                if not force and known.get(path) == digest:
+                    status[path] = 'unchanged'
+                    continue
+                with open(full_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                _remove_source(connection, path)
+                count = _insert_source(connection, path, data, rows)
+                connection.execute("INSERT INTO sources (path, digest, rows) VALUES (?, ?, ?)",
+                                   (path, digest, count))
+                status[path] = 'updated' if path in known else 'added'
+            connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('root', ?)",
+                               (os.path.abspath(root),))
+        if any(state != 'unchanged' for state in status.values()):
+            connection.execute("INSERT INTO search (search) VALUES ('optimize')")
+            connection.commit()
+    finally:
+        connection.close()
+    return status
+
+
+def fts_query(text: str) -> str:
+    """FTS5 query matching every word of text: each word becomes a quoted phrase, dread* stays a prefix"""
+    terms = []
+    for word in text.split():
+        prefix = word.endswith('*') and len(word) > 1
+        word = word.rstrip('*') if prefix else word
+        terms.append('"' + word.replace('"', '""') + '"' + ('*' if prefix else ''))
+    return ' '.join(terms)
+
+
+def search_sqlite(db_path: str, query: str, limit: int = 20, kind: str = None,
+                  raw: bool = False) -> List[Dict]:
+    """bm25-ranked full-text hits for the words of query
+
+    With raw=True the query is FTS5 syntax (wings OR flight, "lordly mien",
+    name:dread*) and a malformed one raises sqlite3.OperationalError.
+    """
+    if not raw:
+        query = fts_query(query)
+    connection = sqlite3.connect(db_path)
+    connection.row_factory = sqlite3.Row
+    try:
+        sql = ("SELECT kind, ref, source, name, "
+               "snippet(search, 4, '[', ']', '…', 12) AS snippet, bm25(search, 0.0, 0.0, 0.0, 5.0, 1.0) AS rank "
+               "FROM search WHERE search MATCH ?")
+        params = [query]
+        if kind:
+            sql += " AND kind = ?"
+            params.append(kind)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in connection.execute(sql, params)]
+    finally:
+        connection.close()
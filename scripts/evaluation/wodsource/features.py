@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Single-pass scanner for point-cost feature books.
+
+Books like earthbound-apocaliptic.md list bought powers under
+"N-POINT FEATURES" headers, one "• Name: description" bullet each, with an
+optional "TOTAL: N" line closing the list. One regex pass over the text
+finds every header, bullet and total, so sections for any N are split
+without searching the file again per cost. Tokens are not anchored to line
+starts, so markdown-wrapped headers ("**1-POINT FEATURES**", "## ..."),
+indented bullets and "TOTAL: 1 feature" count as they always have:
+
+    sections = scan_point_features(content, free=r'Face\\s+of\\s+Terror')
+    sections[3]           # [PointFeature('Wings', 3, 'fly.', 512, 526), ...]
+
+Features named by the optional free pattern (for instance the Earthbound
+Face of Terror, which every Earthbound has) are filed under cost 0; only
+the first mention is a feature, later ones are description text.
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+_SECTION = r'(?i:(?P<cost>\d+)-POINT\s+FEATURES)'
+_TOTAL = r'TOTAL:\s*\d+'
+# A bullet name may wrap onto the next line, but never across a header or total
+_BULLET = r'•\s*(?P<name>(?:(?!(?i:\d+-POINT\s+FEATURES)|TOTAL:\s*\d)[^:•])+):'
+_TOKENS: Dict[Optional[str], re.Pattern] = {}
+
+
+class PointFeature(NamedTuple):
+    name: str
+    cost: int
+    description: str
+    start: int   # offset of the bullet (or free feature name)
+    end: int     # offset where the next header, bullet or total begins
+
+
+def _tokens(free: Optional[str]) -> re.Pattern:
+    pattern = _TOKENS.get(free)
+    if pattern is None:
+        alternatives = [_SECTION, _TOTAL, _BULLET]
+        if free:
+            alternatives.insert(0, rf'(?i:(?P<free>{free})):')
+        pattern = re.compile('|'.join(alternatives))
+        _TOKENS[free] = pattern
+    return pattern
+
+
+def scan_point_features(content: str, free: Optional[str] = None) -> Dict[int, List[PointFeature]]:
+    """{cost: features in source order} for every N-POINT FEATURES section
+
+    A feature's description runs from its name to the next token, so
+    continuation lines are kept. Bullets before the first header or after
+    a TOTAL line belong to no section and are skipped. Every header found
+    gets an entry, even when its section is empty.
+    """
+    sections: Dict[int, List[PointFeature]] = {}
+    cost = None
+    pending = None   # (name, cost, start, end of token)
+    seen_free = False
+
+    def close(end: int):
+        if pending is not None:
+            name, feature_cost, start, text_end = pending
+            description = content[text_end:end].strip()
+            sections.setdefault(feature_cost, []).append(
+                PointFeature(name, feature_cost, description, start, end))
+
+    for match in _tokens(free).finditer(content):
+        # lastgroup names the token: 'name' bullet, 'cost' header, 'free' free feature
+        token = match.lastgroup
+        if (token == 'name' and cost is None and free and not seen_free
+                and re.fullmatch(free, match.group('name').strip(), re.IGNORECASE)):
+            token = 'free'   # "• Face of Terror:" before the first header
+        if token == 'free' and seen_free:
+            continue
+        close(match.start())
+        pending = None
+        if token == 'name':
+            if cost is not None:
+                pending = (match.group('name').strip(), cost, match.start(), match.end())
+        elif token == 'cost':
+            cost = int(match.group('cost'))
+            sections.setdefault(cost, [])
+        elif token == 'free':
+            seen_free = True
+            pending = (match.group(match.lastgroup).strip(), 0, match.start(), match.end())
+        else:
+            cost = None   # TOTAL closes the last section
+    close(len(content))
+    return sections
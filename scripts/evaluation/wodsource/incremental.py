@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Incremental re-parse of an edited source book.
+
+The previous parse of a file is kept in the cache. When the file changes,
+the common prefix and suffix with the previous bytes are skipped and only
+the lines in between are tokenized again; events outside that window are
+reused with their offsets shifted. The section tree is then rebuilt from
+the spliced event stream, which gives exactly the tree a full parse would.
+
+Several small edits far apart collapse into one window spanning them, so
+the saving shrinks as edits spread out but the result stays correct.
+"""
+
+from typing import Dict, FrozenSet, Iterable, NamedTuple, Optional, Tuple
+
+from .cache import load_state, note_read, store_state
+from .document import DEFAULT_SOURCE, SourceDocument, build_document, parse_document
+from .tokenizer import tokenize
+
+_CHUNK = 1 << 16
+
+
+class ChangeSet(NamedTuple):
+    """What an edit touched, in old and new buffer coordinates"""
+    old_start: int
+    old_end: int
+    new_start: int
+    new_end: int
+    lores: FrozenSet[str]    # names of lores added, removed or edited
+    visages: FrozenSet[str]  # names of visages added, removed or edited
+
+    @property
+    def empty(self) -> bool:
+        return not self.lores and not self.visages
+
+
+NO_CHANGES = ChangeSet(0, 0, 0, 0, frozenset(), frozenset())
+
+
+def _common_prefix(a: bytes, b: bytes) -> int:
+    """Length of the shared prefix, compared a chunk at a time"""
+    limit = min(len(a), len(b))
+    pos = 0
+    while pos < limit:
+        step = min(_CHUNK, limit - pos)
+        if a[pos:pos + step] == b[pos:pos + step]:
+            pos += step
+            continue
+        while a[pos] == b[pos]:
+            pos += 1
+        return pos
+    return limit
+
+
+def _common_suffix(a: bytes, b: bytes, floor: int) -> int:
+    """Length of the shared suffix that does not reach back past floor"""
+    limit = min(len(a), len(b)) - floor
+    length = 0
+    while length < limit:
+        step = min(_CHUNK, limit - length)
+        if a[len(a) - length - step:len(a) - length] == b[len(b) - length - step:len(b) - length]:
+            length += step
+            continue
+        while a[len(a) - length - 1] == b[len(b) - length - 1]:
+            length += 1
+        return length
+    return limit
+
+
+def dirty_window(old: bytes, new: bytes) -> Tuple[int, int, int]:
+    """Line-aligned (start, old_end, new_end) window covering every changed byte"""
+    prefix = _common_prefix(old, new)
+    start = old.rfind(b'\n', 0, prefix) + 1
+
+    suffix = _common_suffix(old, new, start)
+    old_end = len(old) - suffix
+    new_end = len(new) - suffix
+    if _at_line_start(old, old_end) and _at_line_start(new, new_end):
+        return start, old_end, new_end
+
+    # Both buffers are identical past the window, so extend both to the same newline
+    nl = new.find(b'\n', new_end)
+    if nl == -1:
+        return start, len(old), len(new)
+    tail = nl + 1 - new_end
+    return start, old_end + tail, new_end + tail
+
+
+def _at_line_start(buf: bytes, pos: int) -> bool:
+    return pos == 0 or buf[pos - 1] == 10
+
+
+def _touching(entities, start: int, end: int):
+    """Names of entities whose header-to-body range touches [start, end]"""
+    return {e.name for e in entities if e.header.start <= end and e.body.end >= start}
+
+
+def reparse(previous: SourceDocument, buffer: bytes,
+            path: Optional[str] = None) -> Tuple[SourceDocument, ChangeSet]:
+    """Re-parse buffer, reusing every event of previous outside the edit"""
+    old = previous.buffer
+    if old == buffer:
+        return previous, NO_CHANGES
+
+    start, old_end, new_end = dirty_window(old, buffer)
+    shift = new_end - old_end
+    line_shift = buffer.count(b'\n', start, new_end) - old.count(b'\n', start, old_end)
+    first_line = buffer.count(b'\n', 0, start) + 1
+
+    before = [e for e in previous.events if e.start < start]
+    window = list(tokenize(buffer, start, new_end, first_line))
+    after = [
+        e._replace(start=e.start + shift, end=e.end + shift, line=e.line + line_shift)
+        for e in previous.events if e.start >= old_end
+    ]
+    document = build_document(buffer, before + window + after, path or previous.path)
+
+    changes = ChangeSet(
+        start, old_end, start, new_end,
+        frozenset(_touching(previous.lores, start, old_end) | _touching(document.lores, start, new_end)),
+        frozenset(_touching(previous.visages, start, old_end) | _touching(document.visages, start, new_end)),
+    )
+    return document, changes
+
+
+def load_document_incremental(path: str = DEFAULT_SOURCE,
+                              consumer: str = 'default') -> Tuple[SourceDocument, Optional[ChangeSet]]:
+    """Parse path, re-parsing only what changed since consumer's previous call.
+
+    Each consumer (usually one per evaluator) keeps its own previous parse,
+    so the change set covers every edit since that consumer last ran. It is
+    None when there is no previous parse to diff against, meaning every
+    entity should be treated as changed.
+    """
+    note_read(path)
+    with open(path, 'rb') as f:
+        buffer = f.read()
+
+    previous = load_state(f"document-{consumer}", path)
+    if previous is None:
+        document, changes = parse_document(buffer, path), None
+    else:
+        document, changes = reparse(previous, buffer, path)
+
+    if document is not previous:
+        store_state(f"document-{consumer}", path, document)
+    return document, changes
+
+
+def reusable_results(kind: str, path: str, changes: Optional[ChangeSet],
+                     inputs_digest: str, changed_names: Iterable[str]) -> Dict:
+    """Per-entity results of the previous run that the edit left valid.
+
+    Everything is stale when there is no change set, no stored results, or
+    the other inputs (e.g. the extracted JSON) changed since they were stored.
+    """
+    state = load_state(kind, path)
+    if changes is None or state is None or state.get('inputs') != inputs_digest:
+        return {}
+    changed = set(changed_names)
+    return {name: result for name, result in state['results'].items() if name not in changed}
+
+
+def remember_results(kind: str, path: str, inputs_digest: str, results: Dict):
+    """Store per-entity results for the next incremental run"""
+    store_state(kind, path, {'inputs': inputs_digest, 'results': results})
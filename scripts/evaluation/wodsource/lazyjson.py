@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Lazy, offset-indexed access to the large datasource JSON files.
+
+The file is memory-mapped and scanned once for the byte ranges of every
+object in its top-level arrays (apocalypticForms, lorePaths,
+blackKnowledge, apocalypticPowers), together with each object's id and
+name. The ranges are written to a sidecar next to the file
+(apocalyptic_forms.json.offsets) and reused while the file's size and
+mtime are unchanged. A lookup decodes only the requested entry from the
+map, so memory stays flat however large the merged corpus grows:
+
+    with LazyJSONFile('datasource/D20/apocalyptic_forms.json') as forms:
+        form = forms.find('apocalypticForms', name='Bel, the Visage of Radiance')
+        for form in forms.iter('apocalypticForms'):
+            ...
+"""
+
+import json
+import mmap
+import os
+import re
+from typing import Dict, Iterable, Iterator, List, Optional
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = '.offsets'
+DEFAULT_ARRAYS = ('apocalypticForms', 'lorePaths', 'blackKnowledge', 'apocalypticPowers')
+
+# Strings (with escapes) and structural characters; numbers, literals and
+# whitespace are skipped
+_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\],:]')
+_ID_KEYS = {b'"id"': 2, b'"name"': 3}
+
+OPEN_OBJECT, CLOSE_OBJECT = ord('{'), ord('}')
+OPEN_ARRAY, CLOSE_ARRAY = ord('['), ord(']')
+QUOTE, COLON, COMMA = ord('"'), ord(':'), ord(',')
+
+
+def scan_offsets(buffer, keys: Iterable[str] = DEFAULT_ARRAYS) -> Dict[str, List[list]]:
+    """{array key: [[start, end, id, name], ...]} for the objects in the named top-level arrays"""
+    keys = set(keys)
+    arrays: Dict[str, List[list]] = {}
+    depth = 0
+    last_string = None  # most recent string token at depth 1 or inside an element
+    key = None          # top-level key whose value is being read
+    current = None      # offsets list of the array being scanned
+    element = None      # [start, end, id, name] of the object being scanned
+    field = None        # slot in element awaiting a string value
+
+    for match in _TOKEN.finditer(buffer):
+        char = buffer[match.start()]
+        if char == QUOTE:
+            if depth == 3 and element is not None and field is not None:
+                element[field] = json.loads(match.group())
+                field = None
+            elif depth == 1 or depth == 3:
+                last_string = match.group()
+            continue
+        if char == COLON:
+            if depth == 1:
+                key = json.loads(last_string)
+            elif depth == 3 and element is not None:
+                field = _ID_KEYS.get(last_string)
+            last_string = None
+            continue
+        field = None
+        if char == COMMA:
+            if depth == 1:
+                key = None
+        elif char == OPEN_OBJECT or char == OPEN_ARRAY:
+            if char == OPEN_ARRAY and depth == 1 and key in keys:
+                current = arrays.setdefault(key, [])
+            elif char == OPEN_OBJECT and depth == 2 and current is not None:
+                element = [match.start(), None, None, None]
+            depth += 1
+        else:
+            depth -= 1
+            if char == CLOSE_OBJECT and depth == 2 and element is not None:
+                element[1] = match.end()
+                current.append(element)
+                element = None
+            elif char == CLOSE_ARRAY and depth == 1:
+                current = None
+    return arrays
+
+
+class LazyJSONFile:
+    """A datasource JSON file whose array entries are decoded on demand"""
+
+    def __init__(self, path: str, keys: Iterable[str] = DEFAULT_ARRAYS, write_index: bool = True):
+        self.path = path
+        self.keys = tuple(keys)
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        # mmap refuses empty files; an empty file simply has no entries
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self.offsets = self._load_index(write_index)
+        self._by_id: Dict[str, Dict[str, int]] = {}
+        self._by_name: Dict[str, Dict[str, int]] = {}
+
+    def _stamp(self) -> Dict:
+        stat = os.fstat(self._file.fileno())
+        return {'version': INDEX_VERSION, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                'keys': sorted(self.keys)}
+
+    def _load_index(self, write_index: bool) -> Dict[str, List[list]]:
+        stamp = self._stamp()
+        index_path = self.path + INDEX_SUFFIX
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get('stamp') == stamp:
+                return stored['arrays']
+        except (OSError, ValueError):
+            pass
+
+        arrays = scan_offsets(self._map, self.keys)
+        if write_index:
+            try:
+                tmp_path = f"{index_path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'stamp': stamp, 'arrays': arrays}, f, separators=(',', ':'))
+                os.replace(tmp_path, index_path)
+            except OSError:
+                # A read-only datasource still works, it just rescans next time
+                pass
+        return arrays
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def count(self, key: str) -> int:
+        return len(self.offsets.get(key, []))
+
+    def ids(self, key: str) -> List[Optional[str]]:
+        """Ids of the entries in key, read from the index without decoding"""
+        return [entry[2] for entry in self.offsets.get(key, [])]
+
+    def names(self, key: str) -> List[Optional[str]]:
+        """Names of the entries in key, read from the index without decoding"""
+        return [entry[3] for entry in self.offsets.get(key, [])]
+
+    def raw(self, key: str, position: int) -> bytes:
+        start, end = self.offsets[key][position][:2]
+        return self._map[start:end]
+
+    def get(self, key: str, position: int) -> Dict:
+        """Decode the entry at position in the key array"""
+        return json.loads(self.raw(key, position))
+
+    def iter(self, key: str) -> Iterator[Dict]:
+        """Decode the entries of key one at a time"""
+        for position in range(self.count(key)):
+            yield self.get(key, position)
+
+    def find(self, key: str, id: Optional[str] = None, name: Optional[str] = None) -> Optional[Dict]:
+        """Decode the entry with this id (or name), or None"""
+        if id is not None:
+            lookup, value = self._lookup(self._by_id, key, 2), id
+        else:
+            lookup, value = self._lookup(self._by_name, key, 3), name
+        position = lookup.get(value)
+        return self.get(key, position) if position is not None else None
+
+    def _lookup(self, cache: Dict, key: str, slot: int) -> Dict[str, int]:
+        if key not in cache:
+            table = {}
+            for position, entry in enumerate(self.offsets.get(key, [])):
+                # The first entry wins for duplicated ids, as with a linear scan
+                if entry[slot] is not None:
+                    table.setdefault(entry[slot], position)
+            cache[key] = table
+        return cache[key]
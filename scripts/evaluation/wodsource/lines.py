@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Line-start offset index for source books.
+
+The index is one array of line start offsets, built in a single scan and
+cached by content hash like the parsed documents. Turning an offset into a
+line number is a bisect, so any diagnostic can carry a lore.md:LINE
+location without re-splitting the file:
+
+    index = line_index('datasource/D20/lore.md')
+    index.line(offset)              # 1-based line number
+    index.location(offset)          # 'lore.md:412'
+    index.span(412)                 # (start, end) offsets of line 412
+"""
+
+import os
+import re
+from array import array
+from bisect import bisect_right
+from typing import Optional, Tuple
+
+from .cache import cached_load
+
+_NEWLINE_BYTES = re.compile(b'\n')
+_NEWLINE_TEXT = re.compile('\n')
+
+
+def source_location(path: Optional[str], line: Optional[int]) -> str:
+    """'lore.md:LINE' for a line in path ('' when the line is unknown)"""
+    if not line:
+        return ''
+    return f"{os.path.basename(path) if path else '<source>'}:{line}"
+
+
+class LineIndex:
+    """Start offsets of every line in a buffer"""
+
+    __slots__ = ('starts', 'length', 'path')
+
+    def __init__(self, starts: array, length: int, path: Optional[str] = None):
+        self.starts = starts
+        self.length = length
+        self.path = path
+
+    @classmethod
+    def build(cls, buffer, path: Optional[str] = None) -> 'LineIndex':
+        """Index a bytes, mmap or str buffer in one scan"""
+        pattern = _NEWLINE_TEXT if isinstance(buffer, str) else _NEWLINE_BYTES
+        starts = array('q', [0])
+        starts.extend(match.end() for match in pattern.finditer(buffer))
+        return cls(starts, len(buffer), path)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getstate__(self):
+        return (self.starts, self.length, self.path)
+
+    def __setstate__(self, state):
+        self.starts, self.length, self.path = state
+
+    def line(self, offset: int) -> int:
+        """1-based line number containing offset"""
+        return bisect_right(self.starts, offset)
+
+    def span(self, line: int) -> Tuple[int, int]:
+        """(start, end) offsets of a 1-based line, excluding its newline"""
+        start = self.starts[line - 1]
+        end = self.starts[line] - 1 if line < len(self.starts) else self.length
+        return start, end
+
+    def location(self, offset: int) -> str:
+        """'lore.md:LINE' for an offset"""
+        return source_location(self.path, self.line(offset))
+
+
+def line_index(path: str) -> LineIndex:
+    """LineIndex for a file, cached by content hash"""
+    return cached_load(path, 'lines', lambda data: LineIndex.build(data, path))
+
+
+def document_lines(document) -> LineIndex:
+    """LineIndex for a SourceDocument's buffer"""
+    if document.path and os.path.exists(document.path):
+        return line_index(document.path)
+    return LineIndex.build(document.buffer, document.path)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Name matching between source entities and their extracted counterparts.
+
+A NameIndex normalizes every candidate name once and keeps two indexes:
+
+    exact    normalized name -> candidate
+    trigram  trigram -> candidates containing it
+
+Lookups try the exact index first. Names that still differ (usually OCR
+damage such as dropped spaces or swapped letters) fall back to the trigram
+postings: only candidates sharing enough trigrams with the query are ranked,
+and only the best few of those get a full edit-similarity score, so a lookup
+costs the size of its rarest postings rather than the number of candidates.
+"""
+
+import heapq
+import re
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Union
+
+_NON_ALNUM = re.compile(r'[^a-z0-9\s]')
+_SPACES = re.compile(r'\s+')
+
+# Fuzzy matches scoring below this are treated as no match
+DEFAULT_THRESHOLD = 0.8
+# Only this many trigram-ranked candidates get the full similarity score
+_SHORTLIST = 8
+# Candidates sharing fewer than this fraction of the query's trigrams are never scored
+_MIN_SHARED = 0.3
+# Postings at most this long are always used, however many candidates there are
+_COMMON_POSTING = 64
+
+
+class Match(NamedTuple):
+    """Best candidate for a query name"""
+    query: str
+    candidate: str
+    score: float  # 1.0 for an exact normalized match
+    exact: bool = False
+
+
+def normalize_key(name: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace"""
+    return _SPACES.sub(' ', _NON_ALNUM.sub('', name.lower())).strip()
+
+
+def trigrams(key: str) -> Set[str]:
+    """Character trigrams of a normalized key, ignoring spaces"""
+    padded = f" {key.replace(' ', '')} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """Exact and trigram indexes over a fixed set of candidate names"""
+
+    def __init__(self, names: Iterable[str], normalize: Callable[[str], str] = normalize_key):
+        self.normalize = normalize
+        self.names: List[str] = []
+        self.keys: List[str] = []
+        self.exact: Dict[str, str] = {}
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        for name in names:
+            key = normalize(name)
+            # First candidate wins, as with a dict comprehension over the list
+            if key in self.exact:
+                continue
+            self.exact[key] = name
+            position = len(self.names)
+            self.names.append(name)
+            self.keys.append(key)
+            for gram in trigrams(key):
+                self.postings[gram].append(position)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return self.normalize(name) in self.exact
+
+    def get(self, name: str) -> Optional[str]:
+        """The candidate with the same normalized name, if any"""
+        return self.exact.get(self.normalize(name))
+
+    def fuzzy(self, name: str, threshold: float = DEFAULT_THRESHOLD,
+              exclude: Optional[Set[str]] = None) -> Optional[Match]:
+        """Best non-exact candidate scoring at least threshold"""
+        key = self.normalize(name)
+        postings = [self.postings[gram] for gram in trigrams(key) if gram in self.postings]
+        # Trigrams shared by most names ("vis", "the") cannot tell candidates
+        # apart and would make every lookup linear, so they are left out
+        common = max(_COMMON_POSTING, len(self.names) // 20)
+        selective = [posting for posting in postings if len(posting) <= common]
+        postings = selective or postings
+        needed = max(1, int(len(postings) * _MIN_SHARED))
+
+        shared = Counter()
+        for posting in postings:
+            shared.update(posting)
+
+        ranked = heapq.nlargest(
+            _SHORTLIST,
+            (item for item in shared.items()
+             if item[1] >= needed and not (exclude and self.names[item[0]] in exclude)),
+            key=itemgetter(1),
+        )
+
+        # The query side of the matcher is analysed once and reused per candidate
+        matcher = SequenceMatcher(None, autojunk=False)
+        matcher.set_seq2(key.replace(' ', ''))
+        best = None
+        for position, _ in ranked:
+            floor = max(threshold, best.score if best else 0.0)
+            matcher.set_seq1(self.keys[position].replace(' ', ''))
+            if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                continue
+            score = matcher.ratio()
+            if score >= floor and (best is None or score > best.score):
+                best = Match(name, self.names[position], round(score, 3))
+        return best
+
+    def match(self, name: str, threshold: float = DEFAULT_THRESHOLD,
+              exclude: Optional[Set[str]] = None) -> Optional[Match]:
+        """Exact match if there is one, otherwise the best fuzzy candidate"""
+        candidate = self.get(name)
+        if candidate is not None and not (exclude and candidate in exclude):
+            return Match(name, candidate, 1.0, True)
+        return self.fuzzy(name, threshold, exclude)
+
+
+def match_names(queries: Iterable[str], candidates: Union[Iterable[str], 'NameIndex'],
+                threshold: float = DEFAULT_THRESHOLD,
+                normalize: Callable[[str], str] = normalize_key) -> Dict[str, Optional[Match]]:
+    """One-to-one matching of queries to candidates.
+
+    Exact matches are claimed first, so a fuzzy match can never take a
+    candidate that another query matches exactly. candidates may be a
+    prebuilt NameIndex, in which case normalize is ignored.
+    """
+    index = candidates if isinstance(candidates, NameIndex) else NameIndex(candidates, normalize)
+    queries = list(queries)
+    matches: Dict[str, Optional[Match]] = {}
+    claimed: Set[str] = set()
+
+    for query in queries:
+        candidate = index.get(query)
+        if candidate is not None and candidate not in claimed:
+            matches[query] = Match(query, candidate, 1.0, True)
+            claimed.add(candidate)
+
+    for query in queries:
+        if query in matches:
+            continue
+        match = index.fuzzy(query, threshold, claimed)
+        matches[query] = match
+        if match:
+            claimed.add(match.candidate)
+
+    return matches
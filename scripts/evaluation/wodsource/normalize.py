@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Single-pass OCR normalization for visage, lore and power names.
+
+All OCR rules are compiled into one alternation and applied with a single
+re.sub whose callback picks the replacement for whichever rule matched.
+normalize_batch joins many names into one newline-separated string so
+thousands of names cost one substitution pass; no rule crosses a newline.
+
+Rules (in priority order):
+    visage  visaGeoF / viSage / the the Visage of of  -> the Visage of
+    dup     doubled "the" / "of"                      -> single word
+    join    SPHEREOF CHAOS / WAVETHE X                -> SPHERE of CHAOS
+    word    liGht / maniPulate / shaPe                -> Light / Manipulate / Shape
+"""
+
+import re
+from typing import Iterable, List
+
+_SPACE = r'[^\S\n]'
+
+_KNOWN_WORDS = {
+    'liGht': 'Light',
+    'maniPulate': 'Manipulate',
+    'shaPe': 'Shape',
+}
+
+_RULES = (
+    ('visage', rf'(?i:(?:\bthe{_SPACE}+)*visage(?:{_SPACE}*of)?(?:{_SPACE}+of\b)*(?![a-z]))'),
+    ('dup', rf'\b(?P<dup>the|of)(?:{_SPACE}+(?P=dup)\b)+'),
+    ('join', rf'(?<=[A-Z])(?P<join>OF|THE){_SPACE}*(?=[A-Z])'),
+    ('word', '|'.join(re.escape(word) for word in _KNOWN_WORDS)),
+)
+
+# Only the visage and dup rules belong to normalize_ocr_text
+_OCR_PATTERN = re.compile('|'.join(f"(?P<{name}_>{pattern})" for name, pattern in _RULES[:2]))
+_NAME_PATTERN = re.compile('|'.join(f"(?P<{name}_>{pattern})" for name, pattern in _RULES))
+_BULLETS = re.compile(r'^(•*)\s*')
+
+
+_REPLACEMENTS = {
+    'visage_': lambda match: 'the Visage of',
+    'dup_': lambda match: match.group('dup'),
+    'join_': lambda match: f" {match.group('join').lower()} ",
+    'word_': lambda match: _KNOWN_WORDS[match.group(0)],
+}
+
+
+def _replace(match) -> str:
+    """Replacement for whichever rule matched (its outer group closes last)"""
+    return _REPLACEMENTS[match.lastgroup](match)
+
+
+def _case(name: str, style: str) -> str:
+    """Apply the final casing, keeping any leading bullets"""
+    bullet_match = _BULLETS.match(name)
+    bullets = bullet_match.group(1)
+    rest = name[bullet_match.end():]
+    if style == 'title':
+        return bullets + rest.title()
+    if style == 'sentence':
+        return bullets + rest.capitalize()
+    return name
+
+
+def normalize_ocr_text(text: str) -> str:
+    """Normalize visage phrasing and doubled words in one pass"""
+    if not text:
+        return text
+    return _OCR_PATTERN.sub(_replace, text)
+
+
+def normalize_power_name(name: str, style: str = 'sentence') -> str:
+    """Normalize an evocation or power name.
+
+    style is 'sentence' (first letter capitalized, as the extraction script
+    writes names), 'title', or 'raw' to skip recasing.
+    """
+    if not name:
+        return name
+    return _case(_NAME_PATTERN.sub(_replace, name), style)
+
+
+def normalize_batch(names: Iterable[str], style: str = 'sentence') -> List[str]:
+    """normalize_power_name for many names with a single substitution pass"""
+    names = [name.replace('\n', ' ') for name in names]
+    if not names:
+        return []
+    joined = _NAME_PATTERN.sub(_replace, '\n'.join(names))
+    return [_case(name, style) for name in joined.split('\n')]
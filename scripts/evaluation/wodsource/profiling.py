@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Per-stage wall time and peak memory for the evaluation scripts.
+
+A StageProfiler is a lap timer: each call to stage() closes the running
+stage and opens the next, so an evaluator marks its stages without
+re-indenting its body. Memory is measured with tracemalloc, whose peak is
+reset at every stage boundary. A disabled profiler does nothing, so the
+calls can stay in the evaluators permanently.
+
+    profiler = StageProfiler(enabled=args.profile, dump_path=args.profile_dump)
+    profiler.stage('file_load')
+    ...
+    profiler.stage('report')
+    ...
+    metrics['profile'] = profiler.finish()
+
+finish() returns plain data that serializes to JSON:
+
+    {"stages": {"file_load": {"wall_time": 0.012, "peak_memory": 1048576, "calls": 1}, ...},
+     "total_time": 0.31, "peak_memory": 5242880, "pstats": "lore.pstats"}
+"""
+
+import cProfile
+import time
+import tracemalloc
+from typing import Dict, Optional
+
+
+class StageProfiler:
+    """Lap timer recording wall time and peak traced memory per stage"""
+
+    def __init__(self, enabled: bool = True, dump_path: Optional[str] = None):
+        self.enabled = enabled or bool(dump_path)
+        self.dump_path = dump_path
+        self.stages: Dict[str, Dict] = {}
+        self._current = None
+        self._started = None
+        self._stage_started = None
+        self._peak = 0
+        self._owns_tracing = False
+        self._profile = None
+        if self.enabled:
+            self._start()
+
+    def _start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        if self.dump_path:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._started = time.perf_counter()
+
+    def _close_stage(self):
+        if self._current is None:
+            return
+        elapsed = time.perf_counter() - self._stage_started
+        peak = tracemalloc.get_traced_memory()[1]
+        record = self.stages.setdefault(self._current, {'wall_time': 0.0, 'peak_memory': 0, 'calls': 0})
+        # A stage entered more than once accumulates time and keeps its highest peak
+        record['wall_time'] += elapsed
+        record['peak_memory'] = max(record['peak_memory'], peak)
+        record['calls'] += 1
+        self._peak = max(self._peak, peak)
+        self._current = None
+
+    def stage(self, name: str):
+        """Close the running stage and start timing name"""
+        if not self.enabled:
+            return
+        self._close_stage()
+        tracemalloc.reset_peak()
+        self._current = name
+        self._stage_started = time.perf_counter()
+
+    def finish(self) -> Optional[Dict]:
+        """Stop profiling and return the recorded timings (None when disabled)"""
+        if not self.enabled:
+            return None
+        self._close_stage()
+        total = time.perf_counter() - self._started
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile.dump_stats(self.dump_path)
+        if self._owns_tracing:
+            tracemalloc.stop()
+        self.enabled = False
+        return {
+            'stages': self.stages,
+            'total_time': total,
+            'peak_memory': self._peak,
+            'pstats': self.dump_path,
+        }
+
+
+def print_profile(profile: Optional[Dict]):
+    """Print a stage table for a finish() result"""
+    if not profile:
+        return
+    print(f"\n⏱️  PROFILE:")
+    for name, record in profile['stages'].items():
+        print(f"  {name:16} {record['wall_time'] * 1000:10.2f} ms  "
+              f"peak {record['peak_memory'] / 1024:10.1f} KB")
+    print(f"  {'total':16} {profile['total_time'] * 1000:10.2f} ms  "
+          f"peak {profile['peak_memory'] / 1024:10.1f} KB")
+    if profile['pstats']:
+        print(f"  cProfile stats written to {profile['pstats']}")
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Indexed in-memory queries over the D20/M20 datasource JSON.
+
+DatasourceIndex flattens every file into Records (lores, evocations,
+apocalyptic forms and their powers, Earthbound features, merits, flaws,
+backgrounds, spheres, charms, advantages) and keeps secondary indexes by
+id, house, lore, torment tier, point cost and power count, plus a sorted
+name list for prefix lookups. A query intersects the matching index sets,
+smallest first, so it costs microseconds instead of a scan:
+
+    index = DatasourceIndex.load()
+    for power in index.query(kind='power', prefix='deathgrip'):
+        print(index.parent(power).name)
+    index.query(kind='form', powers='!=8')
+"""
+
+import operator
+import os
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set
+
+from .cache import load_json_cached
+from .diff import lore_id
+from .matching import normalize_key
+
+LORE = 'lore'
+EVOCATION = 'evocation'
+FORM = 'form'
+POWER = 'power'
+FEATURE = 'feature'
+MERIT = 'merit'
+FLAW = 'flaw'
+BACKGROUND = 'background'
+SPHERE = 'sphere'
+CHARM = 'charm'
+ADVANTAGE = 'advantage'
+RECORD_KINDS = (LORE, EVOCATION, FORM, POWER, FEATURE, MERIT, FLAW, BACKGROUND, SPHERE, CHARM, ADVANTAGE)
+
+# (game line, file, top-level key, kind) for the flat collections
+_FLAT_SOURCES = (
+    ('D20', 'merits_flaws.json', 'merits', MERIT),
+    ('D20', 'merits_flaws.json', 'flaws', FLAW),
+    ('D20', 'backgrounds.json', 'backgrounds', BACKGROUND),
+    ('D20', 'apocalyptic_powers.json', 'apocalypticPowers', FEATURE),
+    ('M20', 'merits_flaws.json', 'merits', MERIT),
+    ('M20', 'merits_flaws.json', 'flaws', FLAW),
+    ('M20', 'backgrounds.json', 'backgrounds', BACKGROUND),
+    ('M20', 'spheres.json', 'spheres', SPHERE),
+    ('M20', 'charms.json', 'charms', CHARM),
+    ('M20', 's-advantages.json', 'advantages', ADVANTAGE),
+)
+
+_COMPARISON = re.compile(r'^\s*(==|!=|<=|>=|<|>)?\s*(\d+)\s*$')
+_OPERATORS = {
+    '==': operator.eq, '!=': operator.ne, '<': operator.lt,
+    '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+}
+
+
+class Record(NamedTuple):
+    kind: str
+    id: str
+    name: str
+    line: str                 # 'D20' or 'M20'
+    data: Dict[str, Any]      # the JSON entry itself (shared, read-only)
+    parent: Optional[int] = None  # record number of the owning lore/form
+    house: Optional[str] = None
+    lore: Optional[str] = None
+    torment: Optional[str] = None  # 'high' or 'low' for form powers
+    cost: Optional[int] = None
+
+
+def parse_comparison(expression):
+    """'8', '!=8', '<8' ... as a predicate on integers"""
+    if isinstance(expression, int):
+        return lambda value: value == expression
+    match = _COMPARISON.match(expression)
+    if not match:
+        raise ValueError(f"Not a comparison: {expression!r}")
+    compare = _OPERATORS[match.group(1) or '==']
+    target = int(match.group(2))
+    return lambda value: compare(value, target)
+
+
+def _entries(data, key: str) -> List[Dict]:
+    value = data.get(key) if isinstance(data, dict) else None
+    return [entry for entry in value if isinstance(entry, dict)] if isinstance(value, list) else []
+
+
+class DatasourceIndex:
+    """Records of every datasource file with secondary indexes"""
+
+    def __init__(self):
+        self.records: List[Record] = []
+        self.by_id: Dict[str, List[int]] = {}
+        self.by_kind: Dict[str, Set[int]] = {}
+        self.by_house: Dict[str, Set[int]] = {}
+        self.by_lore: Dict[str, Set[int]] = {}
+        self.by_torment: Dict[str, Set[int]] = {}
+        self.by_cost: Dict[int, Set[int]] = {}
+        self.by_power_count: Dict[int, Set[int]] = {}
+        self._names: List[tuple] = []  # sorted (normalized name, record number)
+
+    @classmethod
+    def load(cls, root: str = 'datasource') -> 'DatasourceIndex':
+        """Index every datasource file present under root"""
+        index = cls()
+
+        def load(line, name):
+            path = os.path.join(root, line, name)
+            return load_json_cached(path) if os.path.exists(path) else None
+
+        lore_data = load('D20', 'lore.json')
+        if lore_data:
+            for key in ('lorePaths', 'blackKnowledge'):
+                for lore in _entries(lore_data, key):
+                    index.add_lore(lore)
+        forms_data = load('D20', 'apocalyptic_forms.json')
+        if forms_data:
+            for form in _entries(forms_data, 'apocalypticForms'):
+                index.add_form(form)
+        for line, name, key, kind in _FLAT_SOURCES:
+            data = load(line, name)
+            if data:
+                for entry in _entries(data, key):
+                    index.add_entry(kind, line, entry)
+        index.finish()
+        return index
+
+    def add(self, record: Record) -> int:
+        """Append a record and index it; returns its record number"""
+        number = len(self.records)
+        self.records.append(record)
+        self.by_id.setdefault(record.id.lower(), []).append(number)
+        self.by_kind.setdefault(record.kind, set()).add(number)
+        if record.house:
+            self.by_house.setdefault(record.house.lower(), set()).add(number)
+        if record.lore:
+            self.by_lore.setdefault(record.lore.lower(), set()).add(number)
+        if record.torment:
+            self.by_torment.setdefault(record.torment, set()).add(number)
+        if record.cost is not None:
+            self.by_cost.setdefault(record.cost, set()).add(number)
+        if record.name:
+            self._names.append((normalize_key(record.name), number))
+        return number
+
+    def add_lore(self, lore: Dict):
+        identifier = lore.get('id') or lore_id(lore.get('name', ''))
+        house = lore.get('house')
+        number = self.add(Record(LORE, identifier, lore.get('name', ''), 'D20', lore,
+                                 house=house, lore=identifier))
+        for evocation in lore.get('evocations') or []:
+            self.add(Record(EVOCATION, f"{identifier}.{evocation.get('level')}", evocation.get('name', ''),
+                            'D20', evocation, parent=number, house=house, lore=identifier))
+
+    def add_form(self, form: Dict):
+        identifier = form.get('id') or lore_id(form.get('name', ''))
+        house = form.get('house')
+        lore = form.get('associatedLore')
+        powers = form.get('powers') or []
+        number = self.add(Record(FORM, identifier, form.get('name', ''), 'D20', form, house=house, lore=lore))
+        self.by_power_count.setdefault(len(powers), set()).add(number)
+        for power in powers:
+            name = power.get('name', '')
+            self.add(Record(POWER, f"{identifier}.{lore_id(name)}", name, 'D20', power, parent=number,
+                            house=house, lore=lore,
+                            torment='high' if power.get('isHighTorment') else 'low'))
+
+    def add_entry(self, kind: str, line: str, entry: Dict):
+        name = entry.get('name', '')
+        cost = entry.get('pointCost', entry.get('value'))
+        self.add(Record(kind, entry.get('id') or lore_id(name), name, line, entry,
+                        cost=cost if isinstance(cost, int) and not isinstance(cost, bool) else None))
+
+    def finish(self):
+        """Sort the name list; call after the last add()"""
+        self._names.sort()
+
+    def __len__(self):
+        return len(self.records)
+
+    def parent(self, record: Record) -> Optional[Record]:
+        """The lore of an evocation or the form of a power"""
+        return self.records[record.parent] if record.parent is not None else None
+
+    def children(self, record: Record) -> List[Record]:
+        """Evocations of a lore or powers of a form"""
+        kind = {LORE: EVOCATION, FORM: POWER}.get(record.kind)
+        if kind is None:
+            return []
+        entries = record.data.get('evocations' if kind == EVOCATION else 'powers') or []
+        first = self.by_id[record.id.lower()]
+        # Children are added right after their parent
+        number = next(n for n in first if self.records[n] is record)
+        return self.records[number + 1:number + 1 + len(entries)]
+
+    def get(self, identifier: str, kind: Optional[str] = None) -> List[Record]:
+        """Records with an id (case-insensitive), optionally of one kind"""
+        numbers = self.by_id.get(identifier.lower(), [])
+        return [self.records[n] for n in numbers if kind is None or self.records[n].kind == kind]
+
+    def prefix(self, text: str) -> Set[int]:
+        """Record numbers whose normalized name starts with text"""
+        key = normalize_key(text)
+        start = bisect_left(self._names, (key,))
+        numbers = set()
+        for name, number in self._names[start:]:
+            if not name.startswith(key):
+                break
+            numbers.add(number)
+        return numbers
+
+    def query(self, kind: Optional[str] = None, id: Optional[str] = None,
+              house: Optional[str] = None, lore: Optional[str] = None,
+              prefix: Optional[str] = None, torment: Optional[str] = None,
+              cost=None, powers=None, line: Optional[str] = None) -> List[Record]:
+        """Records matching every given filter, in load order
+
+        cost and powers take an int or a comparison such as '!=8' or '>=2';
+        powers is the number of powers of a form.
+        """
+        candidates: List[Set[int]] = []
+        if kind is not None:
+            candidates.append(self.by_kind.get(kind, set()))
+        if id is not None:
+            candidates.append(set(self.by_id.get(id.lower(), [])))
+        if house is not None:
+            candidates.append(self.by_house.get(house.lower(), set()))
+        if lore is not None:
+            candidates.append(self.by_lore.get(lore.lower(), set()))
+        if torment is not None:
+            candidates.append(self.by_torment.get(torment.lower(), set()))
+        if cost is not None:
+            candidates.append(self._compare(self.by_cost, cost))
+        if powers is not None:
+            candidates.append(self._compare(self.by_power_count, powers))
+        if prefix is not None:
+            candidates.append(self.prefix(prefix))
+
+        if not candidates:
+            numbers: Iterable[int] = range(len(self.records))
+        else:
+            candidates.sort(key=len)
+            numbers = candidates[0].intersection(*candidates[1:])
+        results = [self.records[n] for n in sorted(numbers)]
+        if line is not None:
+            results = [record for record in results if record.line == line.upper()]
+        return results
+
+    @staticmethod
+    def _compare(index: Dict[int, Set[int]], expression) -> Set[int]:
+        predicate = parse_comparison(expression)
+        keys = [key for key in index if predicate(key)]
+        if len(keys) == 1:
+            return index[keys[0]]
+        return set().union(*(index[key] for key in keys))
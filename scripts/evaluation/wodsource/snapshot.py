@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Content-addressed golden manifests of extracted entities.
+
+Every lore, evocation, visage, power and Earthbound feature in the JSON
+outputs is hashed on its own (a lore's hash leaves out its evocations, a
+visage's leaves out its powers), and so is every lore and visage section
+of the source book. A manifest maps entity keys to those hashes:
+
+    {"version": 1, "entities": {"lore:lore_of_radiance": "3f2a...",
+                                "evocation:lore_of_radiance.1": "9c1e...",
+                                "source-lore:lore of radiance": "b07d...", ...}}
+
+Comparing two manifests tells which entities were added, removed or
+changed, so a regression run only re-evaluates those.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, Optional
+
+from .diff import lore_id
+
+MANIFEST_VERSION = 1
+ADDED = 'added'
+REMOVED = 'removed'
+CHANGED = 'changed'
+
+
+def entity_hash(value) -> str:
+    """SHA-256 of a JSON value in canonical form"""
+    text = json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _without(entry: Dict, key: str) -> Dict:
+    return {k: v for k, v in entry.items() if k != key}
+
+
+def hash_lores(data, keys: Iterable[str] = ('lorePaths', 'blackKnowledge')) -> Dict[str, str]:
+    """lore:<id> and evocation:<id>.<level> hashes for lore.json data"""
+    hashes = {}
+    for key in keys:
+        for lore in (data or {}).get(key) or []:
+            identifier = lore.get('id') or lore_id(lore.get('name', ''))
+            hashes[f"lore:{identifier}"] = entity_hash(_without(lore, 'evocations'))
+            for evocation in lore.get('evocations') or []:
+                hashes[f"evocation:{identifier}.{evocation.get('level')}"] = entity_hash(evocation)
+    return hashes
+
+
+def hash_forms(data) -> Dict[str, str]:
+    """visage:<id> and power:<id>.<position> hashes for apocalyptic_forms.json data"""
+    hashes = {}
+    for form in (data or {}).get('apocalypticForms') or []:
+        identifier = form.get('id') or lore_id(form.get('name', ''))
+        hashes[f"visage:{identifier}"] = entity_hash(_without(form, 'powers'))
+        for position, power in enumerate(form.get('powers') or []):
+            hashes[f"power:{identifier}.{position}"] = entity_hash(power)
+    return hashes
+
+
+def hash_features(data) -> Dict[str, str]:
+    """feature:<id> hashes for apocalyptic_powers.json data"""
+    hashes = {}
+    for position, feature in enumerate((data or {}).get('apocalypticPowers') or []):
+        identifier = feature.get('id') or f"#{position}"
+        key = f"feature:{identifier}"
+        # Duplicated ids keep separate entries instead of hiding each other
+        if key in hashes:
+            key = f"{key}#{position}"
+        hashes[key] = entity_hash(feature)
+    return hashes
+
+
+def hash_source(document, lore_key, visage_key) -> Dict[str, str]:
+    """source-lore:<key> and source-visage:<key> hashes for a SourceDocument
+
+    lore_key and visage_key turn a section name into the key used to pair it
+    with its extracted entity; sections mapped to '' are skipped.
+    """
+    hashes = {}
+    for kind, sections, key in (('lore', document.lores, lore_key), ('visage', document.visages, visage_key)):
+        for section in sections:
+            name = key(section.name)
+            if name:
+                raw = bytes(document.buffer[section.header.start:section.body.end])
+                hashes[f"source-{kind}:{name}"] = hashlib.sha256(raw).hexdigest()
+    return hashes
+
+
+def compare_manifests(golden: Dict[str, str], current: Dict[str, str]) -> Dict[str, str]:
+    """{entity key: ADDED | REMOVED | CHANGED} for every entity that differs"""
+    changes = {}
+    for key, digest in current.items():
+        previous = golden.get(key)
+        if previous is None:
+            changes[key] = ADDED
+        elif previous != digest:
+            changes[key] = CHANGED
+    for key in golden.keys() - current.keys():
+        changes[key] = REMOVED
+    return changes
+
+
+def load_manifest(path: str) -> Optional[Dict[str, str]]:
+    """Entity hashes stored at path, or None when there is no usable manifest"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest['entities']
+
+
+def write_manifest(path: str, entities: Dict[str, str]):
+    """Store entity hashes with sorted keys so the file diffs cleanly"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'version': MANIFEST_VERSION, 'entities': entities}, f, indent=1, sort_keys=True)
+        f.write('\n')
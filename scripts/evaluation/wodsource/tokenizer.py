@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Single-pass section tokenizer for lore.md style source books.
+
+Walks the buffer once, line by line, and emits a typed event for every
+marker line. Offsets are positions in the buffer that was tokenized, so a
+bytes buffer yields byte offsets that can be sliced straight back out of
+the file.
+"""
+
+import re
+from typing import Iterator, NamedTuple, Optional, Union
+
+Buffer = Union[str, bytes, bytearray]
+
+# Event kinds, one per source marker
+HOUSE_TITLE = 'house_title'  # TTT<house>      e.g. TTTCommon lore
+LORE = 'lore'                # @@<lore>        e.g. @@Lore of the Fundament (or ##@@Lore of ...)
+HOUSE = 'house'              # ##<House>       e.g. ##Devils
+FORM = 'form'                # xx<visage>      e.g. xxBel, the visaGeoF the celestials
+BULLET = 'bullet'            # •<name>         evocation or apocalyptic power
+
+# Kinds that close an open lore section
+SECTION_KINDS = frozenset({HOUSE_TITLE, LORE, HOUSE, FORM})
+# Apocalyptic forms may quote @@ lore lines, so only these close a form
+FORM_CLOSERS = frozenset({HOUSE_TITLE, HOUSE, FORM})
+
+_HOUSE_NAME_PATTERN = re.compile(r'^[A-Z][a-zA-Z]+')
+_BULLET_CHAR = '•'
+
+
+class SectionEvent(NamedTuple):
+    """A marker line found in the source"""
+    kind: str
+    name: str
+    level: int   # bullet count for BULLET events, 0 otherwise
+    start: int   # offset of the first character of the line
+    end: int     # offset just past the line (excluding the newline)
+    line: int    # 1-based line number
+
+
+def as_text(chunk) -> str:
+    """Decode a buffer slice to str"""
+    if isinstance(chunk, str):
+        return chunk
+    return bytes(chunk).decode('utf-8', errors='replace')
+
+
+def classify_line(stripped: str) -> Optional[tuple]:
+    """Return (kind, name, level) for a stripped marker line, or None"""
+    if stripped.startswith('@@'):
+        return LORE, stripped[2:].strip(), 0
+    if stripped.startswith('xx'):
+        return FORM, stripped[2:].strip(), 0
+    if stripped.startswith('##') and _HOUSE_NAME_PATTERN.match(stripped[2:]):
+        return HOUSE, stripped[2:].strip(), 0
+    if stripped.startswith('##'):
+        # A lore header behind stray house markers; the unanchored @@ search
+        # this tokenizer replaced found these too
+        rest = stripped.lstrip('#').lstrip()
+        if rest.startswith('@@'):
+            return LORE, rest[2:].strip(), 0
+    if stripped.startswith('TTT') and not stripped.endswith('TTT'):
+        return HOUSE_TITLE, stripped[3:].strip(), 0
+    if stripped.startswith(_BULLET_CHAR):
+        name = stripped.lstrip(_BULLET_CHAR)
+        return BULLET, name.strip(), len(stripped) - len(name)
+    return None
+
+
+def find_content_start(buf: Buffer) -> int:
+    """Offset where the book content begins, skipping the format comments"""
+    markers = ('TTTCommon lore', '@@Lore of the Fundament')
+    if not isinstance(buf, str):
+        markers = tuple(m.encode('utf-8') for m in markers)
+    for marker in markers:
+        pos = buf.find(marker)
+        if pos != -1:
+            return pos
+    return 0
+
+
+def tokenize(buf: Buffer, start: int = 0, end: Optional[int] = None,
+             first_line: int = 1) -> Iterator[SectionEvent]:
+    """Yield section events for buf[start:end] in a single forward pass"""
+    if end is None:
+        end = len(buf)
+    is_text = isinstance(buf, str)
+    newline = '\n' if is_text else b'\n'
+    # Bytes that can begin a marker line once leading whitespace is removed
+    lead = ('@', 'x', '#', 'T', _BULLET_CHAR) if is_text else (64, 120, 35, 84, 0xE2)
+
+    pos = start
+    line_no = first_line
+    while pos < end:
+        nl = buf.find(newline, pos, end)
+        line_end = end if nl == -1 else nl
+
+        # Cheap first-character test before slicing the line out
+        first = pos
+        while first < line_end and buf[first] in (' ', '\t', '\r', 32, 9, 13):
+            first += 1
+        if first < line_end and buf[first] in lead:
+            stripped = as_text(buf[first:line_end]).strip()
+            marker = classify_line(stripped)
+            if marker:
+                kind, name, level = marker
+                yield SectionEvent(kind, name, level, pos, line_end, line_no)
+
+        pos = line_end + 1
+        line_no += 1
+
+
+class Section(NamedTuple):
+    """A section header with its body range and the bullets inside it"""
+    header: SectionEvent
+    body_start: int
+    body_end: int
+    bullets: list  # [(SectionEvent, description_start, description_end)]
+
+
+def group_sections(events, limit: int, kinds=(LORE,),
+                   closers=SECTION_KINDS) -> Iterator[Section]:
+    """Group a flat event stream into sections of the requested kinds.
+
+    A section runs until the next event whose kind is in closers (or that
+    opens another section), so each event is visited exactly once. Bullets
+    outside a requested section are dropped.
+    """
+    current = None
+    bullets = []
+
+    def close(end):
+        described = []
+        for i, bullet in enumerate(bullets):
+            stop = bullets[i + 1].start if i + 1 < len(bullets) else end
+            described.append((bullet, min(bullet.end + 1, stop), stop))
+        return Section(current, min(current.end + 1, end), end, described)
+
+    for event in events:
+        if event.kind == BULLET:
+            if current is not None:
+                bullets.append(event)
+            continue
+        opens = event.kind in kinds
+        if not opens and event.kind not in closers:
+            continue
+        if current is not None:
+            yield close(event.start)
+        current = event if opens else None
+        bullets = []
+
+    if current is not None:
+        yield close(limit)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Build-time serialized prefix tries for GameDataService search.
+
+GameDataService.buildTrieIndices() used to insert every name, searchTerms
+and keywords entry into a Trie (module/services/trie.js) on every client.
+The same tries are built here once, with the same rules (terms lowercased
+and trimmed, one edge per character, items deduplicated per node, children
+and items in insertion order), and flattened into arrays that
+Trie.fromSerialized() searches directly:
+
+    {"sources": [["merits_flaws.json", "merits"], ["merits_flaws.json", "flaws"]],
+     "labels": " ac...",                  # edge character into each node (root: ' ')
+     "ends": [812, 40, 9, ...],           # node i's subtree is nodes [i, ends[i])
+     "postingStarts": [0, 0, 1, ...],     # node i's items: postings[postingStarts[i]:postingStarts[i + 1]]
+     "postings": [3, 17, ...],            # item ordinals
+     "itemSources": [0, 1, ...], "itemIndexes": [4, 0, ...]}
+
+Nodes are stored in preorder, so the first child of node i is i + 1 and
+the next sibling of a child c is ends[c]; collecting a prefix's results is
+one pass over a contiguous range, in the order the runtime Trie returns.
+Items are referenced by (source, position in that source's array) rather
+than by id, because ids are not guaranteed to be present or unique. Labels
+are one string when every edge is a single UTF-16 unit (so labels[i] is the
+same character in Python and JavaScript) and a list of strings otherwise.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+TRIE_VERSION = 1
+# Searchable fields of an item, in the order buildTrieIndices() inserts them
+TERM_FIELDS = ('searchTerms', 'keywords')
+# Trie name -> (file, array key) sources per game line, mirroring buildTrieIndices()
+TRIE_INDICES: Dict[str, Dict[str, Tuple[Tuple[str, str], ...]]] = {
+    'M20': {
+        'm20MeritsFlaws': (('merits_flaws.json', 'merits'), ('merits_flaws.json', 'flaws')),
+        'charms': (('charms.json', 'charms'),),
+        'sAdvantages': (('s-advantages.json', 'advantages'),),
+    },
+    'D20': {
+        'd20MeritsFlaws': (('merits_flaws.json', 'merits'), ('merits_flaws.json', 'flaws')),
+    },
+}
+
+
+def _terms(item: Dict) -> List[str]:
+    terms = [item.get('name')]
+    for field in TERM_FIELDS:
+        values = item.get(field)
+        if isinstance(values, list):
+            terms.extend(values)
+    # Trie.insert() ignores anything that is not a non-empty string
+    return [term for term in terms if isinstance(term, str) and term]
+
+
+def build_trie(sources: Sequence[Tuple[Tuple[str, str], list]]) -> Dict:
+    """Serialized trie over [((file, key), items), ...], indexing items with a name"""
+    root = ({}, [])   # (children by character, item ordinals)
+    item_sources: List[int] = []
+    item_indexes: List[int] = []
+
+    for source, (_, items) in enumerate(sources):
+        for position, item in enumerate(items):
+            if not isinstance(item, dict) or not item.get('name'):
+                continue
+            ordinal = len(item_sources)
+            item_sources.append(source)
+            item_indexes.append(position)
+            for term in _terms(item):
+                node = root
+                for char in term.lower().strip():
+                    node = node[0].setdefault(char, ({}, []))
+                if ordinal not in node[1]:
+                    node[1].append(ordinal)
+
+    labels: List[str] = []
+    ends: List[int] = []
+    posting_starts: List[int] = []
+    postings: List[int] = []
+    # Iterative preorder walk; ends are filled in once a subtree is done
+    stack = [('', root, False)]
+    open_nodes: List[int] = []
+    while stack:
+        label, node, closing = stack.pop()
+        if closing:
+            ends[open_nodes.pop()] = len(labels)
+            continue
+        index = len(labels)
+        labels.append(label)
+        ends.append(0)
+        posting_starts.append(len(postings))
+        postings.extend(node[1])
+        open_nodes.append(index)
+        stack.append((label, node, True))
+        for char, child in reversed(list(node[0].items())):
+            stack.append((char, child, False))
+    posting_starts.append(len(postings))
+
+    labels[0] = ' '
+    if all(len(label) == 1 and ord(label) < 0x10000 for label in labels):
+        labels = ''.join(labels)
+    return {
+        'version': TRIE_VERSION,
+        'sources': [list(key) for key, _ in sources],
+        'labels': labels,
+        'ends': ends,
+        'postingStarts': posting_starts,
+        'postings': postings,
+        'itemSources': item_sources,
+        'itemIndexes': item_indexes,
+    }
+
+
+def build_line_tries(line: str, files: Dict[str, object]) -> Dict[str, Dict]:
+    """{trie name: serialized trie} for a game line, from {file name: parsed JSON}
+
+    A trie is only built when every file it reads is present, so a client
+    never adopts an index over data it did not get from the same bundle.
+    """
+    tries = {}
+    for name, keys in TRIE_INDICES.get(line, {}).items():
+        if not all(file in files for file, _ in keys):
+            continue
+        sources = []
+        for file, key in keys:
+            data = files[file]
+            items = data.get(key) if isinstance(data, dict) else None
+            sources.append(((file, key), items if isinstance(items, list) else []))
+        tries[name] = build_trie(sources)
+    return tries
+
+
+def search_trie(trie: Dict, prefix: str) -> List[Tuple[int, int]]:
+    """(source, position) of every item under prefix, in runtime Trie.search() order"""
+    if not isinstance(prefix, str) or not prefix:
+        return []
+    labels, ends = trie['labels'], trie['ends']
+    node = 0
+    for char in prefix.lower().strip():
+        child = node + 1
+        while child < ends[node] and labels[child] != char:
+            child = ends[child]
+        if child >= ends[node]:
+            return []
+        node = child
+    starts, postings = trie['postingStarts'], trie['postings']
+    seen = {}
+    for ordinal in postings[starts[node]:starts[ends[node]]]:
+        seen.setdefault(ordinal, None)
+    return [(trie['itemSources'][ordinal], trie['itemIndexes'][ordinal]) for ordinal in seen]
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Schema, uniqueness and cross-reference checks for the datasource JSON.
+
+Each file is described declaratively (collections, fields, unique keys
+and references) and validated in one pass over its entries. Unique keys
+and reference targets go into hashed namespaces, and references are only
+resolved once every file has been read, so the whole run is linear in the
+size of the data.
+
+Issues are (severity, file, path, message) tuples; path points into the
+JSON, e.g. apocalypticForms[3].associatedLore.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
+
+ERROR = 'error'
+WARNING = 'warning'
+
+
+class Issue(NamedTuple):
+    severity: str
+    file: str
+    path: str
+    message: str
+
+
+class Field(NamedTuple):
+    """One key of an entry"""
+    name: str
+    types: Tuple[type, ...]
+    required: bool = False
+    items: Any = None  # element type, or a tuple of Fields for lists of objects
+
+
+class Ref(NamedTuple):
+    """A field whose value(s) must exist in another namespace"""
+    field: str
+    namespace: str
+    allow: frozenset = frozenset()  # values accepted without a target
+    severity: str = ERROR
+
+
+class Collection(NamedTuple):
+    """A list (or name -> object map) of entries under one top-level key"""
+    key: str
+    fields: Tuple[Field, ...]
+    unique: Tuple[Tuple[str, str], ...] = ()   # (field, namespace) pairs that must be unique
+    provides: Tuple[Tuple[str, str], ...] = ()  # (field, namespace) pairs others may reference
+    refs: Tuple[Ref, ...] = ()
+    required: bool = True
+    mapping: bool = False  # entries are the values of an object keyed by name
+    strings: bool = False  # entries are plain strings, provided to provides[0][1]
+
+
+class FileSpec(NamedTuple):
+    path: str
+    collections: Tuple[Collection, ...]
+
+
+_NAMED = (
+    Field('id', (str,)),
+    Field('name', (str,), required=True),
+    Field('searchTerms', (list,), items=str),
+    Field('keywords', (list,), items=str),
+)
+
+# Houses referenced from lores/forms that are not entries in houses.json
+COMMON_HOUSES = frozenset({'common', 'common lore'})
+
+DATASOURCE_SPECS = (
+    FileSpec('M20/merits_flaws.json', (
+        Collection('merits', _NAMED, unique=(('id', 'm20-traits'),)),
+        Collection('flaws', _NAMED, unique=(('id', 'm20-traits'),)),
+    )),
+    FileSpec('D20/merits_flaws.json', (
+        Collection('merits', _NAMED, unique=(('id', 'd20-traits'),)),
+        Collection('flaws', _NAMED, unique=(('id', 'd20-traits'),)),
+    )),
+    FileSpec('M20/backgrounds.json', (
+        Collection('backgrounds', _NAMED + (Field('costLevels', (list,)), Field('availableTo', (list,), items=str)),
+                   unique=(('id', 'm20-backgrounds'), ('name', 'm20-background-names'))),
+    )),
+    FileSpec('D20/backgrounds.json', (
+        Collection('backgrounds', _NAMED + (Field('costLevels', (list,)), Field('availableTo', (list,), items=str)),
+                   unique=(('id', 'd20-backgrounds'), ('name', 'd20-background-names'))),
+    )),
+    FileSpec('D20/houses.json', (
+        Collection('houses', _NAMED + (Field('initialTorment', (int,)),),
+                   unique=(('name', 'd20-houses'),)),
+    )),
+    FileSpec('D20/lore.json', (
+        Collection('lorePaths', (
+            Field('id', (str,), required=True),
+            Field('name', (str,), required=True),
+            Field('house', (str,)),
+            Field('evocations', (list,), required=True, items=(
+                Field('level', (int,), required=True),
+                Field('name', (str,), required=True),
+            )),
+        ), unique=(('id', 'd20-lore'),),
+            refs=(Ref('house', 'd20-houses', COMMON_HOUSES),)),
+        Collection('blackKnowledge', (
+            Field('id', (str,), required=True),
+            Field('name', (str,), required=True),
+            Field('evocations', (list,), items=(
+                Field('level', (int,), required=True),
+                Field('name', (str,), required=True),
+            )),
+        ), unique=(('id', 'd20-lore'),), required=False),
+    )),
+    FileSpec('D20/apocalyptic_forms.json', (
+        Collection('apocalypticForms', (
+            Field('id', (str,), required=True),
+            Field('name', (str,), required=True),
+            Field('house', (str,), required=True),
+            Field('associatedLore', (str,)),
+            Field('powers', (list,), required=True, items=(
+                Field('name', (str,), required=True),
+                Field('isHighTorment', (bool,), required=True),
+            )),
+        ), unique=(('id', 'd20-forms'),),
+            refs=(Ref('house', 'd20-houses', COMMON_HOUSES), Ref('associatedLore', 'd20-lore'))),
+    )),
+    FileSpec('M20/spheres.json', (
+        Collection('spheres', _NAMED + (Field('levels', (list,)),),
+                   unique=(('id', 'm20-spheres'),), provides=(('name', 'm20-spheres'),)),
+    )),
+    FileSpec('M20/charms.json', (
+        Collection('charms', _NAMED, unique=(('id', 'm20-charms'),)),
+    )),
+    FileSpec('M20/s-advantages.json', (
+        Collection('advantages', _NAMED, unique=(('id', 'm20-advantages'),)),
+    )),
+    FileSpec('M20/affinities.json', tuple(
+        Collection(category, (Field('affinitySpheres', (list,), required=True, items=str),),
+                   refs=(Ref('affinitySpheres', 'm20-spheres', frozenset({'any'})),),
+                   required=False, mapping=True)
+        for category in ('traditions', 'conventions', 'disparateCrafts')
+    )),
+    FileSpec('status-effects.json', (
+        Collection('categories', (), provides=(('', 'status-categories'),), required=False, strings=True),
+        Collection('tags', (), provides=(('', 'status-tags'),), required=False, strings=True),
+        Collection('effects', (
+            Field('id', (str,), required=True),
+            Field('name', (str,), required=True),
+            Field('category', (str,)),
+            Field('tags', (list,), items=str),
+        ), unique=(('id', 'status-effects'),),
+            refs=(Ref('category', 'status-categories', severity=WARNING),
+                  Ref('tags', 'status-tags', severity=WARNING))),
+    )),
+)
+
+_TYPE_NAMES = {str: 'string', int: 'integer', bool: 'boolean', list: 'array', dict: 'object', float: 'number'}
+
+
+def _type_ok(value, types) -> bool:
+    # bool is an int subclass; only accept it where a boolean is expected
+    if isinstance(value, bool) and bool not in types:
+        return False
+    return isinstance(value, types)
+
+
+def _key(value):
+    return value.lower() if isinstance(value, str) else value
+
+
+class Validator:
+    """Accumulates namespaces and issues across all files"""
+
+    def __init__(self):
+        self.issues: List[Issue] = []
+        # namespace -> {normalized value: (file, path)}
+        self.namespaces: Dict[str, Dict[Any, Tuple[str, str]]] = {}
+        # (file, path, value, Ref) resolved after every file is read
+        self.pending_refs: List[Tuple[str, str, Any, Ref]] = []
+        self.entries = 0
+
+    def report(self, severity: str, file: str, path: str, message: str):
+        self.issues.append(Issue(severity, file, path, message))
+
+    def _check_fields(self, file: str, path: str, entry, fields: Iterable[Field]):
+        if not isinstance(entry, dict):
+            self.report(ERROR, file, path, "entry is not an object")
+            return False
+        for field in fields:
+            value = entry.get(field.name)
+            if value is None:
+                if field.required:
+                    self.report(ERROR, file, f"{path}.{field.name}", "required field is missing")
+                continue
+            if not _type_ok(value, field.types):
+                expected = ' or '.join(_TYPE_NAMES.get(t, t.__name__) for t in field.types)
+                self.report(ERROR, file, f"{path}.{field.name}", f"expected {expected}")
+                continue
+            if field.items is None:
+                continue
+            for i, item in enumerate(value):
+                item_path = f"{path}.{field.name}[{i}]"
+                if isinstance(field.items, tuple):
+                    self._check_fields(file, item_path, item, field.items)
+                elif not _type_ok(item, (field.items,)):
+                    self.report(ERROR, file, item_path, f"expected {_TYPE_NAMES.get(field.items, field.items.__name__)}")
+        return True
+
+    def _register(self, namespace: str, value, file: str, path: str, unique: bool):
+        seen = self.namespaces.setdefault(namespace, {})
+        key = _key(value)
+        if key in seen:
+            if unique:
+                first_file, first_path = seen[key]
+                where = first_path if first_file == file else f"{first_file}:{first_path}"
+                self.report(ERROR, file, path, f"duplicate '{value}' (first at {where})")
+            return
+        seen[key] = (file, path)
+
+    def _entries(self, file: str, data: Dict, collection: Collection):
+        """(path, entry) pairs for a collection, reporting a wrong container"""
+        value = data.get(collection.key)
+        if value is None:
+            if collection.required:
+                self.report(ERROR, file, collection.key, "required collection is missing")
+            return []
+        if collection.mapping:
+            if not isinstance(value, dict):
+                self.report(ERROR, file, collection.key, "expected object")
+                return []
+            return [(f"{collection.key}.{name}", entry) for name, entry in value.items()]
+        if not isinstance(value, list):
+            self.report(ERROR, file, collection.key, "expected array")
+            return []
+        return [(f"{collection.key}[{i}]", entry) for i, entry in enumerate(value)]
+
+    def validate_data(self, file: str, data, spec: FileSpec):
+        """Validate one decoded file in a single pass over its entries"""
+        if not isinstance(data, dict):
+            self.report(ERROR, file, '', "top level is not an object")
+            return
+        for collection in spec.collections:
+            for path, entry in self._entries(file, data, collection):
+                self.entries += 1
+                if collection.strings:
+                    if not isinstance(entry, str):
+                        self.report(ERROR, file, path, "expected string")
+                        continue
+                    for _, namespace in collection.provides:
+                        self._register(namespace, entry, file, path, unique=False)
+                    continue
+                if not self._check_fields(file, path, entry, collection.fields):
+                    continue
+                for field, namespace in collection.unique:
+                    value = entry.get(field)
+                    if isinstance(value, str) and value:
+                        self._register(namespace, value, file, f"{path}.{field}", unique=True)
+                for field, namespace in collection.provides:
+                    value = entry.get(field)
+                    if isinstance(value, str) and value:
+                        self._register(namespace, value, file, f"{path}.{field}", unique=False)
+                for ref in collection.refs:
+                    value = entry.get(ref.field)
+                    values = value if isinstance(value, list) else [value]
+                    for item in values:
+                        if isinstance(item, str) and item:
+                            self.pending_refs.append((file, f"{path}.{ref.field}", item, ref))
+
+    def resolve_references(self):
+        """Check every collected reference against its namespace"""
+        for file, path, value, ref in self.pending_refs:
+            targets = self.namespaces.get(ref.namespace)
+            if targets is None:
+                # The target file is absent; that is reported on its own
+                continue
+            key = _key(value)
+            if key in targets or key in ref.allow:
+                continue
+            self.report(ref.severity, file, path, f"'{value}' does not match any {ref.namespace} entry")
+        self.pending_refs = []
+
+
+def validate_datasource(root: str = 'datasource',
+                        specs: Iterable[FileSpec] = DATASOURCE_SPECS,
+                        loader=None) -> Validator:
+    """Validate every file in specs under root; loader(path) defaults to json.load"""
+    validator = Validator()
+    for spec in specs:
+        path = os.path.join(root, spec.path)
+        if not os.path.exists(path):
+            validator.report(WARNING, spec.path, '', "file not found")
+            continue
+        try:
+            if loader is not None:
+                data = loader(path)
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+        except (ValueError, OSError) as e:
+            validator.report(ERROR, spec.path, '', f"could not be read: {e}")
+            continue
+        validator.validate_data(spec.path, data, spec)
+    validator.resolve_references()
+    return validator
+
+
+def find_duplicates(values: Iterable) -> List:
+    """Values that occur more than once, in first-seen order"""
+    seen = set()
+    duplicates = {}
+    for value in values:
+        if value in seen:
+            duplicates[value] = None
+        else:
+            seen.add(value)
+    return list(duplicates)
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+from build_module_bundle import Module, transform
+
+def bundled(source):
+    return transform(Module('module/x.js', source), {}, keep_debug=False, keep_comments=False, back_edges=set())
+
+# An emptied debug guard after `else` keeps its block, so the else still has a body
+source = 'if (a) { x(); } else if (this.debugMode) { console.log("hi"); }\nfoo();'
+code = bundled(source)
+print(f"{source!r} → {code!r}")
+assert code == 'if (a) { x(); } else if (this.debugMode) {}\nfoo();', code
+
+# ...and so does one followed by `else`, with every line kept for the source map
+source = 'if (this._debugMode) {\n    console.log("a");\n} else {\n    warn();\n}'
+code = bundled(source)
+print(f"{source!r} → {code!r}")
+assert code == 'if (this._debugMode) {}\n\n else {\n    warn();\n}', code
+
+# Only calls inside an `if (...debug...)` guard are stripped; others may have side effects
+source = 'console.log(counter++);\nif (game.settings.get("wodsystem", "debugMode")) console.debug(state);'
+code = bundled(source)
+print(f"{source!r} → {code!r}")
+assert code == 'console.log(counter++);\nif (game.settings.get("wodsystem", "debugMode")) void 0;', code
+
+source = 'if (this._debugMode && tile) {\n    console.log(tile);\n    tile.refresh();\n}'
+code = bundled(source)
+print(f"{source!r} → {code!r}")
+assert code == 'if (this._debugMode && tile) {\n    void 0;\n    tile.refresh();\n}', code
+
+module = Module('module/x.js', 'console.log(1);\nif (this._debugMode) { console.log(2); }')
+assert len(module.debug_calls) == 1, module.debug_calls
+
+print("✅ All bundle transform tests passed")
@@ -11,7 +11,8 @@ import { WodDicePool } from "./module/dice/wod-dice-pool.js";
 import { WodRollDialog } from "./module/apps/wod-roll-dialog.js";
 import { initializeApprovalSocket } from "./module/apps/wod-st-approval-dialog.js";
 import { registerHandlebarsHelpers } from "./scripts/utilities.js";
-import { WodCharacterWizard } from "./module/character-creation/wod-character-wizard.js";
+import { loadTemplateBundle } from "./module/helpers/template-bundle.js";
+import { loadLazyModule, loadedLazyModule, markStartup, openCharacterWizard, preloadLazyModulesWhenIdle, startupReport } from "./module/helpers/lazy-modules.js";
 
 // Import Services
 import { GameDataService } from "./module/services/game-data-service.js"; // Game data by source (M20, D20)
@@ -29,8 +30,13 @@ import { loginVideoSplash } from "./module/ui/login-video-splash.js"; // Login v
 // Import Item Classes
 import { WodItem, WodWeapon, WodArmor, WodGear } from "./module/items/wod-item.js";
 
+// Startup timing (game.wodsystem.startupReport()); imports above have been evaluated here
+markStartup("modules");
+
 
 Hooks.once("init", async function() {
+    markStartup("init");
+    
     // Register system settings FIRST (before any services that might use them)
     game.settings.register('wodsystem', 'debugMode', {
         name: 'Debug Mode',
@@ -41,6 +47,15 @@ Hooks.once("init", async function() {
         type: Boolean
     });
     
+    game.settings.register('wodsystem', 'preloadLazyModules', {
+        name: 'Preload Dialogs When Idle',
+        hint: 'Load the character wizard and trigger, visual rules and effect library dialogs in the background after startup instead of on first use',
+        scope: 'client',
+        config: true,
+        default: false,
+        type: Boolean
+    });
+    
     // Login Video Splash settings
     game.settings.register('wodsystem', 'loginVideoEnabled', {
         name: 'Enable Login Video',
@@ -152,9 +167,26 @@ Hooks.once("init", async function() {
     });
     
         
-    // Make Character Wizard available globally
+    // The Character Wizard and the larger dialogs are imported on first use
     game.wodsystem = game.wodsystem || {};
-    game.wodsystem.WodCharacterWizard = WodCharacterWizard;
+    game.wodsystem.loadLazyModule = loadLazyModule;
+    game.wodsystem.openCharacterWizard = openCharacterWizard;
+    game.wodsystem.startupReport = startupReport;
+    
+    // Kept for macros and modules written when the wizard was imported at init:
+    // the class is there once loaded; before that, warn and start loading it
+    Object.defineProperty(game.wodsystem, 'WodCharacterWizard', {
+        configurable: true,
+        enumerable: true,
+        get() {
+            const module = loadedLazyModule('characterWizard');
+            if (!module) {
+                console.warn('WoD | game.wodsystem.WodCharacterWizard is loaded on first use; use await game.wodsystem.openCharacterWizard(actor)');
+                loadLazyModule('characterWizard').catch(error => console.warn('WoD | Could not load Character Creation Wizard:', error));
+            }
+            return module?.WodCharacterWizard;
+        }
+    });
     
     // Now do async operations (these might fail but sheets are already registered)
     // Initialize game data service (organizes data by source: M20, D20)
@@ -196,82 +228,16 @@ Hooks.once("init", async function() {
     // Register Handlebars helpers
     registerHandlebarsHelpers();
 
-    // Preload Handlebars partials
-    await loadTemplates([
-        "systems/wodsystem/templates/actor/partials/header.html",
-        "systems/wodsystem/templates/actor/partials/technocrat-header.html",
-        "systems/wodsystem/templates/actor/partials/mage-header.html",
-        "systems/wodsystem/templates/actor/partials/spirit-header.html",
-        "systems/wodsystem/templates/actor/partials/demon-header.html",
-        "systems/wodsystem/templates/actor/partials/earthbound-header.html",
-        "systems/wodsystem/templates/actor/partials/demon-advantages.html",
-        "systems/wodsystem/templates/actor/partials/earthbound-advantages.html",
-        "systems/wodsystem/templates/actor/partials/demon-lore.html",
-        "systems/wodsystem/templates/actor/partials/demon-apocalyptic-form.html",
-        "systems/wodsystem/templates/actor/partials/earthbound-apocalyptic-form.html",
-        "systems/wodsystem/templates/actor/partials/technocrat-advantages.html",
-        "systems/wodsystem/templates/actor/partials/mage-advantages.html",
-        "systems/wodsystem/templates/actor/partials/technocrat-spheres.html",
-        "systems/wodsystem/templates/actor/partials/mage-spheres.html",
-        "systems/wodsystem/templates/actor/partials/spirit-spheres.html",
-        "systems/wodsystem/templates/actor/partials/technocrat-backgrounds-expanded.html",
-        "systems/wodsystem/templates/actor/partials/mage-backgrounds-expanded.html",
-        "systems/wodsystem/templates/actor/partials/demon-backgrounds-expanded.html",
-        "systems/wodsystem/templates/actor/partials/earthbound-backgrounds-expanded.html",
-        "systems/wodsystem/templates/actor/partials/spirit-attributes.html",
-        "systems/wodsystem/templates/actor/partials/spirit-essence.html",
-        "systems/wodsystem/templates/actor/partials/spirit-charms.html",
-        "systems/wodsystem/templates/actor/partials/spirit-advantages.html",
-        "systems/wodsystem/templates/actor/partials/backgrounds/bg-sanctum.html",
-        "systems/wodsystem/templates/actor/partials/backgrounds/bg-construct.html",
-        "systems/wodsystem/templates/actor/partials/backgrounds/bg-mentor.html",
-        "systems/wodsystem/templates/actor/partials/backgrounds/bg-allies.html",
-        "systems/wodsystem/templates/actor/partials/backgrounds/bg-contacts.html",
-        "systems/wodsystem/templates/actor/partials/backgrounds/bg-resources.html",
-        "systems/wodsystem/templates/actor/partials/backgrounds/bg-familiar.html",
-        "systems/wodsystem/templates/actor/partials/backgrounds/bg-device.html",
-        "systems/wodsystem/templates/actor/partials/backgrounds/bg-enhancement.html",
-        "systems/wodsystem/templates/actor/partials/backgrounds/bg-custom.html",
-        "systems/wodsystem/templates/actor/partials/attributes.html",
-        "systems/wodsystem/templates/actor/partials/abilities.html",
-        "systems/wodsystem/templates/actor/partials/health.html",
-        "systems/wodsystem/templates/actor/partials/biography.html",
-        "systems/wodsystem/templates/actor/partials/secondary-abilities.html",
-        "systems/wodsystem/templates/actor/partials/virtues-humanity.html",
-        "systems/wodsystem/templates/actor/partials/merits-flaws.html",
-        "systems/wodsystem/templates/actor/partials/advantages-common.html",
-        "systems/wodsystem/templates/actor/partials/mortal-numina.html",
-        "systems/wodsystem/templates/actor/partials/experience.html",
-        "systems/wodsystem/templates/actor/partials/equipment.html",
-        "systems/wodsystem/templates/actor/partials/earthbound-equipment.html",
-        "systems/wodsystem/templates/actor/partials/active-effects.html",
-        "systems/wodsystem/templates/apps/roll-dialog.html",
-        "systems/wodsystem/templates/apps/effect-manager.html",
-        "systems/wodsystem/templates/apps/st-approval-dialog.html",
-        "systems/wodsystem/templates/apps/equipment-effects-dialog.html",
-        "systems/wodsystem/templates/apps/wod-triggers-tab.html",
-        "systems/wodsystem/templates/apps/wod-trigger-config-dialog.html",
-        "systems/wodsystem/templates/apps/minimap-config-dialog.html",
-        "systems/wodsystem/templates/apps/minimap-marker-dialog.html",
-        "systems/wodsystem/templates/apps/status-effect-library.html",
-        "systems/wodsystem/templates/apps/effect-assignment.html",
-        "systems/wodsystem/templates/apps/wod-visual-rules-dialog.html",
-        "systems/wodsystem/templates/dice/roll-card.html",
-        "systems/wodsystem/templates/chat/reference-card.html",
-        "systems/wodsystem/templates/chat/background-reference-card.html",
-        // Character Creation Wizard
-        "systems/wodsystem/templates/apps/wizard-steps/step-concept.html",
-        "systems/wodsystem/templates/apps/wizard-steps/step-attributes.html",
-        "systems/wodsystem/templates/apps/wizard-steps/step-abilities.html",
-        "systems/wodsystem/templates/apps/wizard-steps/step-advantages.html",
-        "systems/wodsystem/templates/apps/wizard-steps/step-merits-flaws.html",
-        "systems/wodsystem/templates/apps/wizard-steps/step-freebies.html",
-        "systems/wodsystem/templates/apps/wizard-steps/step-review.html"
-    ]);
+    // Register every template from the single-file bundle (scripts/build_template_bundle.py);
+    // falls back to preloading the partials one by one when no bundle was built
+    await loadTemplateBundle();
     
+    markStartup("init complete");
     });
 
 Hooks.on("setup", () => {
+    markStartup("setup");
+    
     // Ensure Item types are registered (Foundry loads these from template.json)
     // But we explicitly register them here to ensure they're available
     if (!CONFIG.Item.types) {
@@ -337,6 +303,15 @@ Hooks.on("updateActor", async (actor, updateData, options, userId) => {
 });
 
 Hooks.on("ready", async () => {
+    markStartup("ready");
+    if (game.settings.get('wodsystem', 'preloadLazyModules')) {
+        preloadLazyModulesWhenIdle();
+    }
+    if (game.settings.get('wodsystem', 'debugMode')) {
+        const { marks } = startupReport();
+        console.log("WoD | Startup timing (ms):", marks.map(mark => `${mark.label} ${mark.at} (+${mark.delta})`).join(", "));
+    }
+    
     // Initialize socket for effect approval system
     initializeApprovalSocket();
     